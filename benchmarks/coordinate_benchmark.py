@@ -0,0 +1,63 @@
+"""Micro-benchmark of Coordinate heavy operations
+
+Run from the repository root with:
+    python -m benchmarks.coordinate_benchmark
+"""
+
+import math
+import timeit
+
+import numpy as np
+
+from iris_calculator.blade import Blade, BladeState
+from iris_calculator.geometry import Coordinate, Rectangle
+
+_REPEATS = 7
+
+
+def _time(statement, number):
+    # Best of several repeats, in microseconds per call
+    return min(timeit.repeat(statement, number=number, repeat=_REPEATS)) / number * 1e6
+
+
+def _polar_rotate(coordinate, angle):
+    # Rotation through a polar round trip, as Coordinate.rotate was once implemented, kept as a reference
+    magnitude = coordinate.magnitude()
+    angle = coordinate.angle() + angle
+    coordinate.x = magnitude * math.cos(angle)
+    coordinate.y = magnitude * math.sin(angle)
+    return coordinate
+
+
+def run():
+    blade = Blade(0.3, 45, 50.5, 60, 1)
+    guess = np.array((60.0, 2.4, 1.0))
+    coordinate = Coordinate(1.5, -2.5)
+    offset = Coordinate(0.1, 0.2)
+    cos, sin = math.cos(0.1), math.sin(0.1)
+    state = BladeState(Coordinate(0, 50), Coordinate(30, 20), Coordinate(10, -40), 4.7)
+
+    results = {
+        "Blade.closed_loop_equations": _time(
+            lambda: blade.closed_loop_equations(guess, 4.7), 20000
+        ),
+        "polar rotation (reference)": _time(
+            lambda: _polar_rotate(coordinate, 0.1), 200000
+        ),
+        "Coordinate.rotate": _time(lambda: coordinate.rotate(0.1), 200000),
+        "Coordinate.rotate_cos_sin": _time(
+            lambda: coordinate.rotate_cos_sin(cos, sin), 200000
+        ),
+        "Coordinate.rotated_copy": _time(lambda: coordinate.rotated_copy(0.1), 200000),
+        "Coordinate.__add__": _time(lambda: coordinate + offset, 200000),
+        "BladeState.rotated_copy": _time(lambda: state.rotated_copy(0.1), 50000),
+        "Rectangle": _time(lambda: Rectangle(coordinate, 2, 3, 0.4, "black"), 20000),
+    }
+
+    for name, microseconds in results.items():
+        print(f"{name:<30} {microseconds:10.3f} us")
+    return results
+
+
+if __name__ == "__main__":
+    run()
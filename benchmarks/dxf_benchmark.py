@@ -0,0 +1,60 @@
+"""Benchmark of exporting the DXF archive of an iris
+
+Run from the repository root with:
+    python -m benchmarks.dxf_benchmark
+"""
+
+import io
+import timeit
+import zipfile
+
+from iris_calculator.dxf import DXF
+from iris_calculator.iris import Iris
+
+_REPEATS = 5
+_NUMBER = 10
+
+
+def _time(statement):
+    # Best of several repeats, in milliseconds per call
+    return (
+        min(timeit.repeat(statement, number=_NUMBER, repeat=_REPEATS)) / _NUMBER * 1e3
+    )
+
+
+def _export_with_setup(iris):
+    # Export with every document set up with standard styles, as DXF was once created, kept as a reference
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for part in (iris.blades[0], iris.base_plate, iris.actuator_ring):
+            dxf = DXF(setup=True)
+            for shape in part.shapes:
+                if not shape.construction_line:
+                    dxf.add_shape(shape)
+            archive.writestr(part._DXF_FILE_NAME, dxf.to_bytes())
+    return buffer.getvalue()
+
+
+def run():
+    iris = Iris(10, 5, 25, 5, 1.5, 0.5)
+    # Builds the shapes of each part, so that both exports write the same geometry
+    iris.get_dxfs_as_zip()
+
+    results = {
+        "setup=True (reference)": (
+            _time(lambda: _export_with_setup(iris)),
+            len(_export_with_setup(iris)),
+        ),
+        "Iris.get_dxfs_as_zip": (
+            _time(iris.get_dxfs_as_zip),
+            len(iris.get_dxfs_as_zip()),
+        ),
+    }
+
+    for name, (milliseconds, size) in results.items():
+        print(f"{name:<30} {milliseconds:10.3f} ms {size / 1e3:10.1f} kB")
+    return results
+
+
+if __name__ == "__main__":
+    run()
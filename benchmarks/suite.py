@@ -0,0 +1,324 @@
+"""Benchmark suite of iris calculation stages over a fixed corpus of designs
+
+Reports time, solver function evaluations and peak memory for each stage, and compares them against the stored
+baseline in benchmarks/baseline.json. Evaluations and peak memory depend only on the code, so any stage whose
+evaluations or memory regress beyond their tolerance is reported and the suite exits with a non-zero status. Times
+depend on the machine and its load, so time regressions are only reported as warnings.
+
+Run from the repository root with:
+    python -m benchmarks.suite
+    python -m benchmarks.suite --update-baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import astuple
+
+from iris_calculator.blade import Blade
+from iris_calculator.iris import Iris
+from iris_calculator.kinematics import get_canonical_table
+from iris_calculator.parameters import IrisParameters
+
+_BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+_REPEATS = 3
+# Regressions are relative increases beyond these fractions of the baseline
+_TIME_TOLERANCE = 0.5
+_NFEV_TOLERANCE = 0.05
+_MEMORY_TOLERANCE = 0.25
+# Measurements that fail the suite when they regress, the others only warn
+_GATED = ("nfev", "peak_memory")
+
+_BLADE_COUNTS = [3, 6, 12, 24]
+# (aperture_inner_radius, aperture_outer_radius, blade_width, peg_radius, peg_clearance) from tiny through large
+_APERTURES = {
+    "tiny": (0.2, 1, 0.3, 0.1, 0.05),
+    "medium": (5, 25, 5, 1.5, 0.5),
+    "large": (50, 250, 20, 5, 1),
+}
+CORPUS = [
+    IrisParameters(blade_count, *aperture)
+    for blade_count in _BLADE_COUNTS
+    for aperture in _APERTURES.values()
+]
+
+
+class _EvaluationCounter:
+    # Counts evaluations of the closed-loop equations, each row of a batch evaluation counting once
+    def __init__(self):
+        self.count = 0
+
+    @contextlib.contextmanager
+    def counting(self):
+        scalar, batch = Blade.closed_loop_equations, Blade.closed_loop_equations_batch
+
+        def counted_scalar(blade, guess, theta_a):
+            self.count += 1
+            return scalar(blade, guess, theta_a)
+
+        def counted_batch(blade, guesses, theta_as):
+            self.count += len(guesses)
+            return batch(blade, guesses, theta_as)
+
+        Blade.closed_loop_equations = counted_scalar
+        Blade.closed_loop_equations_batch = counted_batch
+        try:
+            yield self
+        finally:
+            Blade.closed_loop_equations = scalar
+            Blade.closed_loop_equations_batch = batch
+
+
+def _measure(run, setup=None, repeats=_REPEATS):
+    """Measures a stage
+
+    Args:
+        run (callable): run(state) running the stage once, given the return value of setup
+        setup (callable, optional): Prepares each run outside of the measurement. Defaults to None.
+        repeats (int, optional): Number of timed runs, of which the fastest is kept. Defaults to _REPEATS.
+
+    Returns:
+        dict: Seconds taken, closed-loop equation evaluations and peak traced memory in bytes of a single run
+    """
+    setup = setup or (lambda: None)
+    seconds = float("inf")
+    for _ in range(repeats):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    # Counted and traced in a separate run, so that neither slows the timed runs
+    state = setup()
+    tracemalloc.start()
+    try:
+        with _EvaluationCounter().counting() as counter:
+            run(state)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": seconds, "nfev": counter.count, "peak_memory": peak}
+
+
+def _get_nested_blade(parameters):
+    # Blade of an iris solved without the canonical kinematics table, as the validation mode of Iris does
+    iris = Iris(*astuple(parameters), use_canonical_kinematics=False)
+    return iris.blades[0]
+
+
+def _get_model_stages():
+    blade = Blade(0, 1, Iris._BLADE_RADIUS_RATIO, Iris._BC_RATIO, 0)
+    stages = {
+        "get_canonical_table": [
+            _measure(
+                lambda _: get_canonical_table(Iris._BLADE_RADIUS_RATIO, Iris._BC_RATIO),
+                setup=get_canonical_table.cache_clear,
+            )
+        ],
+        "Blade.calc_Bx_range": [_measure(lambda _: blade.calc_Bx_range())],
+    }
+    # Leaves the canonical table built for the stages that follow
+    get_canonical_table(Iris._BLADE_RADIUS_RATIO, Iris._BC_RATIO)
+
+    for parameters in CORPUS:
+        arguments = astuple(parameters)
+        stages.setdefault("Iris.__init__", []).append(
+            _measure(lambda _: Iris(*arguments))
+        )
+        stages.setdefault("Iris.__init__ (solved)", []).append(
+            _measure(lambda _: Iris(*arguments, use_canonical_kinematics=False))
+        )
+        nested_blade = _get_nested_blade(parameters)
+        stages.setdefault("Blade.calc_blade_states", []).append(
+            _measure(
+                lambda _: nested_blade.calc_blade_states(
+                    *nested_blade.theta_a_range, solver=Blade.SOLVER_BATCH
+                )
+            )
+        )
+        iris = Iris(*arguments)
+        stages.setdefault("Iris.save_dxfs_as_zip", []).append(
+            _measure(lambda _: iris.save_dxfs_as_zip(io.BytesIO()))
+        )
+    return stages
+
+
+def _setup_django():
+    # Configures logging from the settings, so it is run before the logging of the suite is set
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "iris_calculator_server.settings")
+    django.setup()
+
+
+@contextlib.contextmanager
+def _quiet_logging():
+    # Logs written while building irises and serving requests are kept out of the report
+    logger = logging.getLogger("iris_calculator")
+    level = logger.level
+    logger.setLevel(logging.ERROR)
+    try:
+        yield
+    finally:
+        logger.setLevel(level)
+
+
+def _get_view_stages():
+    # Views are measured cold, with caches and the design store emptied, through the compute pool, with Django set up
+    import asyncio
+
+    from django.core.cache import caches
+    from django.db import connection
+    from django.test import RequestFactory
+
+    from iris_calculator.models import IrisDesign
+    from iris_calculator.pool import compute_pool
+    from iris_calculator.views import DXFView, IrisView
+
+    old_database_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+    factory = RequestFactory()
+
+    def clear():
+        caches["iris_results"].clear()
+        caches["dxf_archives"].clear()
+        IrisDesign.objects.all().delete()
+
+    stages = {}
+    try:
+        # Starts the pool's workers and builds their kinematics tables before measuring
+        asyncio.run(
+            compute_pool.run(
+                get_canonical_table, Iris._BLADE_RADIUS_RATIO, Iris._BC_RATIO
+            )
+        )
+        for parameters in CORPUS:
+            query = {
+                "bladeCount": parameters.blade_count,
+                "minDiameter": parameters.aperture_inner_radius * 2,
+                "maxDiameter": parameters.aperture_outer_radius * 2,
+                "bladeWidth": parameters.blade_width,
+                "pinRadius": parameters.peg_radius,
+                "pinClearance": parameters.peg_clearance,
+            }
+            for name, view, path in [
+                ("IrisView", IrisView.as_view(), "/iris/calc"),
+                ("DXFView", DXFView.as_view(), "/iris/dxf"),
+            ]:
+                stages.setdefault(name, []).append(
+                    _measure(
+                        lambda _: asyncio.run(view(factory.get(path, query))),
+                        setup=clear,
+                    )
+                )
+    finally:
+        compute_pool.shutdown()
+        connection.creation.destroy_test_db(old_database_name, verbosity=0)
+    return stages
+
+
+def run(include_views=True):
+    """Runs every stage over the corpus
+
+    Returns:
+        dict: Totals of time and evaluations, and the largest peak memory, over the corpus for each stage
+    """
+    if include_views:
+        _setup_django()
+    with _quiet_logging():
+        stages = _get_model_stages()
+        if include_views:
+            stages.update(_get_view_stages())
+
+    return {
+        name: {
+            "seconds": sum(m["seconds"] for m in measurements),
+            "nfev": sum(m["nfev"] for m in measurements),
+            "peak_memory": max(m["peak_memory"] for m in measurements),
+        }
+        for name, measurements in stages.items()
+    }
+
+
+def compare(results, baseline):
+    """Finds stages that regressed against the baseline
+
+    Args:
+        results (dict): Stage results from run
+        baseline (dict): Stage results of the baseline
+
+    Returns:
+        (list, list): Descriptions of each regression of a measurement in _GATED, and of each other regression
+    """
+    regressions, warnings = [], []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        for key, tolerance in [
+            ("seconds", _TIME_TOLERANCE),
+            ("nfev", _NFEV_TOLERANCE),
+            ("peak_memory", _MEMORY_TOLERANCE),
+        ]:
+            limit = baseline[name][key] * (1 + tolerance)
+            if result[key] > limit:
+                (regressions if key in _GATED else warnings).append(
+                    f"{name}: {key} of {result[key]:.6g} exceeds {limit:.6g}, the baseline of "
+                    f"{baseline[name][key]:.6g} plus {tolerance:.0%}"
+                )
+    return regressions, warnings
+
+
+def report(results, baseline):
+    print(
+        f"{'stage':<28} {'time (ms)':>10} {'baseline':>10} {'nfev':>10} {'peak (KiB)':>11}"
+    )
+    for name, result in results.items():
+        baseline_ms = (
+            f"{baseline[name]['seconds'] * 1e3:10.2f}" if name in baseline else " " * 10
+        )
+        print(
+            f"{name:<28} {result['seconds'] * 1e3:10.2f} {baseline_ms} {result['nfev']:10d} "
+            f"{result['peak_memory'] / 1024:11.1f}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Store results as the baseline"
+    )
+    parser.add_argument(
+        "--skip-views", action="store_true", help="Leave out the Django views"
+    )
+    parser.add_argument("--baseline", default=_BASELINE_PATH)
+    args = parser.parse_args(argv)
+
+    results = run(include_views=not args.skip_views)
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    report(results, baseline)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=4)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions, warnings = compare(results, baseline)
+    for warning in warnings:
+        print(f"WARNING {warning}", file=sys.stderr)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
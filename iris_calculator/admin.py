@@ -1,3 +1,18 @@
 from django.contrib import admin
 
-# Register your models here.
+from iris_calculator.models import IrisDesign
+
+
+@admin.register(IrisDesign)
+class IrisDesignAdmin(admin.ModelAdmin):
+    list_display = [
+        "blade_count",
+        "aperture_inner_radius",
+        "aperture_outer_radius",
+        "blade_width",
+        "peg_radius",
+        "peg_clearance",
+        "updated",
+    ]
+    list_filter = ["blade_count"]
+    exclude = ["dxf_archive"]
@@ -1,16 +1,27 @@
 import functools
 import math
+from collections import OrderedDict
 from dataclasses import dataclass
 
-import matplotlib.patches as patch
-import matplotlib.pyplot as plt
 import numpy as np
-from scipy.optimize import Bounds, least_squares, minimize
 
 import iris_calculator.geometry as geometry
-from iris_calculator.dxf import DXF
 from iris_calculator.geometry import Arc, Circle, Coordinate
+from iris_calculator.kinematics import KinematicsTable
 from iris_calculator.part import Part
+from iris_calculator.solver import batch_least_squares
+from iris_calculator.telemetry import SolverTelemetry
+from iris_calculator.timing import stage
+
+
+@dataclass
+class SweepStats:
+    nfev: np.ndarray
+    njev: np.ndarray
+
+    @property
+    def total_nfev(self):
+        return int(np.sum(self.nfev))
 
 
 @dataclass
@@ -21,21 +32,154 @@ class BladeState:
     theta_a: float
 
     def rotated_copy(self, angle):
+        cos, sin = math.cos(angle), math.sin(angle)
         return BladeState(
-            *[coord.rotated_copy(angle) for coord in [self.A, self.B, self.C]],
+            *[
+                coord.rotated_copy_cos_sin(cos, sin)
+                for coord in [self.A, self.B, self.C]
+            ],
             theta_a=self.theta_a,
         )
 
 
+class BladeTrajectory:
+    """Blade states along a sweep of theta_a, stored as contiguous arrays
+
+    Indexing and iteration give BladeState objects, which are only created on access.
+    """
+
+    def __init__(self, points, theta_as):
+        """
+        Args:
+            points (array): Positions of points A, B, and C for each theta_a, of shape (N, 3, 2)
+            theta_as (array): In radians, of shape (N,)
+        """
+        self.points = np.asarray(points, dtype=float)
+        self.theta_as = np.asarray(theta_as, dtype=float)
+
+    @classmethod
+    def from_blade_states(cls, blade_states):
+        return cls(
+            [
+                [(coord.x, coord.y) for coord in (state.A, state.B, state.C)]
+                for state in blade_states
+            ],
+            [state.theta_a for state in blade_states],
+        )
+
+    @property
+    def A(self):
+        return self.points[:, 0]
+
+    @property
+    def B(self):
+        return self.points[:, 1]
+
+    @property
+    def C(self):
+        return self.points[:, 2]
+
+    def __len__(self):
+        return len(self.theta_as)
+
+    def __getitem__(self, index):
+        A, B, C = self.points[index]
+        return BladeState(
+            Coordinate(float(A[0]), float(A[1])),
+            Coordinate(float(B[0]), float(B[1])),
+            Coordinate(float(C[0]), float(C[1])),
+            float(self.theta_as[index]),
+        )
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def rotated(self, angle):
+        """Rotates every blade state about the origin
+
+        Args:
+            angle (float): In radians, anticlockwise
+
+        Returns:
+            BladeTrajectory: Rotated trajectory
+        """
+        return BladeTrajectory(geometry.rotate_batch(self.points, angle), self.theta_as)
+
+    def get_circles(self):
+        """Gets the circle through points A, B, and C for every blade state
+
+        Returns:
+            (array, array): Circle centers of shape (N, 2) and circle radii of shape (N,)
+        """
+        return geometry.get_circle_batch(self.A, self.B, self.C)
+
+
+class BladeTrajectories:
+    """Trajectories of every blade in an iris, rotated from the first blade's trajectory when accessed
+
+    The most recently accessed rotations are cached.
+    """
+
+    _CACHE_SIZE = 4
+
+    def __init__(self, trajectory, blade_count, cache_size=_CACHE_SIZE):
+        """
+        Args:
+            trajectory (BladeTrajectory): Trajectory of the first blade
+            blade_count (int): Number of blades, spaced evenly about the origin
+            cache_size (int, optional): Number of rotated trajectories to keep. Defaults to _CACHE_SIZE.
+        """
+        self.trajectory = trajectory
+        self.blade_count = blade_count
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return self.blade_count
+
+    def __getitem__(self, blade_index):
+        if not -self.blade_count <= blade_index < self.blade_count:
+            raise IndexError("Blade index out of range")
+        blade_index %= self.blade_count
+        if blade_index == 0:
+            return self.trajectory
+
+        if blade_index in self._cache:
+            self._cache.move_to_end(blade_index)
+            return self._cache[blade_index]
+
+        with stage("rotate"):
+            rotated = self.trajectory.rotated(
+                2 * np.pi / self.blade_count * blade_index
+            )
+        if self.cache_size > 0:
+            self._cache[blade_index] = rotated
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return rotated
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
 class Blade(Part):
     _NUM_POINTS = 50
     _COLOUR = "black"
     _BLADE_WIDTH = 10
     _DXF_FILE_NAME = "blade.dxf"
 
+    SOLVER_INDEPENDENT = "independent"
+    SOLVER_BATCH = "batch"
+    SOLVER_CONTINUATION = "continuation"
+    SOLVER_TABLE = "table"
+
     # Domain limits are rounded from values of 243.434 and 296.565
     _DOMAIN_LIMITS = (244.5 * np.pi / 180, 295.2 * np.pi / 180)
     _AC_MAX_CORRECTION = 1.05  # Multiplicative factor to account for BY being slightly greater that 2*pinned_radius
+    # Shared by the scalar and batch solvers so that every solver path agrees
+    _SOLVER_TOLERANCE = 1e-10
+    # Bx is tabulated at this many theta_a values to bracket inverse lookups
+    _LOOKUP_POINTS = 101
 
     def __init__(
         self,
@@ -45,6 +189,7 @@ class Blade(Part):
         BC,
         hole_radius,
         blade_width=None,
+        kinematics=None,
     ):
         """An individual blade of an iris
 
@@ -55,6 +200,8 @@ class Blade(Part):
             BC (float): Length from point B to point C
             blade_width (float, optional): Width of the blade from the internal radius to the outer radius. Defaults to None.
             internal_radius (float, optional): Minimum internal radius of the iris when closed. Defaults to None.
+            kinematics (KinematicsTable, optional): Precomputed kinematics for blades of this shape, used in place of
+                solving the closed-loop equations. Defaults to None.
         """
         if blade_width is None:
             blade_width = self._BLADE_WIDTH
@@ -64,19 +211,43 @@ class Blade(Part):
         self.BC = BC
         self.hole_radius = hole_radius
         self.blade_width = blade_width
+        if kinematics is not None and not kinematics.matches(
+            blade_radius / pinned_radius, BC / pinned_radius
+        ):
+            raise ValueError("Kinematics table does not match blade dimensions")
+        self.kinematics = kinematics
         self.AC_max = self.calc_ac_max()
-        self.theta_a_range, self.Bx_range = self.calc_Bx_range()
+        self.solver_telemetry = SolverTelemetry()
+        self._lookup = kinematics
+        if kinematics is None:
+            # A coarse table of this blade brackets inverse lookups, which are then refined against exact solves
+            with stage("lookup_table"):
+                self._lookup = KinematicsTable.from_blade(
+                    self, self._LOOKUP_POINTS, solve_blade_states=False
+                )
+        with stage("calc_Bx_range"):
+            self.theta_a_range, self.Bx_range = self.calc_Bx_range()
         self.blade_state = None
+        self.sweep_stats = None
         super().__init__(self._COLOUR, self._DXF_FILE_NAME)
 
     def set_theta_a_domain(self, inner_radius, outer_radius):
         """Determines the range of theta_a values that are valid for the blade to rotate through
 
+        Args:
+            inner_radius (float): Aperture inner radius
+            outer_radius (float): Aperture outer radius
+
+        Raises:
+            ValueError: If the aperture is beyond the reach of the blade, leaving no theta_a for it to rotate through
+
         Returns:
             (float, float): Theta_a domain in radians
         """
 
         lower_limit, upper_limit = self.theta_a_range
+        # Bx is negative along the branch, its magnitude being the radius of point B
+        min_reach, max_reach = sorted(abs(Bx) for Bx in self.Bx_range)
 
         a_bx_bound = self.calc_theta_a(inner_radius)
         if a_bx_bound > lower_limit:
@@ -86,6 +257,13 @@ class Blade(Part):
         if a_bx_bound < upper_limit:
             upper_limit = a_bx_bound
 
+        # Radii beyond the Bx branch clamp both ends of the domain to the same table entry
+        if upper_limit <= lower_limit:
+            raise ValueError(
+                f"Aperture radii of {inner_radius:g} to {outer_radius:g} are beyond the reach of the blade, whose "
+                f"point B spans radii of {min_reach:.6g} to {max_reach:.6g}"
+            )
+
         self.theta_a_range = [lower_limit, upper_limit]
         self.Bx_range = [-self.calc_Bx(lower_limit), -self.calc_Bx(upper_limit)]
 
@@ -178,51 +356,237 @@ class Blade(Part):
             -AC * math.cos(theta_a),
             -AC * math.sin(theta_a),
         )
-        center, radius = geometry.get_circle(A, B, C)
-
-        A.rotate(self.rotation_angle)
-        B.rotate(self.rotation_angle)
-        C.rotate(self.rotation_angle)
+        cos, sin = math.cos(self.rotation_angle), math.sin(self.rotation_angle)
+        A.rotate_cos_sin(cos, sin)
+        B.rotate_cos_sin(cos, sin)
+        C.rotate_cos_sin(cos, sin)
 
         return BladeState(A, B, C, theta_a)
 
-    def calc_blade_states(self, start_theta_a, end_theta_a, num_points=_NUM_POINTS):
+    def calc_blade_states(
+        self, start_theta_a, end_theta_a, num_points=_NUM_POINTS, solver=None
+    ):
         """Calculates blade states for a range of theta_a values
 
         Args:
             start_theta_a (float): In radians
             end_theta_a (float): In radians
             num_points (int, optional): Number of points to calculate blade state for. Defaults to NUM_POINTS.
+            solver (str, optional): SOLVER_TABLE interpolates the kinematics table, SOLVER_BATCH solves every theta_a
+                as one vectorised problem, SOLVER_CONTINUATION seeds each solve from its neighbours and
+                SOLVER_INDEPENDENT solves each theta_a from a fixed guess. Defaults to SOLVER_TABLE if the blade has a
+                kinematics table, otherwise SOLVER_BATCH.
 
         Returns:
-            (BladeState): List of blade states over the given range of theta_a values
+            BladeTrajectory: Blade states over the given range of theta_a values
         """
+        if solver is None:
+            solver = self.SOLVER_BATCH if self.kinematics is None else self.SOLVER_TABLE
+
         step_size = (end_theta_a - start_theta_a) / num_points
         theta_as = np.arange(start_theta_a, end_theta_a + step_size, step_size)
-        return [self.calc_blade_state(theta_a) for theta_a in theta_as]
 
-    def calc_closed_loop_equations(self, theta_a):
+        if solver == self.SOLVER_TABLE:
+            solutions = self.kinematics.interpolate(theta_as)
+            solutions[:, 0] *= self.pinned_radius
+            return self._build_blade_states(theta_as, solutions)
+        if solver == self.SOLVER_BATCH:
+            return self.calc_blade_states_batch(theta_as)
+        if solver == self.SOLVER_CONTINUATION:
+            return self.calc_blade_states_continuation(theta_as)
+        if solver == self.SOLVER_INDEPENDENT:
+            return BladeTrajectory.from_blade_states(
+                [self.calc_blade_state(theta_a) for theta_a in theta_as]
+            )
+        raise ValueError(f"Unknown solver: {solver}")
+
+    def calc_blade_states_batch(self, theta_as):
+        """Calculates blade states for many theta_a values with a single vectorised solve
+
+        Args:
+            theta_as (array): In radians
+
+        Returns:
+            BladeTrajectory: Blade states for each theta_a value
+        """
+        theta_as = np.asarray(theta_as, dtype=float)
+        result = self.solve_closed_loop_equations_batch(theta_as)
+        self.sweep_stats = SweepStats(result.nfev, result.njev)
+        return self._build_blade_states(theta_as, result.x)
+
+    def calc_blade_states_continuation(self, theta_as):
+        """Calculates blade states along a sweep of theta_a values, seeding each solve with a linear extrapolation of
+        the preceding solutions
+
+        Args:
+            theta_as (array): In radians, ordered along the sweep
+
+        Returns:
+            BladeTrajectory: Blade states for each theta_a value
+        """
+        theta_as = np.asarray(theta_as, dtype=float)
+        lower, upper = self.get_closed_loop_bounds()
+        solutions = np.empty((len(theta_as), 3))
+        nfev = np.empty(len(theta_as), dtype=int)
+        njev = np.empty(len(theta_as), dtype=int)
+
+        for i, theta_a in enumerate(theta_as):
+            if i == 0:
+                guess = None
+            elif i == 1:
+                guess = solutions[0]
+            else:
+                guess = solutions[i - 1] + (solutions[i - 1] - solutions[i - 2]) * (
+                    theta_a - theta_as[i - 1]
+                ) / (theta_as[i - 1] - theta_as[i - 2])
+                guess = np.clip(guess, lower, upper)
+
+            result = self.solve_closed_loop_equations(theta_a, guess)
+            solutions[i] = result.x
+            nfev[i] = result.nfev
+            njev[i] = result.njev
+
+        self.sweep_stats = SweepStats(nfev, njev)
+        return self._build_blade_states(theta_as, solutions)
+
+    def _build_blade_states(self, theta_as, solutions):
+        AB, theta_b, _ = np.asarray(solutions).T
+        AC = self.get_AC_batch(AB, theta_b)
+        A_y = self.pinned_radius + self.get_L_batch(AC, theta_as)
+        points = np.empty((len(theta_as), 3, 2))
+        points[:, 0, 0] = 0
+        points[:, 0, 1] = A_y
+        points[:, 1, 0] = -AB * np.cos(theta_b)
+        points[:, 1, 1] = A_y - AB * np.sin(theta_b)
+        points[:, 2, 0] = AC * np.cos(theta_as)
+        points[:, 2, 1] = A_y + AC * np.sin(theta_as)
+
+        return BladeTrajectory(points, theta_as).rotated(self.rotation_angle)
+
+    def calc_closed_loop_equations(self, theta_a, guess=None):
         """Calculates values of AB, theta_b, and theta_c given a theta_a value
 
         Args:
             theta_a (float): In radians
+            guess ((AB, theta_b, theta_c), optional): Initial guess. Defaults to a fixed guess based on BC.
 
         Returns:
             (AB, theta_b, theta_c): Thetas measured in radians
         """
+        return self.solve_closed_loop_equations(theta_a, guess).x
+
+    def solve_closed_loop_equations(self, theta_a, guess=None, bounds=None):
+        """Solves the closed-loop equations for a theta_a value
 
-        return least_squares(
-            functools.partial(self.closed_loop_equations, theta_a=theta_a),
-            (self.BC, np.pi * 3 / 4, np.pi / 4),
-            bounds=(
-                (self.pinned_radius, np.pi / 2, 0),
-                (
-                    self.get_AB(self.AC_max, self._DOMAIN_LIMITS[1]),
-                    np.pi,
-                    np.pi / 2,
-                ),
+        Args:
+            theta_a (float): In radians
+            guess ((AB, theta_b, theta_c), optional): Initial guess. Defaults to a fixed guess based on BC.
+            bounds ((array, array), optional): Bounds on AB, theta_b, and theta_c. Defaults to get_closed_loop_bounds.
+
+        Returns:
+            OptimizeResult: Result of the solve, including the number of function evaluations
+        """
+        # Deferred so that blades built from a kinematics table never import scipy.optimize
+        from scipy.optimize import least_squares
+
+        if guess is None:
+            guess = self.get_initial_guess()
+        if bounds is None:
+            bounds = self.get_closed_loop_bounds()
+        variable_scale, equation_scale = self._get_solve_scales()
+
+        result = least_squares(
+            lambda guess: np.array(
+                self.closed_loop_equations(guess * variable_scale, theta_a)
+            )
+            / equation_scale,
+            np.asarray(guess) / variable_scale,
+            jac=lambda guess: self.closed_loop_jacobian(guess * variable_scale, theta_a)
+            * variable_scale
+            / equation_scale[:, None],
+            bounds=(bounds[0] / variable_scale, bounds[1] / variable_scale),
+            ftol=self._SOLVER_TOLERANCE,
+            xtol=self._SOLVER_TOLERANCE,
+            gtol=self._SOLVER_TOLERANCE,
+        )
+        result.x *= variable_scale
+        self.solver_telemetry.record(
+            "least_squares", result.nfev, result.status, result.cost, result.success
+        )
+        return result
+
+    def _get_solve_scales(self):
+        # Solves are carried out for a blade with a pinned radius of one. Where no exact solution exists this keeps
+        # the balance between the length and angle equations, and so the solution, independent of the size of the
+        # blade, and it keeps solver tolerances and damping independent of size.
+        return (
+            np.array((self.pinned_radius, 1, 1)),
+            np.array((self.pinned_radius, self.pinned_radius, 1)),
+        )
+
+    def get_initial_guess(self):
+        """Gets the fixed initial guess of (AB, theta_b, theta_c) used when no better guess is available"""
+        return np.array((self.BC, np.pi * 3 / 4, np.pi / 4))
+
+    def get_closed_loop_bounds(self):
+        """Gets bounds on AB, theta_b, and theta_c used when solving the closed-loop equations
+
+        Returns:
+            ((float, float, float), (float, float, float)): Lower and upper bounds
+        """
+        return (
+            np.array((self.pinned_radius, np.pi / 2, 0)),
+            np.array(
+                (self.get_AB(self.AC_max, self._DOMAIN_LIMITS[1]), np.pi, np.pi / 2)
             ),
-        ).x
+        )
+
+    def calc_closed_loop_equations_batch(self, theta_as):
+        """Calculates values of AB, theta_b, and theta_c for many theta_a values as one vectorised problem
+
+        Args:
+            theta_as (array): In radians
+
+        Returns:
+            array: Rows of (AB, theta_b, theta_c) for each theta_a, thetas measured in radians
+        """
+        return self.solve_closed_loop_equations_batch(theta_as).x
+
+    def solve_closed_loop_equations_batch(self, theta_as, bounds=None):
+        """Solves the closed-loop equations for many theta_a values as one vectorised problem
+
+        Args:
+            theta_as (array): In radians
+            bounds ((array, array), optional): Bounds on AB, theta_b, and theta_c. Defaults to get_closed_loop_bounds.
+
+        Returns:
+            BatchResult: Result of the solve, including per theta_a function evaluation counts
+        """
+        if bounds is None:
+            bounds = self.get_closed_loop_bounds()
+
+        variable_scale, equation_scale = self._get_solve_scales()
+
+        result = batch_least_squares(
+            lambda guesses, theta_as: self.closed_loop_equations_batch(
+                guesses * variable_scale, theta_as
+            )
+            / equation_scale,
+            self.get_initial_guess() / variable_scale,
+            bounds=(bounds[0] / variable_scale, bounds[1] / variable_scale),
+            args=(np.atleast_1d(theta_as),),
+            jac=lambda guesses, theta_as: self.closed_loop_jacobian_batch(
+                guesses * variable_scale, theta_as
+            )
+            * variable_scale
+            / equation_scale[:, None],
+            ftol=self._SOLVER_TOLERANCE,
+            xtol=self._SOLVER_TOLERANCE,
+            gtol=self._SOLVER_TOLERANCE,
+        )
+        result.x *= variable_scale
+        self.solver_telemetry.record_batch("batch_least_squares", result)
+        return result
 
     def get_L(self, AC, theta_a):
         if (AC * math.cos(theta_a)) ** 2 > self.pinned_radius**2:
@@ -234,14 +598,83 @@ class Blade(Part):
         )
 
     def get_AC(self, AB, theta_b):
-        A = Coordinate(0, 0)
-        B = Coordinate(-AB * math.cos(theta_b), -AB * math.sin(theta_b))
-        center = geometry.get_circle_center(A, B, self.blade_radius, True)
         if self.BC / 2 / self.blade_radius > 1:
             raise ValueError("BC/blade radius values invalid")
         alpha = 2 * math.asin(self.BC / 2 / self.blade_radius)
-        C = geometry.get_chord_coord(B, center, alpha, self.blade_radius)
-        return (C - A).magnitude()
+        k = 1 - math.cos(alpha)
+        s = math.sin(alpha)
+        r = self.blade_radius
+
+        # The construction of get_AC_batch written out for a single value with B on the negative x axis, as AC does
+        # not depend on theta_b. This sits in the innermost loop of the scalar solver.
+        d = math.sqrt(abs(r**2 - (AB / 2) ** 2))
+        m = math.sqrt((AB / 2) ** 2 + d**2)
+        C_x = -AB + r * (k * AB / 2 - s * d) / m
+        C_y = -r * (k * d + s * AB / 2) / m
+        return math.hypot(C_x, C_y)
+
+    def get_L_batch(self, AC, theta_a):
+        """Vectorised equivalent of get_L"""
+        cos_theta_a = np.cos(theta_a)
+        with np.errstate(divide="ignore"):
+            AC = np.where(
+                (AC * cos_theta_a) ** 2 > self.pinned_radius**2,
+                np.sqrt(self.pinned_radius**2 / cos_theta_a**2) * 0.99,
+                AC,
+            )
+        return (
+            -self.pinned_radius
+            - np.sqrt(self.pinned_radius**2 - (AC * cos_theta_a) ** 2)
+            - AC * np.sin(theta_a)
+        )
+
+    def get_AC_batch(self, AB, theta_b):
+        """Vectorised equivalent of get_AC"""
+        if self.BC / 2 / self.blade_radius > 1:
+            raise ValueError("BC/blade radius values invalid")
+        alpha = 2 * math.asin(self.BC / 2 / self.blade_radius)
+
+        # Point A sits at the origin
+        B = -np.stack((AB * np.cos(theta_b), AB * np.sin(theta_b)), axis=-1)
+        center = geometry.get_circle_center_batch(
+            np.zeros_like(B), B, self.blade_radius, True
+        )
+        C = geometry.get_chord_coord_batch(B, center, alpha, self.blade_radius)
+        return np.hypot(C[..., 0], C[..., 1])
+
+    def get_AC_derivative(self, AB):
+        """Derivative of AC with respect to AB, accepts floats or arrays
+
+        AC does not depend on theta_b, as changing theta_b rotates the whole construction of get_AC about point A, so
+        the derivative is taken with B on the negative x axis.
+
+        Args:
+            AB (float): Length from point A to point B
+
+        Returns:
+            float: dAC/dAB
+        """
+        alpha = 2 * math.asin(self.BC / 2 / self.blade_radius)
+        k = 1 - math.cos(alpha)
+        s = math.sin(alpha)
+        r = self.blade_radius
+
+        # Distance from the chord midpoint to the circle center and its derivative, see get_circle_center
+        d = np.sqrt(np.abs(r**2 - (AB / 2) ** 2))
+        d_prime = -np.sign(r**2 - (AB / 2) ** 2) * AB / (4 * d)
+        # Length of the radial vector from the circle center to B
+        m = np.sqrt((AB / 2) ** 2 + d**2)
+        m_prime = (AB / 4 + d * d_prime) / m
+
+        C_x = -AB + r * (k * AB / 2 - s * d) / m
+        C_y = -r * (k * d + s * AB / 2) / m
+        C_x_prime = -1 + r * (
+            (k / 2 - s * d_prime) * m - (k * AB / 2 - s * d) * m_prime
+        ) / (m**2)
+        C_y_prime = (
+            -r * ((k * d_prime + s / 2) * m - (k * d + s * AB / 2) * m_prime) / (m**2)
+        )
+        return (C_x * C_x_prime + C_y * C_y_prime) / np.sqrt(C_x**2 + C_y**2)
 
     def get_AB(self, AC, theta_a):
         A = Coordinate(0, 0)
@@ -279,7 +712,9 @@ class Blade(Part):
             eq_3 = math.acos((L**2 + AB**2 - self.BC**2) / (2 * L * AB)) - (
                 -np.pi / 2 + theta_b
             )
-        except:
+        except (ValueError, ZeroDivisionError):
+            # The angle at point B is undefined, so the solver is pushed away from this guess
+            self.solver_telemetry.inf_fallbacks += 1
             return eq_1, eq_2, np.inf
 
         # print(
@@ -288,6 +723,160 @@ class Blade(Part):
 
         return eq_1, eq_2, eq_3
 
+    def closed_loop_equations_batch(self, guesses, theta_as):
+        """Vectorised closed-loop equations, evaluated for many theta_a values at once
+
+        Args:
+            guesses (array): Rows of (AB, theta_b, theta_c)
+            theta_as (array): In radians, one per row of guesses
+
+        Returns:
+            array: Rows of (Equation 1, Equation 2, Equation 3), equation 3 is inf where it is undefined
+        """
+        AB, theta_b, theta_c = np.asarray(guesses, dtype=float).T
+        AC = self.get_AC_batch(AB, theta_b)
+
+        eq_1 = AC * np.cos(theta_as) + self.BC * np.cos(theta_c) + AB * np.cos(theta_b)
+        eq_2 = AC * np.sin(theta_as) + self.BC * np.sin(theta_c) + AB * np.sin(theta_b)
+        L = self.get_L_batch(AC, theta_as)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cos_angle = (L**2 + AB**2 - self.BC**2) / (2 * L * AB)
+            eq_3 = np.where(
+                np.abs(cos_angle) <= 1,
+                np.arccos(np.clip(cos_angle, -1, 1)) - (-np.pi / 2 + theta_b),
+                np.inf,
+            )
+        self.solver_telemetry.inf_fallbacks += int(np.count_nonzero(np.isinf(eq_3)))
+
+        return np.column_stack((eq_1, eq_2, eq_3))
+
+    def closed_loop_jacobian(self, guess, theta_a):
+        """Analytic Jacobian of closed_loop_equations
+
+        Args:
+            guess (AB, theta_b, theta_c): Values to evaluate the Jacobian at
+            theta_a (float): In radians
+
+        Returns:
+            array: 3x3 matrix of the derivative of each equation with respect to AB, theta_b, and theta_c
+        """
+        AB, theta_b, theta_c = guess
+        AC = self.get_AC(AB, theta_b)
+        AC_prime = float(self.get_AC_derivative(AB))
+
+        if (AC * math.cos(theta_a)) ** 2 > self.pinned_radius**2:
+            dL_dAC = 0
+        else:
+            dL_dAC = AC * math.cos(theta_a) ** 2 / math.sqrt(
+                self.pinned_radius**2 - (AC * math.cos(theta_a)) ** 2
+            ) - math.sin(theta_a)
+
+        L = self.get_L(AC, theta_a)
+        try:
+            cos_angle = (L**2 + AB**2 - self.BC**2) / (2 * L * AB)
+            dq_dL = 1 / (2 * AB) - (AB**2 - self.BC**2) / (2 * L**2 * AB)
+            dq_dAB = -L / (2 * AB**2) + (1 + self.BC**2 / AB**2) / (2 * L)
+        except ZeroDivisionError:
+            cos_angle = np.inf
+
+        if abs(cos_angle) <= 1:
+            d_acos = -1 / math.sqrt(max(1 - cos_angle**2, np.finfo(float).eps))
+            eq_3_AB = d_acos * (dq_dAB + dq_dL * dL_dAC * AC_prime)
+        else:
+            # Equation 3 is undefined outside of the acos domain
+            eq_3_AB = 0
+
+        return np.array(
+            [
+                [
+                    AC_prime * math.cos(theta_a) + math.cos(theta_b),
+                    -AB * math.sin(theta_b),
+                    -self.BC * math.sin(theta_c),
+                ],
+                [
+                    AC_prime * math.sin(theta_a) + math.sin(theta_b),
+                    AB * math.cos(theta_b),
+                    self.BC * math.cos(theta_c),
+                ],
+                [eq_3_AB, -1, 0],
+            ]
+        )
+
+    def closed_loop_jacobian_batch(self, guesses, theta_as):
+        """Vectorised analytic Jacobian of closed_loop_equations_batch
+
+        Args:
+            guesses (array): Rows of (AB, theta_b, theta_c)
+            theta_as (array): In radians, one per row of guesses
+
+        Returns:
+            array: Stack of 3x3 Jacobians, one per row of guesses
+        """
+        return self._closed_loop_partials(guesses, theta_as)[0]
+
+    def closed_loop_theta_a_derivative_batch(self, guesses, theta_as):
+        """Vectorised derivative of closed_loop_equations_batch with respect to theta_a
+
+        Args:
+            guesses (array): Rows of (AB, theta_b, theta_c)
+            theta_as (array): In radians, one per row of guesses
+
+        Returns:
+            array: Rows of the derivative of each equation with respect to theta_a
+        """
+        return self._closed_loop_partials(guesses, theta_as)[1]
+
+    def _closed_loop_partials(self, guesses, theta_as):
+        AB, theta_b, theta_c = np.asarray(guesses, dtype=float).T
+        theta_as = np.asarray(theta_as, dtype=float)
+        AC = self.get_AC_batch(AB, theta_b)
+        AC_prime = self.get_AC_derivative(AB)
+
+        jac = np.zeros((len(AB), 3, 3))
+        d_theta_a = np.zeros((len(AB), 3))
+
+        jac[:, 0, 0] = AC_prime * np.cos(theta_as) + np.cos(theta_b)
+        jac[:, 0, 1] = -AB * np.sin(theta_b)
+        jac[:, 0, 2] = -self.BC * np.sin(theta_c)
+        d_theta_a[:, 0] = -AC * np.sin(theta_as)
+
+        jac[:, 1, 0] = AC_prime * np.sin(theta_as) + np.sin(theta_b)
+        jac[:, 1, 1] = AB * np.cos(theta_b)
+        jac[:, 1, 2] = self.BC * np.cos(theta_c)
+        d_theta_a[:, 1] = AC * np.cos(theta_as)
+
+        # Partial derivatives of L, which is independent of AC once AC is clamped in get_L
+        cos_theta_a = np.cos(theta_as)
+        sin_theta_a = np.sin(theta_as)
+        clamped = (AC * cos_theta_a) ** 2 > self.pinned_radius**2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            root = np.sqrt(self.pinned_radius**2 - (AC * cos_theta_a) ** 2)
+            dL_dAC = np.where(clamped, 0, AC * cos_theta_a**2 / root - sin_theta_a)
+            dL_dtheta_a = np.where(
+                clamped,
+                -0.99
+                * self.pinned_radius
+                * np.sign(cos_theta_a)
+                * (sin_theta_a**2 / cos_theta_a**2 + 1),
+                -(AC**2) * cos_theta_a * sin_theta_a / root - AC * cos_theta_a,
+            )
+
+            L = self.get_L_batch(AC, theta_as)
+            cos_angle = (L**2 + AB**2 - self.BC**2) / (2 * L * AB)
+            dq_dL = 1 / (2 * AB) - (AB**2 - self.BC**2) / (2 * L**2 * AB)
+            dq_dAB = -L / (2 * AB**2) + (1 + self.BC**2 / AB**2) / (2 * L)
+            d_acos = -1 / np.sqrt(np.maximum(1 - cos_angle**2, np.finfo(float).eps))
+
+        # Equation 3 is undefined outside of the acos domain, its derivatives are zeroed there
+        defined = np.abs(cos_angle) <= 1
+        jac[:, 2, 0] = np.where(
+            defined, d_acos * (dq_dAB + dq_dL * dL_dAC * AC_prime), 0
+        )
+        jac[:, 2, 1] = -1
+        d_theta_a[:, 2] = np.where(defined, d_acos * dq_dL * dL_dtheta_a, 0)
+
+        return jac, d_theta_a
+
     def calc_ac_max(self):
         return (
             math.sqrt(self.pinned_radius**2 + (2 * self.pinned_radius) ** 2)
@@ -301,25 +890,40 @@ class Blade(Part):
         Returns:
             float: X position of point B in an unrotated state
         """
+        if self.kinematics is not None:
+            return self.kinematics.calc_Bx(theta_a) * self.pinned_radius
+
+        AB, theta_b, _ = self._solve_Bx(theta_a)
+        return AB * math.cos(theta_b)
+
+    def _solve_Bx(self, theta_a):
+        theta_a = float(np.squeeze(theta_a))
+        # The lookup table gives a close starting point
+        guess = self._lookup.interpolate_Bx_solutions(theta_a)[0]
+        guess[0] *= self.pinned_radius
+
         # TODO: DETERMINE AB UPPER RANGE
-        res = least_squares(
-            functools.partial(self.closed_loop_equations, theta_a=theta_a),
-            (self.BC, np.pi * 3 / 4, np.pi / 4),
-            bounds=(
-                (0, np.pi / 2, 0),
-                (self.get_AB(self.AC_max, self._DOMAIN_LIMITS[1]), np.pi, np.pi / 2),
-            ),
-        ).x
-        return res[0] * math.cos(res[1])
+        return self.solve_closed_loop_equations(theta_a, guess, self.get_Bx_bounds()).x
+
+    def get_Bx_bounds(self):
+        """Gets bounds on AB, theta_b, and theta_c used when solving for the x position of point B"""
+        lower, upper = self.get_closed_loop_bounds()
+        lower[0] = 0
+        return lower, upper
 
     def calc_theta_a(self, Bx):
-        return least_squares(
-            functools.partial(
-                lambda theta_a, Bx: abs(abs(self.calc_Bx(theta_a)) - Bx), Bx=Bx
-            ),
-            4.7,
-            bounds=(Bounds(self._DOMAIN_LIMITS[0], self._DOMAIN_LIMITS[1])),
-        ).x[0]
+        """Calculates the theta_a value at which the magnitude of Bx takes a value
+
+        Args:
+            Bx (float): Magnitude of the x position of point B
+        Returns:
+            float: theta_a in radians, clamped to the range over which Bx is monotonic
+        """
+        return self._lookup.calc_theta_a(
+            Bx / self.pinned_radius,
+            self._get_lookup_refinement(),
+            self.solver_telemetry,
+        )
 
     def calc_Bx_range(self):
         """Calculates the range of x values that point B can take
@@ -327,18 +931,16 @@ class Blade(Part):
         Returns:
             ((float, float), (float, float)): ((min_theta_a, max_theta_a), (min_Bx, max_Bx)) theta_a is measured in rad
         """
-        min_theta_a = minimize(
-            lambda theta_a: -self.calc_Bx(theta_a),
-            4.0,
-            bounds=(Bounds(self._DOMAIN_LIMITS[0], self._DOMAIN_LIMITS[1])),
-        ).x[0]
-        max_theta_a = minimize(
-            self.calc_Bx,
-            4.0,
-            bounds=(Bounds(self._DOMAIN_LIMITS[0], self._DOMAIN_LIMITS[1])),
-        ).x[0]
-
-        min_Bx = self.calc_Bx(min_theta_a)
-        max_Bx = self.calc_Bx(max_theta_a)
-
-        return (min_theta_a, max_theta_a), (min_Bx, max_Bx)
+        theta_a_range, (min_Bx, max_Bx) = self._lookup.calc_Bx_range(
+            self._get_lookup_refinement(), self.solver_telemetry
+        )
+        return theta_a_range, (
+            min_Bx * self.pinned_radius,
+            max_Bx * self.pinned_radius,
+        )
+
+    def _get_lookup_refinement(self):
+        # Lookups in a shared table are used as they are, lookups in a table of this blade are refined by exact solves
+        if self.kinematics is not None:
+            return None
+        return lambda theta_a: self.calc_Bx(theta_a) / self.pinned_radius
@@ -0,0 +1,140 @@
+import functools
+import hashlib
+import os
+import threading
+from importlib import metadata
+
+from django.conf import settings
+from django.core.cache import caches
+
+from iris_calculator.parameters import RESULTS_VERSION
+
+
+class ResultCache:
+    """Caches computed results against canonical iris parameters
+
+    Storage, size bounds, and expiry are delegated to a cache configured in Django's CACHES setting, so results can
+    be kept per process or shared through a cache server. Hit and miss counts are kept per process.
+    """
+
+    _DEFAULT_ALIAS = "iris_results"
+
+    def __init__(self, prefix, alias=None, alias_setting="IRIS_RESULT_CACHE"):
+        """
+        Args:
+            prefix (str): Prefix for keys, separating kinds of results held in the same cache
+            alias (str, optional): Alias of the cache in the CACHES setting. Defaults to the value of alias_setting,
+                or _DEFAULT_ALIAS.
+            alias_setting (str, optional): Setting naming the cache alias. Defaults to "IRIS_RESULT_CACHE".
+        """
+        self.prefix = prefix
+        self.alias = alias
+        self.alias_setting = alias_setting
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self):
+        alias = self.alias or getattr(settings, self.alias_setting, self._DEFAULT_ALIAS)
+        return caches[alias]
+
+    def get_key(self, parameters, variant=None):
+        # Versioned so that a cache shared across deployments never serves results of an earlier calculation
+        key = f"{self.prefix}:{RESULTS_VERSION}:{parameters.get_hash()}"
+        return key if variant is None else f"{key}:{variant}"
+
+    def get(self, parameters, variant=None):
+        """Gets a cached result
+
+        Args:
+            parameters (IrisParameters): Canonical parameters
+            variant (str, optional): Distinguishes results of the same design, such as an assembly drawn at a given
+                angle. Defaults to None.
+
+        Returns:
+            object: Cached result, None if there is no result for the parameters
+        """
+        result = self.cache.get(self.get_key(parameters, variant))
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def set(self, parameters, result, variant=None):
+        self.cache.set(self.get_key(parameters, variant), result)
+
+    def get_stats(self):
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        requests = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / requests if requests else 0.0,
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+# Modules whose code determines the geometry and DXFs of a design
+_CALCULATION_MODULES = (
+    "actuator_ring",
+    "base_plate",
+    "blade",
+    "dxf",
+    "geometry",
+    "iris",
+    "kinematics",
+    "parameters",
+    "part",
+    "solver",
+    "tabbed_ring",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_calculation_fingerprint():
+    """Fingerprints the code that calculates designs, without importing it
+
+    Returns:
+        str: Hex digest of the source of _CALCULATION_MODULES and the installed ezdxf version
+    """
+    digest = hashlib.sha256()
+    package = os.path.dirname(__file__)
+    for name in _CALCULATION_MODULES:
+        with open(os.path.join(package, name + ".py"), "rb") as file:
+            digest.update(file.read())
+    digest.update(metadata.version("ezdxf").encode())
+    return digest.hexdigest()
+
+
+def get_etag(parameters, variant=None):
+    """Gets an entity tag for a response built from a design, known before the response is built
+
+    Tags identify the design, RESULTS_VERSION and the fingerprint of the calculation rather than the bytes of the
+    response, so that a deployment changing the calculation changes the tags even if RESULTS_VERSION is not bumped.
+    Archives rebuilt from the same design differ in timestamps and handles but not in their drawings, so tags are weak.
+
+    Args:
+        parameters (IrisParameters): Canonical parameters
+        variant (str, optional): Distinguishes responses for the same design, as in ResultCache. Defaults to None.
+
+    Returns:
+        str: Weak, quoted SHA-256 hash of the design, variant, results version and calculation fingerprint
+    """
+    identity = (
+        f"{RESULTS_VERSION}:{get_calculation_fingerprint()}:"
+        f"{parameters.get_hash()}:{variant}"
+    )
+    return f'W/"{hashlib.sha256(identity.encode()).hexdigest()}"'
+
+
+iris_results = ResultCache("iris")
+# Holds zip archives of part DXFs, and assembly DXFs under an assembly variant
+dxf_archives = ResultCache("dxf", alias_setting="IRIS_DXF_CACHE")
@@ -1,20 +1,95 @@
-import ezdxf
-import numpy as np
-from ezdxf import units
-
-from iris_calculator.geometry import Arc, Coordinate
+import io
+import math
 
 
 class DXF:
     _DXF_LOC = "dxf//"
+    # Parts are drawn with the default layer, linetype and text style alone, so the standard linetypes, text styles
+    # and dimension styles are not set up. Setting them up quadruples the time taken to create and write a document.
+    _SETUP = False
+    _COLOUR_INDICES = {
+        "red": 1,
+        "yellow": 2,
+        "green": 3,
+        "cyan": 4,
+        "blue": 5,
+        "purple": 6,
+        "black": 7,
+    }
+
+    def __init__(self, setup=_SETUP) -> None:
+        """
+        Args:
+            setup (bool, optional): Whether to set up standard linetypes, text styles and dimension styles. Defaults
+                to _SETUP.
+        """
+        # ezdxf is only imported once a DXF is written
+        import ezdxf
+        from ezdxf import units
 
-    def __init__(self) -> None:
-        self.doc = ezdxf.new(setup=True)
+        self.doc = ezdxf.new(setup=setup)
         self.doc.units = units.MM
         self.modelspace = self.doc.modelspace()
 
-    def add_shape(self, shape):
-        shape.add_to_dxf(self)
+    def add_shape(self, shape, layer=None, layout=None):
+        """Adds a shape to the DXF
+
+        Args:
+            shape (Shape): Shape to add
+            layer (str, optional): Layer to add the shape to. Defaults to the default layer.
+            layout (ezdxf layout, optional): Layout to add the shape to. Defaults to the modelspace.
+        """
+        shape.add_to_dxf(
+            self.modelspace if layout is None else layout,
+            None if layer is None else {"layer": layer},
+        )
+
+    def add_layer(self, name, colour=None):
+        """
+        Args:
+            name (str): Name of the layer
+            colour (str, optional): Matplotlib colour of the part drawn on the layer, mapped to the nearest AutoCAD
+                colour index. Defaults to None, the default layer colour.
+        """
+        layer = self.doc.layers.add(name)
+        if colour in self._COLOUR_INDICES:
+            layer.color = self._COLOUR_INDICES[colour]
+
+    def add_block(self, name, shapes, layer=None):
+        """Defines a block, which is drawn once however many times it is inserted
+
+        Args:
+            name (str): Name of the block
+            shapes (list): Shapes making up the block, construction lines are left out
+            layer (str, optional): Layer of the shapes within the block. Defaults to the default layer.
+        """
+        block = self.doc.blocks.new(name=name)
+        for shape in shapes:
+            if not shape.construction_line:
+                self.add_shape(shape, layer, block)
+
+    def add_insert(self, name, rotation=0, layer=None):
+        """Places a block in the modelspace
+
+        Args:
+            name (str): Name of the block
+            rotation (float, optional): In radians, anticlockwise about the origin. Defaults to 0.
+            layer (str, optional): Layer of the reference. Defaults to the default layer.
+        """
+        dxfattribs = {"rotation": math.degrees(rotation)}
+        if layer is not None:
+            dxfattribs["layer"] = layer
+        self.modelspace.add_blockref(name, (0, 0), dxfattribs=dxfattribs)
 
     def save(self, file_name):
         self.doc.saveas(self._DXF_LOC + file_name)
+
+    def to_bytes(self):
+        """Writes the DXF to memory
+
+        Returns:
+            bytes: Contents of the DXF file
+        """
+        stream = io.StringIO()
+        self.doc.write(stream)
+        return self.doc.encode(stream.getvalue())
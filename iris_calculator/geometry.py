@@ -2,12 +2,13 @@ import math
 from abc import abstractmethod
 from dataclasses import dataclass
 
-import matplotlib.patches as patch
 import numpy as np
 
 
 @dataclass
 class Coordinate:
+    __slots__ = ("x", "y")
+
     x: float
     y: float
 
@@ -18,24 +19,33 @@ class Coordinate:
         return Coordinate(self.x - other.x, self.y - other.y)
 
     def distance_to(self, other):
-        return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
+        return math.hypot(self.x - other.x, self.y - other.y)
 
     def rotate(self, angle):
-        init_magnitude = self.magnitude()
-        init_angle = self.angle()
-        self.x = init_magnitude * math.cos(init_angle + angle)
-        self.y = init_magnitude * math.sin(init_angle + angle)
+        return self.rotate_cos_sin(math.cos(angle), math.sin(angle))
+
+    def rotate_cos_sin(self, cos, sin):
+        """Rotates the coordinate in place about the origin by an angle given by its cosine and sine, so that many
+        coordinates can be rotated by the same angle without recomputing them
+
+        Args:
+            cos (float): Cosine of the anticlockwise rotation angle
+            sin (float): Sine of the anticlockwise rotation angle
+
+        Returns:
+            Coordinate: The rotated coordinate
+        """
+        self.x, self.y = self.x * cos - self.y * sin, self.x * sin + self.y * cos
         return self
 
     def rotated_copy(self, angle):
-        init_magnitude = self.magnitude()
-        init_angle = self.angle()
-        x = init_magnitude * math.cos(init_angle + angle)
-        y = init_magnitude * math.sin(init_angle + angle)
-        return Coordinate(x, y)
+        return self.rotated_copy_cos_sin(math.cos(angle), math.sin(angle))
+
+    def rotated_copy_cos_sin(self, cos, sin):
+        return Coordinate(self.x * cos - self.y * sin, self.x * sin + self.y * cos)
 
     def magnitude(self):
-        return math.sqrt(self.x**2 + self.y**2)
+        return math.hypot(self.x, self.y)
 
     def angle(self):
         angle = math.atan2(self.y, self.x)
@@ -43,6 +53,14 @@ class Coordinate:
             angle += 2 * np.pi
         return angle
 
+    def to_array(self):
+        return np.array((self.x, self.y))
+
+    @classmethod
+    def from_array(cls, point):
+        x, y = point.tolist()
+        return cls(x, y)
+
     def linterp(self, other, progress):
         """Linearly interpolates between two coordinates
 
@@ -84,7 +102,13 @@ class Shape:
         self.construction_line = contruction_line
 
     @abstractmethod
-    def add_to_dxf(self, doc):
+    def add_to_dxf(self, layout, dxfattribs=None):
+        """Adds the shape to a DXF layout
+
+        Args:
+            layout (ezdxf layout): Modelspace or block to add entities to
+            dxfattribs (dict, optional): DXF attributes of the added entities, such as the layer. Defaults to None.
+        """
         pass
 
     @abstractmethod
@@ -106,10 +130,11 @@ class Line(Shape):
             linestyle="dashed" if self.construction_line else "solid",
         )
 
-    def add_to_dxf(self, doc):
-        doc.modelspace.add_line(
+    def add_to_dxf(self, layout, dxfattribs=None):
+        layout.add_line(
             [self.start_coord.x, self.start_coord.y],
             [self.end_coord.x, self.end_coord.y],
+            dxfattribs=dxfattribs,
         )
 
 
@@ -127,20 +152,25 @@ class Rectangle(Shape):
         super().__init__(colour, contruction_line)
 
     def _gen_coords(self, centre_coord, width, height, theta):
-        c_1 = Coordinate(-width / 2, -height / 2).rotate(theta) + centre_coord
-        c_2 = Coordinate(-width / 2, height / 2).rotate(theta) + centre_coord
-        c_3 = Coordinate(width / 2, height / 2).rotate(theta) + centre_coord
-        c_4 = Coordinate(width / 2, -height / 2).rotate(theta) + centre_coord
+        corners = np.array(
+            (
+                (-width / 2, -height / 2),
+                (-width / 2, height / 2),
+                (width / 2, height / 2),
+                (width / 2, -height / 2),
+            )
+        )
+        corners = rotate_batch(corners, theta) + centre_coord.to_array()
 
-        return [c_1, c_2, c_3, c_4]
+        return [Coordinate.from_array(corner) for corner in corners]
 
     def draw(self, axs):
         for line in self.lines:
             line.draw(axs)
 
-    def add_to_dxf(self, doc):
+    def add_to_dxf(self, layout, dxfattribs=None):
         for line in self.lines:
-            line.add_to_dxf(doc)
+            line.add_to_dxf(layout, dxfattribs)
 
 
 class Arc(Shape):
@@ -166,6 +196,8 @@ class Arc(Shape):
         super().__init__(colour, construction_line)
 
     def draw(self, axs):
+        import matplotlib.patches as patch
+
         axs.add_patch(
             patch.Arc(
                 (self.center.x, self.center.y),
@@ -178,24 +210,26 @@ class Arc(Shape):
             )
         )
 
-    def add_to_dxf(self, doc):
+    def add_to_dxf(self, layout, dxfattribs=None):
         ratio = self.height / self.width
         if ratio < 1:
-            doc.modelspace.add_ellipse(
+            layout.add_ellipse(
                 (self.center.x, self.center.y),
                 (self.height / 2, 0),
                 ratio,
                 self.theta_1 * np.pi / 180,
                 self.theta_2 * np.pi / 180,
+                dxfattribs=dxfattribs,
             )
         else:
             ratio = 1 / ratio
-            doc.modelspace.add_ellipse(
+            layout.add_ellipse(
                 (self.center.x, self.center.y),
                 (self.width / 2, 0),
                 ratio,
                 self.theta_1 * np.pi / 180,
                 self.theta_2 * np.pi / 180,
+                dxfattribs=dxfattribs,
             )
 
 
@@ -218,6 +252,8 @@ class Circle(Shape):
         super().__init__(colour, construction_line)
 
     def draw(self, axs):
+        import matplotlib.patches as patch
+
         axs.add_patch(
             patch.Circle(
                 (self.center.x, self.center.y),
@@ -227,8 +263,10 @@ class Circle(Shape):
             )
         )
 
-    def add_to_dxf(self, doc):
-        doc.modelspace.add_circle((self.center.x, self.center.y), self.radius)
+    def add_to_dxf(self, layout, dxfattribs=None):
+        layout.add_circle(
+            (self.center.x, self.center.y), self.radius, dxfattribs=dxfattribs
+        )
 
 
 def get_circle(a, b, c):
@@ -242,16 +280,40 @@ def get_circle(a, b, c):
     Returns:
         (Coordinate, float): Center of circle and circle radius
     """
+    center, radius = get_circle_batch(a.to_array(), b.to_array(), c.to_array())
+    return Coordinate.from_array(center), float(radius)
+
+
+def get_circle_batch(a, b, c):
+    """Vectorised equivalent of get_circle
+
+    Args:
+        a (array): Points of shape (..., 2) to generate circles from
+        b (array): Points of shape (..., 2) to generate circles from
+        c (array): Points of shape (..., 2) to generate circles from
+
+    Returns:
+        (array, array): Circle centers of shape (..., 2) and circle radii of shape (...)
+    """
+    a, b, c = (
+        np.asarray(a, dtype=float),
+        np.asarray(b, dtype=float),
+        np.asarray(c, dtype=float),
+    )
+    a_x, a_y = a[..., 0], a[..., 1]
+    b_x, b_y = b[..., 0], b[..., 1]
+    c_x, c_y = c[..., 0], c[..., 1]
+
     # Equation of circle is x^2 + y^2 + 2*g*x + 2*f*y + c = 0
-    x_ab = a.x - b.x
-    x_ac = a.x - c.x
-    y_ab = a.y - b.y
-    y_ac = a.y - c.y
+    x_ab = a_x - b_x
+    x_ac = a_x - c_x
+    y_ab = a_y - b_y
+    y_ac = a_y - c_y
 
-    sx_ac = a.x**2 - c.x**2
-    sy_ac = a.y**2 - c.y**2
-    sx_ba = b.x**2 - a.x**2
-    sy_ba = b.y**2 - a.y**2
+    sx_ac = a_x**2 - c_x**2
+    sy_ac = a_y**2 - c_y**2
+    sx_ba = b_x**2 - a_x**2
+    sy_ba = b_y**2 - a_y**2
 
     f = (sx_ac * x_ab + sy_ac * x_ab + sx_ba * x_ac + sy_ba * x_ac) / (
         2 * (-y_ac * x_ab + y_ab * x_ac)
@@ -261,11 +323,11 @@ def get_circle(a, b, c):
         2 * (-x_ac * y_ab + x_ab * y_ac)
     )
 
-    c = -pow(a.x, 2) - pow(a.y, 2) - 2 * g * a.x - 2 * f * a.y
+    c = -(a_x**2) - a_y**2 - 2 * g * a_x - 2 * f * a_y
 
-    r = math.sqrt(g**2 + f**2 - c)
+    r = np.sqrt(g**2 + f**2 - c)
 
-    return (Coordinate(-g, -f), r)
+    return np.stack((-g, -f), axis=-1), r
 
 
 def get_circle_center(a, b, radius, convex_right=True):
@@ -278,24 +340,44 @@ def get_circle_center(a, b, radius, convex_right=True):
         convex_right (bool, optional): Whether the circle through the two points has its convex surface pointing rightwards. Defaults to True.
 
     Returns:
-        _type_: _description_
+        Coordinate: Center of the circle
     """
-    chord_length = a.distance_to(b)
+    return Coordinate.from_array(
+        get_circle_center_batch(a.to_array(), b.to_array(), radius, convex_right)
+    )
+
 
-    if radius > chord_length / 2:
-        # Chord length distance formula
-        d = math.sqrt(radius**2 - (chord_length / 2) ** 2)
-    else:
-        # Chord length distance formula
-        d = math.sqrt((chord_length / 2) ** 2 - radius**2)
+def get_circle_center_batch(a, b, radius, convex_right=True):
+    """Vectorised equivalent of get_circle_center
+
+    Args:
+        a (array): Points of shape (..., 2) coincident on the circles
+        b (array): Points of shape (..., 2) coincident on the circles
+        radius (float or array): Circle radii, broadcastable to shape (...)
+        convex_right (bool, optional): Whether the circle through the two points has its convex surface pointing rightwards. Defaults to True.
+
+    Returns:
+        array: Circle centers of shape (..., 2)
+    """
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    chord = b - a
+    chord_length = np.hypot(chord[..., 0], chord[..., 1])
+
+    # Chord length distance formula
+    d = np.sqrt(np.abs(radius**2 - (chord_length / 2) ** 2))
 
     multiplier = 1 if convex_right else -1
-    mid_chord = a.linterp(b, 0.5)
-    chord_angle = (b - a).angle()
-    return Coordinate(
-        mid_chord.x + d * multiplier * math.cos(chord_angle + np.pi / 2),
-        mid_chord.y + d * multiplier * math.sin(chord_angle + np.pi / 2),
+    # The unit normal to the chord, rotated anticlockwise from its direction. A zero-length chord has a direction of
+    # angle 0, as Coordinate.angle gives, so its normal points along +y.
+    degenerate = chord_length == 0
+    normal = np.divide(
+        np.stack((-chord[..., 1], chord[..., 0]), axis=-1),
+        chord_length[..., None],
+        out=np.zeros(chord.shape),
+        where=~degenerate[..., None],
     )
+    normal[..., 1] = np.where(degenerate, 1.0, normal[..., 1])
+    return (a + b) / 2 + (d * multiplier)[..., None] * normal
 
 
 def get_chord_coord(a, center, theta, radius):
@@ -310,18 +392,81 @@ def get_chord_coord(a, center, theta, radius):
     Returns:
         Coordinate: Coordinates of the other point of the chord
     """
-    alpha = (a - center).angle()
-    x = (
-        a.x
-        - (radius - radius * math.cos(theta)) * math.cos(alpha)
-        - radius * math.sin(theta) * math.sin(alpha)
+    return Coordinate.from_array(
+        get_chord_coord_batch(a.to_array(), center.to_array(), theta, radius)
     )
-    y = (
-        a.y
-        - (radius - radius * math.cos(theta)) * math.sin(alpha)
-        + radius * math.sin(theta) * math.cos(alpha)
+
+
+def get_chord_coord_batch(a, center, theta, radius):
+    """Vectorised equivalent of get_chord_coord
+
+    Args:
+        a (array): Points of shape (..., 2) coincident on the circles, forming part of the chords
+        center (array): Circle centers of shape (..., 2)
+        theta (float or array): Angles subtended by the chords, broadcastable to shape (...)
+        radius (float or array): Circle radii, broadcastable to shape (...)
+
+    Returns:
+        array: The other points of the chords, of shape (..., 2)
+    """
+    a, center = np.asarray(a, dtype=float), np.asarray(center, dtype=float)
+    radial = a - center
+    radial_length = np.hypot(radial[..., 0], radial[..., 1])
+    cos_alpha = radial[..., 0] / radial_length
+    sin_alpha = radial[..., 1] / radial_length
+
+    along = radius - radius * np.cos(theta)
+    across = radius * np.sin(theta)
+    return np.stack(
+        (
+            a[..., 0] - along * cos_alpha - across * sin_alpha,
+            a[..., 1] - along * sin_alpha + across * cos_alpha,
+        ),
+        axis=-1,
+    )
+
+
+def rotate_batch(points, angle):
+    """Rotates points about the origin
+
+    Args:
+        points (array): Points of shape (..., 2)
+        angle (float or array): Anticlockwise rotation in radians, broadcastable to shape (...)
+
+    Returns:
+        array: Rotated points of shape (..., 2)
+    """
+    points = np.asarray(points, dtype=float)
+    cos, sin = np.cos(angle), np.sin(angle)
+    return np.stack(
+        (
+            points[..., 0] * cos - points[..., 1] * sin,
+            points[..., 0] * sin + points[..., 1] * cos,
+        ),
+        axis=-1,
+    )
+
+
+def midpoint_normal_batch(a, b, normal_dist, positive=True):
+    """Vectorised equivalent of Coordinate.midpoint_normal
+
+    Args:
+        a (array): Points of shape (..., 2)
+        b (array): Points of shape (..., 2) to determine a normal distance and angle from
+        normal_dist (float or array): Distances from the midpoint lines, broadcastable to shape (...)
+        positive (bool, optional): Controls which side of the midpoint lines the points lie. Defaults to True.
+
+    Returns:
+        array: Points of shape (..., 2) a normal distance away from the midpoints between a and b
+    """
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    difference = a - b
+    angle = np.arctan2(difference[..., 1], difference[..., 0])
+    normal_angle = angle + np.pi / 2 if positive else angle + 3 * np.pi / 2
+    return (a + b) / 2 + np.stack(
+        (np.cos(normal_angle) * normal_dist, np.sin(normal_angle) * normal_dist),
+        axis=-1,
     )
-    return Coordinate(x, y)
 
 
 def get_chord_subtended_angle(chord_length, r):
@@ -1,21 +1,23 @@
-import shutil
-import time
+import io
+import logging
+import zipfile
 
-import matplotlib.patches as patch
-import matplotlib.pyplot as plt
 import numpy as np
 
 from iris_calculator.actuator_ring import ActuatorRing
 from iris_calculator.base_plate import BasePlate
-from iris_calculator.blade import Blade
+from iris_calculator.blade import Blade, BladeTrajectories
+from iris_calculator.dxf import DXF
+from iris_calculator.kinematics import get_canonical_table
+from iris_calculator.telemetry import SolverTelemetry, record_solver_telemetry
+from iris_calculator.timing import stage
+
+logger = logging.getLogger(__name__)
 
 
 class Iris:
-    _SLEEP_TIME = 0.0001
-    _COLOUR = "red"
-    _ENDLESS_DRAW = True
-    _ZIP_FILENAME = "IrisDXFs"
-    _DXF_FOLDER = "dxf"
+    _BC_RATIO = 1.07
+    _BLADE_RADIUS_RATIO = 0.96
 
     def __init__(
         self,
@@ -25,7 +27,20 @@ class Iris:
         blade_width,
         peg_radius,
         peg_clearance,
+        use_canonical_kinematics=True,
     ):
+        """A mechanical iris
+
+        Args:
+            blade_count (int): Number of blades
+            aperture_inner_radius (float): Radius of the aperture when closed
+            aperture_outer_radius (float): Radius of the aperture when open
+            blade_width (float): Width of each blade
+            peg_radius (float): Radius of the pegs the blades pivot and slide on
+            peg_clearance (float): Clearance between pegs and their holes
+            use_canonical_kinematics (bool, optional): Whether blade kinematics are rescaled from a table shared by
+                every iris rather than solved for this iris. Solving is kept as a validation mode. Defaults to True.
+        """
         self.blade_count = blade_count
         self.aperture_inner_radius = aperture_inner_radius
         self.aperture_outer_radius = aperture_outer_radius
@@ -33,190 +48,198 @@ class Iris:
         self.peg_radius = peg_radius
         self.peg_clearance = peg_clearance
         self.pinned_radius = aperture_outer_radius + blade_width * 2
-        self.BC = self.pinned_radius * 1.07
+        self.BC = self.pinned_radius * self._BC_RATIO
 
-        self.fig = plt.figure()
-        self.axs = self.fig.gca()
-        self.fig.set_size_inches(10, 10)
-
-        blade_radius = self.pinned_radius * 0.96
+        blade_radius = self.pinned_radius * self._BLADE_RADIUS_RATIO
         tab_width = self.blade_width / 2
         tab_height = self.blade_width / 2
 
         if blade_width > blade_radius:
             raise ValueError("Blade width too large")
 
-        self.blades = [
-            Blade(
-                2 * np.pi / blade_count * i,
-                self.pinned_radius,
-                blade_radius,
-                self.BC,
-                self.peg_radius,
-                self.blade_width,
-            )
-            for i in range(blade_count)
-        ]
+        kinematics = None
+        if use_canonical_kinematics:
+            kinematics = get_canonical_table(self._BLADE_RADIUS_RATIO, self._BC_RATIO)
+
+        with stage("blades"):
+            self.blades = [
+                Blade(
+                    2 * np.pi / blade_count * i,
+                    self.pinned_radius,
+                    blade_radius,
+                    self.BC,
+                    self.peg_radius,
+                    self.blade_width,
+                    kinematics,
+                )
+                for i in range(blade_count)
+            ]
 
-        self.blades[0].set_theta_a_domain(
-            aperture_inner_radius,
-            aperture_outer_radius,
-        )
+        with stage("set_theta_a_domain"):
+            self.blades[0].set_theta_a_domain(
+                aperture_inner_radius,
+                aperture_outer_radius,
+            )
 
         self.domain = self.blades[0].theta_a_range
 
-        # Only calculate blade state for one blade, others are rotated duplicates
-        initial_blade_state = self.blades[0].calc_blade_states(
-            self.domain[0], self.domain[1]
-        )
-        print(f"Blade radius: {blade_radius} Pinned radius: {self.pinned_radius}")
-        print(f"Theta a domain: {self.domain}")
-        self.blade_states = [
-            [
-                initial_blade_state[ii].rotated_copy(2 * np.pi / self.blade_count * i)
-                for ii in range(len(initial_blade_state))
-            ]
-            for i in range(self.blade_count)
-        ]
+        # Only calculate blade state for one blade, others are rotated from it when accessed
+        with stage("calc_blade_states"):
+            initial_blade_state = self.blades[0].calc_blade_states(
+                self.domain[0], self.domain[1]
+            )
+        self.blade_states = BladeTrajectories(initial_blade_state, self.blade_count)
         min_A_rad, max_A_rad = self.calc_A_range(initial_blade_state)
 
         min_rad = min(min_A_rad - peg_radius * 2, self.aperture_outer_radius)
         max_rad = max(self.pinned_radius + peg_radius * 2, max_A_rad + peg_radius * 2)
 
-        self.base_plate = BasePlate(
-            min_rad,
-            max_rad,
-            self.pinned_radius,
-            self.peg_clearance + self.peg_radius,
-            self.blade_count,
-            tab_width,
-            tab_height,
-        )
+        with stage("base_plate"):
+            self.base_plate = BasePlate(
+                min_rad,
+                max_rad,
+                self.pinned_radius,
+                self.peg_clearance + self.peg_radius,
+                self.blade_count,
+                tab_width,
+                tab_height,
+            )
+
+        with stage("actuator_ring"):
+            self.actuator_ring = ActuatorRing(
+                min_rad,
+                max_rad,
+                self.peg_radius + self.peg_clearance,
+                self.blade_count,
+                min_A_rad,
+                max_A_rad,
+                tab_width,
+                tab_height,
+            )
 
-        self.actuator_ring = ActuatorRing(
-            min_rad,
-            max_rad,
-            self.peg_radius + self.peg_clearance,
-            self.blade_count,
-            min_A_rad,
-            max_A_rad,
-            tab_width,
-            tab_height,
+        telemetry = self.get_solver_telemetry()
+        record_solver_telemetry(telemetry)
+        logger.debug(
+            "Built iris",
+            extra={
+                "blade_count": blade_count,
+                "blade_radius": blade_radius,
+                "pinned_radius": self.pinned_radius,
+                "theta_a_domain": list(self.domain),
+                "solver": telemetry.as_dict(),
+            },
         )
 
-    def calc_A_range(self, blade_states):
-        start_A_rad = np.inf
-        end_A_rad = -np.inf
-        for blade_state in blade_states:
-            if blade_state.A.magnitude() < start_A_rad:
-                start_A_rad = blade_state.A.magnitude()
-            if blade_state.A.magnitude() > end_A_rad:
-                end_A_rad = blade_state.A.magnitude()
+    def get_solver_telemetry(self):
+        """Totals the solves of every blade, which only run when the iris is built without canonical kinematics
+
+        Returns:
+            SolverTelemetry: Solver telemetry of the iris
+        """
+        telemetry = SolverTelemetry()
+        for blade in self.blades:
+            telemetry.merge(blade.solver_telemetry)
+        return telemetry
 
-        return start_A_rad, end_A_rad
+    def calc_A_range(self, blade_states):
+        A_rads = np.hypot(*blade_states.A.T)
+        return float(np.min(A_rads)), float(np.max(A_rads))
 
     def get_A_coords(self):
-        return [
-            {"x": self.blade_states[0][i].A.x, "y": self.blade_states[0][i].A.y}
-            for i in range(len(self.blade_states[0]))
-        ]
+        return [{"x": x, "y": y} for x, y in self.blade_states[0].A.tolist()]
 
     def get_actuator_rotation_range(self):
         return self.blade_states[0][0].C.angle(), self.blade_states[0][-1].C.angle()
 
     def drawIris(self):
-        plt.show(block=False)
-        i = 0
-        multiplier = 1
-        act_ring_angle = self.blade_states[0][0].A.angle()
+        from iris_calculator.renderer import IrisRenderer
 
-        while i < len(self.blade_states[0]):
-            rotation_angle = self.blade_states[0][i].C.angle()
+        IrisRenderer(self).draw_iris()
 
-            plt.cla()
-            plt.title(
-                f"Theta A: {self.blade_states[0][i].theta_a * 180 / np.pi} Bx: {self.blades[0].calc_Bx(self.blade_states[0][i].theta_a )}"
-            )
-            for blade_index in range(len(self.blades)):
-                self.blades[blade_index].build_shapes(
-                    blade_state=self.blade_states[blade_index][i]
-                )
-                self.blades[blade_index].draw(
-                    self.axs, self.blade_states[blade_index][i]
-                )
-
-            self.base_plate.draw(self.axs, rotation_angle)
-            self.actuator_ring.draw(self.axs, act_ring_angle)
+        self.blades[0].save_dxf()
+        self.base_plate.save_dxf()
+        self.actuator_ring.save_dxf()
 
-            self.axs.add_patch(
-                patch.Circle(
-                    (0, 0), self.aperture_outer_radius, color=self._COLOUR, fill=False
-                )
-            )
+    def save_dxfs_as_zip(self, file):
+        """Writes DXFs for each part within the iris to a zip archive, without touching the filesystem unless file is
+        a path
 
-            self.axs.add_patch(
-                patch.Circle(
-                    (0, 0), self.aperture_inner_radius, color=self._COLOUR, fill=False
-                )
-            )
+        Args:
+            file (str or file): Path or writable binary file object to write the archive to
+        """
+        # Build shapes for an unrotated state
+        with stage("build_shapes"):
+            self.blades[0].build_shapes(blade_state=self.blade_states[0][0])
+            self.base_plate.build_shapes(rotation_angle=0)
+            self.actuator_ring.build_shapes(rotation_angle=0)
 
-            self.axs.add_patch(
-                patch.Circle((0, 0), 0.01, color=self._COLOUR, fill=True)
-            )
+        with stage("dxf"), zipfile.ZipFile(file, "w", zipfile.ZIP_DEFLATED) as archive:
+            for part in (self.blades[0], self.base_plate, self.actuator_ring):
+                archive.writestr(part._DXF_FILE_NAME, part.get_dxf_bytes())
 
-            self.axs.axis(
-                [
-                    -self.aperture_outer_radius * 2.5,
-                    self.aperture_outer_radius * 2.5,
-                    -self.aperture_outer_radius * 2.5,
-                    self.aperture_outer_radius * 2.5,
-                ]
-            )
-            self.fig.canvas.draw()
-            self.fig.canvas.flush_events()
-            time.sleep(self._SLEEP_TIME)
+    def get_dxfs_as_zip(self):
+        """Builds a zip archive of DXFs for each part within the iris in memory
 
-            i += 1 * multiplier
+        Returns:
+            bytes: Zip archive
+        """
+        buffer = io.BytesIO()
+        self.save_dxfs_as_zip(buffer)
+        return buffer.getvalue()
 
-            if self._ENDLESS_DRAW and i in [len(self.blade_states[0]) - 1, 0]:
-                multiplier *= -1
-        plt.close()
+    def build_assembly_dxf(self, actuator_angle=None):
+        """Builds a DXF of the assembled iris, with a layer for each part
 
-        self.blades[0].save_dxf()
-        self.base_plate.save_dxf()
-        self.actuator_ring.save_dxf()
+        The blade is defined once as a block and placed with a rotated insert for each blade, so the size of the DXF
+        barely grows with the blade count. Parts are positioned as drawn by IrisRenderer, with the actuator ring held
+        still.
 
-    def save_dxfs_as_zip(self):
-        """Saves DXFs for each part within the iris to a zip file
+        Args:
+            actuator_angle (float, optional): Rotation of the base plate in radians, within the range given by
+                get_actuator_rotation_range. The nearest calculated blade state is drawn. Defaults to the open iris.
 
         Returns:
-            file: Created zip file
+            DXF: Assembly DXF
         """
-        # Build shapes for an unrotated state
-        self.blades[0].build_shapes(blade_state=self.blade_states[0][0])
-        self.base_plate.build_shapes(rotation_angle=0)
-        self.actuator_ring.build_shapes(rotation_angle=0)
+        blade_states = self.blade_states[0]
+        index = 0
+        if actuator_angle is not None:
+            C_angles = np.arctan2(blade_states.C[:, 1], blade_states.C[:, 0])
+            # Angles are compared around the circle so that wrapping at +-pi has no effect
+            index = int(
+                np.argmin(np.abs(np.angle(np.exp(1j * (C_angles - actuator_angle)))))
+            )
+        blade_state = blade_states[index]
 
-        self.blades[0].save_dxf()
-        self.base_plate.save_dxf()
-        self.actuator_ring.save_dxf()
+        blade = self.blades[0]
+        blade.build_shapes(blade_state=blade_state)
+        self.base_plate.build_shapes(rotation_angle=blade_state.C.angle())
+        self.actuator_ring.build_shapes(rotation_angle=blade_states[0].A.angle())
+
+        dxf = DXF()
+        for part in (blade, self.base_plate, self.actuator_ring):
+            dxf.add_layer(part.layer, part._COLOUR)
+
+        dxf.add_block(blade.layer, blade.shapes, blade.layer)
+        for i in range(self.blade_count):
+            dxf.add_insert(blade.layer, 2 * np.pi / self.blade_count * i, blade.layer)
 
-        # Transfer dxfs to a folder and create archive
-        shutil.make_archive(self._ZIP_FILENAME, "zip", self._DXF_FOLDER)
-        return open(f"{self._ZIP_FILENAME}.zip", "rb")
+        self.base_plate.add_to_dxf(dxf, self.base_plate.layer)
+        self.actuator_ring.add_to_dxf(dxf, self.actuator_ring.layer)
+        return dxf
+
+    def get_assembly_dxf(self, actuator_angle=None):
+        """Writes a DXF of the assembled iris to memory, see build_assembly_dxf
+
+        Args:
+            actuator_angle (float, optional): Rotation of the base plate in radians. Defaults to the open iris.
+
+        Returns:
+            bytes: Contents of the DXF file
+        """
+        return self.build_assembly_dxf(actuator_angle).to_bytes()
 
     def plot_bx(self):
-        theta_as = np.arange(200 / 180 * np.pi, 290 / 180 * np.pi, 0.01)
-        bxs = []
-        for theta_a in theta_as:
-            try:
-                bxs.append(self.blades[0].calc_Bx(theta_a))
-            except:
-                bxs.append(0)
-        plt.plot(theta_as * 360 / 2 / np.pi, bxs)
-        plt.show()
-
-
-# iris = Iris(5, 30, 65, 20, 3.5, 1)
-# iris.plot_bx()
-# iris.drawIris()
+        from iris_calculator.renderer import IrisRenderer
+
+        IrisRenderer(self).plot_bx()
@@ -0,0 +1,312 @@
+import functools
+import os
+
+import numpy as np
+
+
+class KinematicsTable:
+    """Blade kinematics tabulated against theta_a
+
+    Lengths are stored normalised by the pinned radius. Blades with the same ratios of blade radius and BC to pinned
+    radius share the same kinematics up to a scale factor, so a single table serves every blade of that shape.
+    """
+
+    _NUM_POINTS = 2001
+    _REFINE_TOLERANCE = 1e-10
+    _END_STEP = 1e-7
+    _CACHE_DIR_ENV = "IRIS_KINEMATICS_CACHE_DIR"
+
+    def __init__(self, blade_radius_ratio, BC_ratio, theta_as, solutions, Bx_solutions):
+        """
+        Args:
+            blade_radius_ratio (float): Blade radius divided by the pinned radius
+            BC_ratio (float): Length from point B to point C divided by the pinned radius
+            theta_as (array): Increasing theta_a values in radians
+            solutions (array): Rows of (AB / pinned radius, theta_b, theta_c) for each theta_a, as solved for blade
+                states. None if the table is only used for lookups of Bx.
+            Bx_solutions (array): Rows of (AB / pinned radius, theta_b, theta_c) for each theta_a, as solved for the
+                x position of point B by Blade.calc_Bx
+        """
+        self.blade_radius_ratio = blade_radius_ratio
+        self.BC_ratio = BC_ratio
+        self.theta_as = np.asarray(theta_as, dtype=float)
+        self.solutions = (
+            None if solutions is None else np.asarray(solutions, dtype=float)
+        )
+        self.Bx_solutions = np.asarray(Bx_solutions, dtype=float)
+        self.Bx = self.Bx_solutions[:, 0] * np.cos(self.Bx_solutions[:, 1])
+        self._inverse = None
+
+    @classmethod
+    def from_blade(cls, blade, num_points=_NUM_POINTS, solve_blade_states=True):
+        """Tabulates the kinematics of a blade over its full theta_a domain with batch solves
+
+        Args:
+            blade (Blade): Blade to tabulate
+            num_points (int, optional): Number of theta_a values to tabulate. Defaults to _NUM_POINTS.
+            solve_blade_states (bool, optional): Whether to tabulate blade states as well as Bx. Defaults to True.
+
+        Returns:
+            KinematicsTable: Tabulated kinematics
+        """
+        theta_as = np.linspace(*blade._DOMAIN_LIMITS, num_points)
+        solutions = None
+        if solve_blade_states:
+            solutions = blade.calc_closed_loop_equations_batch(theta_as)
+            solutions[:, 0] /= blade.pinned_radius
+        # Bx is solved with a looser bound on AB than blade states, matching Blade.calc_Bx
+        Bx_solutions = blade.solve_closed_loop_equations_batch(
+            theta_as, blade.get_Bx_bounds()
+        ).x
+        Bx_solutions[:, 0] /= blade.pinned_radius
+        return cls(
+            blade.blade_radius / blade.pinned_radius,
+            blade.BC / blade.pinned_radius,
+            theta_as,
+            solutions,
+            Bx_solutions,
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(
+                float(data["blade_radius_ratio"]),
+                float(data["BC_ratio"]),
+                data["theta_as"],
+                data["solutions"] if "solutions" in data.files else None,
+                data["Bx_solutions"],
+            )
+
+    def save(self, path):
+        arrays = {
+            "blade_radius_ratio": self.blade_radius_ratio,
+            "BC_ratio": self.BC_ratio,
+            "theta_as": self.theta_as,
+            "Bx_solutions": self.Bx_solutions,
+        }
+        if self.solutions is not None:
+            arrays["solutions"] = self.solutions
+        np.savez(path, **arrays)
+
+    def matches(self, blade_radius_ratio, BC_ratio):
+        return np.isclose(self.blade_radius_ratio, blade_radius_ratio) and np.isclose(
+            self.BC_ratio, BC_ratio
+        )
+
+    def interpolate(self, theta_as):
+        """Interpolates normalised values of AB, theta_b, and theta_c
+
+        Args:
+            theta_as (array): In radians
+
+        Returns:
+            array: Rows of (AB / pinned radius, theta_b, theta_c) for each theta_a
+        """
+        if self.solutions is None:
+            raise ValueError("Kinematics table does not hold blade states")
+        return self._interpolate_rows(theta_as, self.solutions)
+
+    def interpolate_Bx_solutions(self, theta_as):
+        """Interpolates normalised values of AB, theta_b, and theta_c as solved for the x position of point B
+
+        Args:
+            theta_as (array): In radians
+
+        Returns:
+            array: Rows of (AB / pinned radius, theta_b, theta_c) for each theta_a
+        """
+        return self._interpolate_rows(theta_as, self.Bx_solutions)
+
+    def calc_Bx(self, theta_a):
+        """Interpolates the normalised x position of point B
+
+        Args:
+            theta_a (float): In radians
+
+        Returns:
+            float: X position of point B in an unrotated state, divided by the pinned radius
+        """
+        return np.interp(theta_a, self.theta_as, self.Bx)
+
+    def calc_Bx_range(self, refine=None, telemetry=None):
+        """Finds the range of normalised x values that point B can take
+
+        Args:
+            refine (callable, optional): Exact normalised Bx as a function of theta_a. If given, each extremum is
+                refined with a bounded Brent search between the neighbouring table entries. Defaults to None.
+            telemetry (SolverTelemetry, optional): Records each refinement. Defaults to None.
+
+        Returns:
+            ((float, float), (float, float)): ((min_theta_a, max_theta_a), (min_Bx, max_Bx)) where min_theta_a
+                maximises Bx and max_theta_a minimises Bx, matching Blade.calc_Bx_range
+        """
+        min_index, max_index = np.argmax(self.Bx), np.argmin(self.Bx)
+        if refine is None:
+            return (self.theta_as[min_index], self.theta_as[max_index]), (
+                self.Bx[min_index],
+                self.Bx[max_index],
+            )
+
+        min_theta_a = self._refine_extremum(
+            lambda theta_a: -refine(theta_a), min_index, telemetry
+        )
+        max_theta_a = self._refine_extremum(refine, max_index, telemetry)
+        return (min_theta_a, max_theta_a), (refine(min_theta_a), refine(max_theta_a))
+
+    def bracket_theta_a(self, Bx):
+        """Finds the tabulated interval of theta_a over which the magnitude of Bx passes through a value
+
+        Only the branch between the extrema of Bx is searched, along which Bx is monotonic.
+
+        Args:
+            Bx (float): Magnitude of the normalised x position of point B
+
+        Returns:
+            (int, int): Indices of the interval bounds, equal if the value lies outside of the branch
+        """
+        start, end = self._get_branch()
+        residual = np.abs(self.Bx[start : end + 1]) - Bx
+        crossings = np.flatnonzero(np.sign(residual[:-1]) != np.sign(residual[1:]))
+        if len(crossings) == 0:
+            closest = start + np.argmin(np.abs(residual))
+            return closest, closest
+        return start + crossings[0], start + crossings[0] + 1
+
+    def calc_theta_a(self, Bx, refine=None, telemetry=None):
+        """Finds the theta_a at which the magnitude of Bx takes a value
+
+        The root is bracketed from the table, then found with a monotone interpolant of the inverse or, if an exact
+        Bx is given, refined with Brent's method within the bracket.
+
+        Args:
+            Bx (float): Magnitude of the normalised x position of point B
+            refine (callable, optional): Exact normalised Bx as a function of theta_a. Defaults to None.
+            telemetry (SolverTelemetry, optional): Records each refinement. Defaults to None.
+
+        Returns:
+            float: theta_a in radians, clamped to the ends of the branch between the extrema of Bx
+        """
+        lower, upper = self.bracket_theta_a(Bx)
+        if lower == upper:
+            return self.theta_as[lower]
+
+        if refine is not None:
+            from scipy.optimize import brentq
+
+            def residual(theta_a):
+                return abs(refine(theta_a)) - Bx
+
+            lower_theta_a, upper_theta_a = self.theta_as[lower], self.theta_as[upper]
+            # The table and exact solution may differ in sign right at a table entry
+            if np.sign(residual(lower_theta_a)) != np.sign(residual(upper_theta_a)):
+                theta_a, result = brentq(
+                    residual,
+                    lower_theta_a,
+                    upper_theta_a,
+                    xtol=self._REFINE_TOLERANCE,
+                    full_output=True,
+                )
+                if telemetry is not None:
+                    telemetry.record(
+                        "brentq",
+                        result.function_calls,
+                        result.converged,
+                        success=result.converged,
+                    )
+                return theta_a
+
+        return float(self._get_inverse()(np.sign(self.Bx[lower]) * Bx))
+
+    def _interpolate_rows(self, theta_as, values):
+        theta_as = np.atleast_1d(theta_as)
+        return np.column_stack(
+            [np.interp(theta_as, self.theta_as, values[:, i]) for i in range(3)]
+        )
+
+    def _refine_extremum(self, fun, index, telemetry=None):
+        # Extrema at the ends of the domain are kept exactly at the end when fun still falls towards the end
+        last = len(self.theta_as) - 1
+        if index in (0, last):
+            end = self.theta_as[index]
+            inwards = end + self._END_STEP * (1 if index == 0 else -1)
+            if fun(end) <= fun(inwards):
+                return end
+
+        from scipy.optimize import minimize_scalar
+
+        result = minimize_scalar(
+            fun,
+            bounds=(
+                self.theta_as[max(index - 1, 0)],
+                self.theta_as[min(index + 1, last)],
+            ),
+            method="bounded",
+            options={"xatol": self._REFINE_TOLERANCE},
+        )
+        if telemetry is not None:
+            telemetry.record(
+                "minimize_scalar", result.nfev, result.status, success=result.success
+            )
+        return result.x
+
+    def _get_inverse(self):
+        # Monotone cubic interpolant of theta_a against Bx along the branch between the extrema of Bx
+        if self._inverse is None:
+            from scipy.interpolate import PchipInterpolator
+
+            start, end = self._get_branch()
+            Bx = self.Bx[start : end + 1]
+            theta_as = self.theta_as[start : end + 1]
+            if Bx[-1] < Bx[0]:
+                Bx, theta_as = Bx[::-1], theta_as[::-1]
+            # Flat sections where the solution is held at a bound are dropped
+            increasing = Bx > np.maximum.accumulate(
+                np.concatenate(((-np.inf,), Bx[:-1]))
+            )
+            self._inverse = PchipInterpolator(
+                Bx[increasing], theta_as[increasing], extrapolate=False
+            )
+        return self._inverse
+
+    def _get_branch(self):
+        # Indices of the extrema of Bx, ordered by theta_a
+        extrema = np.argmax(self.Bx), np.argmin(self.Bx)
+        return min(extrema), max(extrema)
+
+
+@functools.lru_cache(maxsize=None)
+def get_canonical_table(blade_radius_ratio, BC_ratio):
+    """Gets the kinematics table for a blade shape, built at most once per process
+
+    If the IRIS_KINEMATICS_CACHE_DIR environment variable is set, tables are loaded from and saved to that directory.
+
+    Args:
+        blade_radius_ratio (float): Blade radius divided by the pinned radius
+        BC_ratio (float): Length from point B to point C divided by the pinned radius
+
+    Returns:
+        KinematicsTable: Shared kinematics table
+    """
+    from iris_calculator.blade import Blade
+    from iris_calculator.telemetry import record_solver_telemetry
+
+    cache_dir = os.environ.get(KinematicsTable._CACHE_DIR_ENV)
+    path = None
+    if cache_dir:
+        path = os.path.join(
+            cache_dir, f"kinematics_{blade_radius_ratio:.6f}_{BC_ratio:.6f}.npz"
+        )
+        if os.path.exists(path):
+            table = KinematicsTable.load(path)
+            if table.matches(blade_radius_ratio, BC_ratio):
+                return table
+
+    blade = Blade(0, 1, blade_radius_ratio, BC_ratio, 0)
+    table = KinematicsTable.from_blade(blade)
+    record_solver_telemetry(blade.solver_telemetry)
+
+    if path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        table.save(path)
+    return table
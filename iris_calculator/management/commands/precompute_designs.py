@@ -0,0 +1,114 @@
+import itertools
+
+from django.core.management.base import BaseCommand
+
+from iris_calculator.models import IrisDesign
+from iris_calculator.parameters import IrisParameters
+from iris_calculator.views import calc_dxf_archive, calc_iris_results
+
+
+class Command(BaseCommand):
+    help = "Precomputes and stores results, and optionally DXF archives, for common iris designs"
+
+    # Defaults match the inputs of the front end
+    _BLADE_COUNTS = [4, 5, 6, 8, 10, 12]
+    _MAX_DIAMETERS = [20, 30, 40, 50, 60, 80, 100]
+    _MIN_DIAMETER_RATIOS = [0.1, 0.2, 0.3, 0.4, 0.5]
+    _BLADE_WIDTH = 5
+    _PIN_RADIUS = 1.5
+    _PIN_CLEARANCE = 0.5
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--blade-counts", nargs="+", type=int, default=self._BLADE_COUNTS
+        )
+        parser.add_argument(
+            "--max-diameters", nargs="+", type=float, default=self._MAX_DIAMETERS
+        )
+        parser.add_argument(
+            "--min-diameter-ratios",
+            nargs="+",
+            type=float,
+            default=self._MIN_DIAMETER_RATIOS,
+            help="Closed diameters as fractions of the open diameter",
+        )
+        parser.add_argument(
+            "--blade-widths", nargs="+", type=float, default=[self._BLADE_WIDTH]
+        )
+        parser.add_argument(
+            "--pin-radii", nargs="+", type=float, default=[self._PIN_RADIUS]
+        )
+        parser.add_argument(
+            "--pin-clearances", nargs="+", type=float, default=[self._PIN_CLEARANCE]
+        )
+        parser.add_argument(
+            "--dxf", action="store_true", help="Also store DXF archives"
+        )
+        parser.add_argument(
+            "--overwrite",
+            action="store_true",
+            help="Recompute designs that are already stored",
+        )
+
+    def handle(self, *args, **options):
+        designs = []
+        skipped = 0
+        for (
+            blade_count,
+            max_diameter,
+            ratio,
+            blade_width,
+            pin_radius,
+            pin_clearance,
+        ) in itertools.product(
+            options["blade_counts"],
+            options["max_diameters"],
+            options["min_diameter_ratios"],
+            options["blade_widths"],
+            options["pin_radii"],
+            options["pin_clearances"],
+        ):
+            try:
+                designs.append(
+                    IrisParameters(
+                        blade_count,
+                        max_diameter * ratio / 2,
+                        max_diameter / 2,
+                        blade_width,
+                        pin_radius,
+                        pin_clearance,
+                    )
+                )
+            except ValueError as error:
+                skipped += 1
+                self.stderr.write(
+                    f"Skipped {blade_count} blades, {max_diameter} diameter: {error}"
+                )
+
+        if options["overwrite"]:
+            IrisDesign.objects.filter(
+                parameter_hash__in=[design.get_hash() for design in designs]
+            ).delete()
+
+        computed = 0
+        for i, parameters in enumerate(designs):
+            try:
+                IrisDesign.objects.get_or_compute_results(parameters, calc_iris_results)
+                if options["dxf"]:
+                    IrisDesign.objects.get_or_compute_dxf_archive(
+                        parameters, calc_dxf_archive
+                    )
+            except ValueError as error:
+                skipped += 1
+                self.stderr.write(f"Skipped {parameters}: {error}")
+                continue
+
+            computed += 1
+            if options["verbosity"] > 1:
+                self.stdout.write(f"[{i + 1}/{len(designs)}] {parameters}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Stored {computed} designs, skipped {skipped} invalid designs"
+            )
+        )
@@ -0,0 +1,103 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from iris_calculator import profiling
+from iris_calculator.parameters import IrisParameters
+from iris_calculator.views import calc_dxf_archive, calc_iris_results
+
+
+class Command(BaseCommand):
+    help = (
+        "Lists stored request profiles, or summarises the hot spots of one. A design can also be profiled here, as a "
+        "request for it would be."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "profile", nargs="?", help="Identifier of a profile to summarise"
+        )
+        parser.add_argument(
+            "--limit", type=int, default=20, help="Number of hot spots to summarise"
+        )
+        parser.add_argument(
+            "--sort",
+            choices=["tottime", "cumtime"],
+            default="tottime",
+            help="Rank functions by their own time, or including the functions they call",
+        )
+        parser.add_argument(
+            "--design",
+            nargs=6,
+            type=float,
+            metavar=(
+                "BLADE_COUNT",
+                "MIN_DIAMETER",
+                "MAX_DIAMETER",
+                "BLADE_WIDTH",
+                "PIN_RADIUS",
+                "PIN_CLEARANCE",
+            ),
+            help="Profile a design in this process and summarise it, with values as given in requests",
+        )
+        parser.add_argument(
+            "--dxf",
+            action="store_true",
+            help="Profile building the DXF archive of the design rather than its results",
+        )
+        parser.add_argument(
+            "--directory",
+            help="Directory of profiles, defaults to the IRIS_PROFILING setting",
+        )
+
+    def handle(self, *args, **options):
+        directory = os.fspath(
+            options["directory"] or profiling.get_options()["DIRECTORY"]
+        )
+
+        profile_id = options["profile"]
+        if options["design"] is not None:
+            blade_count, min_diameter, max_diameter, *others = options["design"]
+            parameters = IrisParameters(
+                blade_count, min_diameter / 2, max_diameter / 2, *others
+            )
+            profile_id = profiling.new_profile_id()
+            profiling.run_profiled(
+                directory,
+                profile_id,
+                calc_dxf_archive if options["dxf"] else calc_iris_results,
+                parameters,
+            )
+            self.stdout.write(f"Profiled {parameters} as {profile_id}")
+
+        if profile_id is None:
+            self.list_profiles(directory)
+            return
+
+        try:
+            hot_spots = profiling.get_hot_spots(
+                directory, profile_id, options["limit"], options["sort"]
+            )
+        except FileNotFoundError:
+            raise CommandError(f"No profile {profile_id} in {directory}")
+        self.stdout.write(
+            f"{'calls':>10} {'tottime (ms)':>13} {'cumtime (ms)':>13}  function"
+        )
+        for hot_spot in hot_spots:
+            self.stdout.write(
+                f"{hot_spot['calls']:10d} {hot_spot['tottime'] * 1e3:13.3f} "
+                f"{hot_spot['cumtime'] * 1e3:13.3f}  {hot_spot['function']}"
+            )
+
+    def list_profiles(self, directory):
+        profiles = profiling.list_profiles(directory)
+        if not profiles:
+            self.stdout.write(f"No profiles in {directory}")
+            return
+        for profile in profiles:
+            parameters = ", ".join(
+                f"{name}={value}" for name, value in profile["parameters"].items()
+            )
+            self.stdout.write(
+                f"{profile['id']}  {profile['function']}  {profile['seconds'] * 1e3:.1f} ms  {parameters}"
+            )
@@ -0,0 +1,109 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from iris_calculator.sweep import (
+    Sweep,
+    evaluate_design,
+    evaluate_solved_design,
+    get_grid_samples,
+    get_latin_hypercube_samples,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Sweeps iris designs across a grid or Latin hypercube of parameters, writing a table of results. Interrupted "
+        "sweeps resume from their checkpoint when run again."
+    )
+
+    # Defaults match the inputs of the front end
+    _BLADE_COUNTS = [10]
+    _MIN_DIAMETERS = [10]
+    _MAX_DIAMETERS = [50]
+    _BLADE_WIDTHS = [5]
+    _PIN_RADII = [1.5]
+    _PIN_CLEARANCES = [0.5]
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", help="Path of the results table, .csv or .npz")
+        parser.add_argument(
+            "--blade-counts", nargs="+", type=int, default=self._BLADE_COUNTS
+        )
+        parser.add_argument(
+            "--min-diameters", nargs="+", type=float, default=self._MIN_DIAMETERS
+        )
+        parser.add_argument(
+            "--max-diameters", nargs="+", type=float, default=self._MAX_DIAMETERS
+        )
+        parser.add_argument(
+            "--blade-widths", nargs="+", type=float, default=self._BLADE_WIDTHS
+        )
+        parser.add_argument(
+            "--pin-radii", nargs="+", type=float, default=self._PIN_RADII
+        )
+        parser.add_argument(
+            "--pin-clearances", nargs="+", type=float, default=self._PIN_CLEARANCES
+        )
+        parser.add_argument(
+            "--samples",
+            type=int,
+            help="Number of Latin hypercube samples taken between the smallest and largest value of each parameter. "
+            "Every combination of values is swept if not given.",
+        )
+        parser.add_argument("--seed", type=int, help="Seed of Latin hypercube samples")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Number of worker processes, defaults to one per CPU",
+        )
+        parser.add_argument(
+            "--checkpoint", help="Path of the checkpoint, defaults to beside the output"
+        )
+        parser.add_argument(
+            "--solve",
+            action="store_true",
+            help="Solve blade kinematics for each design rather than rescaling the canonical table, recording solver "
+            "telemetry in the results",
+        )
+
+    def handle(self, *args, **options):
+        # Diameters are given as in requests, and halved to the radii of IrisParameters
+        values = {
+            "blade_count": options["blade_counts"],
+            "aperture_inner_radius": [d / 2 for d in options["min_diameters"]],
+            "aperture_outer_radius": [d / 2 for d in options["max_diameters"]],
+            "blade_width": options["blade_widths"],
+            "peg_radius": options["pin_radii"],
+            "peg_clearance": options["pin_clearances"],
+        }
+        try:
+            if options["samples"] is None:
+                samples = get_grid_samples(values)
+            else:
+                samples = get_latin_hypercube_samples(
+                    {name: (min(v), max(v)) for name, v in values.items()},
+                    options["samples"],
+                    options["seed"],
+                )
+        except ValueError as error:
+            raise CommandError(error)
+
+        sweep = Sweep(
+            samples,
+            options["output"],
+            options["checkpoint"],
+            options["workers"],
+            evaluate_solved_design if options["solve"] else evaluate_design,
+        )
+        progress = None
+        if options["verbosity"] > 1:
+            progress = lambda completed, total: self.stdout.write(
+                f"[{completed}/{total}]"
+            )
+        rows = sweep.run(progress)
+
+        failed = sum(row["failed"] for row in rows)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Swept {len(rows)} designs, {failed} failed, written to {options['output']}"
+            )
+        )
@@ -0,0 +1,400 @@
+import bisect
+import contextlib
+import functools
+import os
+import threading
+import time
+
+from iris_calculator.cache import dxf_archives, iris_results
+from iris_calculator.pool import compute_pool
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Latencies range from cache hits of a millisecond to cold calculations of several seconds
+_LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+
+class Metric:
+    """A metric kept in process, with a value for each combination of label values
+
+    Updates take a lock, so metrics are safe to update from any thread of the server.
+    """
+
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        """
+        Args:
+            name (str): Name of the metric
+            documentation (str): Description of the metric, given as its HELP line
+            labelnames (tuple, optional): Names of the labels of the metric. Defaults to ().
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        # Metrics without labels are exposed from the start, at zero
+        self._values = {} if self.labelnames else {(): 0}
+        self._lock = threading.Lock()
+
+    def get_labels(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} is labelled by {', '.join(self.labelnames)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def get_samples(self):
+        """
+        Returns:
+            list: (name, labels, value) of each sample, labels being a dict
+        """
+        with self._lock:
+            values = dict(self._values)
+        return [
+            (self.name, dict(zip(self.labelnames, labels)), value)
+            for labels, value in sorted(values.items())
+        ]
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        for name, labels, value in self.get_samples():
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self.get_labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    type = "gauge"
+
+    def inc(self, amount=1, **labels):
+        key = self.get_labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value, **labels):
+        key = self.get_labels(labels)
+        with self._lock:
+            self._values[key] = value
+
+    @contextlib.contextmanager
+    def track_in_progress(self, **labels):
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class CallbackGauge(Metric):
+    """A gauge whose values are read when the metrics are rendered, from state kept elsewhere"""
+
+    type = "gauge"
+
+    def __init__(self, name, documentation, collect, labelnames=()):
+        """
+        Args:
+            name (str): Name of the metric
+            documentation (str): Description of the metric, given as its HELP line
+            collect (callable): collect() returning values keyed by tuples of label values
+            labelnames (tuple, optional): Names of the labels of the metric. Defaults to ().
+        """
+        super().__init__(name, documentation, labelnames)
+        self.collect = collect
+
+    def get_samples(self):
+        return [
+            (self.name, dict(zip(self.labelnames, labels)), value)
+            for labels, value in sorted(self.collect().items())
+        ]
+
+
+class CallbackCounter(CallbackGauge):
+    type = "counter"
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=_LATENCY_BUCKETS):
+        """
+        Args:
+            name (str): Name of the metric
+            documentation (str): Description of the metric, given as its HELP line
+            labelnames (tuple, optional): Names of the labels of the metric. Defaults to ().
+            buckets (tuple, optional): Increasing upper bounds of the buckets, excluding +Inf. Defaults to
+                _LATENCY_BUCKETS.
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        self._values = {}
+
+    def observe(self, value, **labels):
+        key = self.get_labels(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            # Counts are kept per bucket, [count of each bucket and +Inf..., sum]
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            counts[index] += 1
+            counts[-1] += value
+
+    def get_samples(self):
+        with self._lock:
+            values = {labels: list(counts) for labels, counts in self._values.items()}
+
+        samples = []
+        for labels, counts in sorted(values.items()):
+            labels = dict(zip(self.labelnames, labels))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                samples.append(
+                    (
+                        f"{self.name}_bucket",
+                        {**labels, "le": _format_value(bound)},
+                        cumulative,
+                    )
+                )
+            samples.append((f"{self.name}_sum", labels, counts[-1]))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return samples
+
+
+class Registry:
+    """Metrics of the process, rendered together in the text exposition format"""
+
+    def __init__(self):
+        self.metrics = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        """
+        Args:
+            metric (Metric): Metric to add, with a name not already registered
+
+        Returns:
+            Metric: The metric
+        """
+        with self._lock:
+            if metric.name in self.metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self.metrics[metric.name] = metric
+        return metric
+
+    def render(self):
+        with self._lock:
+            metrics = list(self.metrics.values())
+        return "".join(metric.render() + "\n" for metric in metrics)
+
+
+def track_requests(view):
+    """Decorates an asynchronous view handler, counting and timing its requests
+
+    Args:
+        view (str): Value of the view label
+
+    Returns:
+        callable: Decorator
+    """
+
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(self, request, *args, **kwargs):
+            start = time.perf_counter()
+            status = 500
+            with requests_in_flight.track_in_progress(view=view):
+                try:
+                    response = await handler(self, request, *args, **kwargs)
+                    status = response.status_code
+                    return response
+                finally:
+                    request_duration.observe(time.perf_counter() - start, view=view)
+                    requests_total.inc(view=view, status=status)
+
+        return wrapper
+
+    return decorator
+
+
+def record_solver_telemetry(telemetry):
+    """Adds the solves of a calculation to the solver counters
+
+    Args:
+        telemetry (SolverTelemetry): Solver telemetry of the calculation
+    """
+    for solver, stats in telemetry.solvers.items():
+        solver_calls.inc(stats.calls, solver=solver)
+        solver_problems.inc(stats.problems, solver=solver)
+        solver_evaluations.inc(stats.nfev, solver=solver)
+        solver_failures.inc(stats.failures, solver=solver)
+    solver_inf_fallbacks.inc(telemetry.inf_fallbacks)
+
+
+def get_memory():
+    """Gets the memory of this process
+
+    Returns:
+        dict: Resident and peak resident memory in bytes, leaving out any that cannot be read on this platform
+    """
+    memory = {}
+    try:
+        with open("/proc/self/statm") as file:
+            memory["resident"] = int(file.read().split()[1]) * os.sysconf(
+                "SC_PAGE_SIZE"
+            )
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return memory
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and kibibytes elsewhere
+    memory["peak_resident"] = peak if os.uname().sysname == "Darwin" else peak * 1024
+    return memory
+
+
+def _get_cache_stats(key):
+    return {
+        (cache.prefix,): cache.get_stats()[key]
+        for cache in (iris_results, dxf_archives)
+    }
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _escape_label_value(value):
+    return str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return f"{value:.1f}"
+    return str(value)
+
+
+registry = Registry()
+
+request_duration = registry.register(
+    Histogram(
+        "iris_request_duration_seconds",
+        "Time taken to serve requests, by view",
+        ("view",),
+    )
+)
+requests_total = registry.register(
+    Counter(
+        "iris_requests_total", "Requests served, by view and status", ("view", "status")
+    )
+)
+requests_in_flight = registry.register(
+    Gauge("iris_requests_in_flight", "Requests being served, by view", ("view",))
+)
+compute_pool_in_flight = registry.register(
+    CallbackGauge(
+        "iris_compute_pool_in_flight",
+        "Calculations running or queued in the compute pool",
+        lambda: {(): compute_pool.in_flight},
+    )
+)
+
+solver_calls = registry.register(
+    Counter("iris_solver_calls_total", "Calls to each solver", ("solver",))
+)
+solver_problems = registry.register(
+    Counter(
+        "iris_solver_problems_total",
+        "Problems solved by each solver, batch solvers solving many per call",
+        ("solver",),
+    )
+)
+solver_evaluations = registry.register(
+    Counter(
+        "iris_solver_evaluations_total",
+        "Function evaluations of each solver",
+        ("solver",),
+    )
+)
+solver_failures = registry.register(
+    Counter(
+        "iris_solver_failures_total",
+        "Problems each solver failed to converge on",
+        ("solver",),
+    )
+)
+solver_inf_fallbacks = registry.register(
+    Counter(
+        "iris_solver_inf_fallbacks_total",
+        "Evaluations of the closed-loop equations at which the angle at point B was undefined",
+    )
+)
+
+cache_hits = registry.register(
+    CallbackCounter(
+        "iris_cache_hits_total",
+        "Cache hits, by cache",
+        lambda: _get_cache_stats("hits"),
+        ("cache",),
+    )
+)
+cache_misses = registry.register(
+    CallbackCounter(
+        "iris_cache_misses_total",
+        "Cache misses, by cache",
+        lambda: _get_cache_stats("misses"),
+        ("cache",),
+    )
+)
+cache_hit_ratio = registry.register(
+    CallbackGauge(
+        "iris_cache_hit_ratio",
+        "Fraction of cache lookups that hit since the process started, by cache",
+        lambda: _get_cache_stats("hit_ratio"),
+        ("cache",),
+    )
+)
+
+process_memory = registry.register(
+    CallbackGauge(
+        "iris_process_memory_bytes",
+        "Memory of the server process, excluding compute pool workers, by kind",
+        lambda: {(kind,): value for kind, value in get_memory().items()},
+        ("kind",),
+    )
+)
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.30 on 2026-10-18 10:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="IrisDesign",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("parameter_hash", models.CharField(max_length=64, unique=True)),
+                ("blade_count", models.PositiveIntegerField()),
+                ("aperture_inner_radius", models.FloatField()),
+                ("aperture_outer_radius", models.FloatField()),
+                ("blade_width", models.FloatField()),
+                ("peg_radius", models.FloatField()),
+                ("peg_clearance", models.FloatField()),
+                ("results", models.JSONField(blank=True, null=True)),
+                ("dxf_archive", models.BinaryField(blank=True, null=True)),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("updated", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=[
+                            "blade_count",
+                            "aperture_inner_radius",
+                            "aperture_outer_radius",
+                        ],
+                        name="iris_calcul_blade_c_574b96_idx",
+                    )
+                ],
+            },
+        ),
+    ]
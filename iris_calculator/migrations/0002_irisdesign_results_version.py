@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("iris_calculator", "0001_initial"),
+    ]
+
+    operations = [
+        # Designs stored before results were versioned are never served
+        migrations.AddField(
+            model_name="irisdesign",
+            name="results_version",
+            field=models.PositiveIntegerField(default=0),
+            preserve_default=False,
+        ),
+    ]
@@ -1,3 +1,136 @@
 from django.db import models
 
-# Create your models here.
+from iris_calculator.parameters import RESULTS_VERSION
+
+
+class IrisDesignManager(models.Manager):
+    def get_or_compute_results(self, parameters, compute):
+        """Gets stored results for a design, computing and storing them if there are none
+
+        Args:
+            parameters (IrisParameters): Canonical parameters
+            compute (callable): compute(parameters) returning serialized results
+
+        Returns:
+            dict: Serialized results
+        """
+        results = self.get_results(parameters)
+        if results is None:
+            results = compute(parameters)
+            self.set_results(parameters, results)
+        return results
+
+    def get_or_compute_dxf_archive(self, parameters, compute):
+        """Gets the stored DXF archive for a design, computing and storing it if there is none
+
+        Args:
+            parameters (IrisParameters): Canonical parameters
+            compute (callable): compute(parameters) returning the archive as bytes
+
+        Returns:
+            bytes: Zip archive of DXFs
+        """
+        dxf_archive = self.get_dxf_archive(parameters)
+        if dxf_archive is None:
+            dxf_archive = compute(parameters)
+            self.set_dxf_archive(parameters, dxf_archive)
+        return dxf_archive
+
+    def get_results(self, parameters):
+        """
+        Args:
+            parameters (IrisParameters): Canonical parameters
+
+        Returns:
+            dict: Stored serialized results, None if there are none
+        """
+        design = self.get_current(parameters)
+        return None if design is None else design.results
+
+    def set_results(self, parameters, results):
+        self._store(parameters, results=results)
+
+    def get_dxf_archive(self, parameters):
+        """
+        Args:
+            parameters (IrisParameters): Canonical parameters
+
+        Returns:
+            bytes: Stored zip archive of DXFs, None if there is none
+        """
+        design = self.get_current(parameters)
+        if design is None or design.dxf_archive is None:
+            return None
+        return bytes(design.dxf_archive)
+
+    def set_dxf_archive(self, parameters, dxf_archive):
+        self._store(parameters, dxf_archive=dxf_archive)
+
+    def get_current(self, parameters):
+        """
+        Args:
+            parameters (IrisParameters): Canonical parameters
+
+        Returns:
+            IrisDesign: Stored design, None if there is none stored by the current RESULTS_VERSION
+        """
+        return self.filter(
+            parameter_hash=parameters.get_hash(), results_version=RESULTS_VERSION
+        ).first()
+
+    def _store(self, parameters, **fields):
+        # A design stored by an earlier version is replaced, dropping whichever of its results or archive is not given
+        design = self.filter(parameter_hash=parameters.get_hash()).first()
+        if design is not None and design.results_version != RESULTS_VERSION:
+            design.delete()
+        self.update_or_create(
+            parameter_hash=parameters.get_hash(),
+            defaults={
+                **self._get_parameter_fields(parameters),
+                "results_version": RESULTS_VERSION,
+                **fields,
+            },
+        )
+
+    def _get_parameter_fields(self, parameters):
+        return {
+            "blade_count": parameters.blade_count,
+            "aperture_inner_radius": parameters.aperture_inner_radius,
+            "aperture_outer_radius": parameters.aperture_outer_radius,
+            "blade_width": parameters.blade_width,
+            "peg_radius": parameters.peg_radius,
+            "peg_clearance": parameters.peg_clearance,
+        }
+
+
+class IrisDesign(models.Model):
+    """Precomputed results and DXF archive of an iris design, looked up by the hash of its canonical parameters
+
+    Designs are only stored by the precompute_designs command, and only served while their results_version matches
+    RESULTS_VERSION.
+    """
+
+    parameter_hash = models.CharField(max_length=64, unique=True)
+    results_version = models.PositiveIntegerField()
+    blade_count = models.PositiveIntegerField()
+    aperture_inner_radius = models.FloatField()
+    aperture_outer_radius = models.FloatField()
+    blade_width = models.FloatField()
+    peg_radius = models.FloatField()
+    peg_clearance = models.FloatField()
+    results = models.JSONField(null=True, blank=True)
+    dxf_archive = models.BinaryField(null=True, blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    objects = IrisDesignManager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["blade_count", "aperture_inner_radius", "aperture_outer_radius"]
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.blade_count} blades, {self.aperture_inner_radius * 2}-{self.aperture_outer_radius * 2} diameter"
@@ -0,0 +1,82 @@
+import hashlib
+import json
+import math
+from dataclasses import astuple, dataclass, fields
+
+# Version of the calculation, bumped whenever a change alters the results or DXF archives of existing designs so that
+# those stored or cached by earlier versions are no longer served. Nothing checks that it is bumped: the design store
+# and result caches serve stale results until it is. DXF ETags also fingerprint the calculation's source, see
+# iris_calculator.cache.get_etag, so clients revalidate after any change to it.
+RESULTS_VERSION = 1
+
+
+@dataclass(frozen=True)
+class IrisParameters:
+    """Design parameters that fully determine an iris
+
+    Values are rounded on construction so that designs differing by less than the rounding share results, and
+    validated so that designs that cannot describe an iris are rejected before they reach a calculation or the design
+    store.
+    """
+
+    blade_count: int
+    aperture_inner_radius: float
+    aperture_outer_radius: float
+    blade_width: float
+    peg_radius: float
+    peg_clearance: float
+
+    _DECIMALS = 3  # Lengths are in mm, so designs are resolved to the micron
+
+    def __post_init__(self):
+        """
+        Raises:
+            ValueError: If the blade count is not a whole number of at least one, or a dimension is not a finite
+                value greater than zero once rounded
+        """
+        blade_count = float(self.blade_count)
+        if not blade_count.is_integer() or blade_count < 1:
+            raise ValueError("blade_count must be a whole number of at least 1")
+        object.__setattr__(self, "blade_count", int(blade_count))
+        for field in fields(self)[1:]:
+            value = float(getattr(self, field.name))
+            if not math.isfinite(value) or round(value, self._DECIMALS) <= 0:
+                raise ValueError(f"{field.name} must be finite and greater than 0")
+            object.__setattr__(self, field.name, round(value, self._DECIMALS))
+
+    @classmethod
+    def from_query(cls, query):
+        """Reads parameters from the query of an /iris request
+
+        Args:
+            query (QueryDict): Query parameters, with diameters rather than radii
+
+        Raises:
+            ValueError: If a parameter is not a number or is out of range
+            TypeError: If a parameter is missing
+
+        Returns:
+            IrisParameters: Canonical parameters
+        """
+        return cls(
+            float(query.get("bladeCount")),
+            float(query.get("minDiameter")) / 2,
+            float(query.get("maxDiameter")) / 2,
+            float(query.get("bladeWidth")),
+            float(query.get("pinRadius")),
+            float(query.get("pinClearance")),
+        )
+
+    def get_hash(self):
+        """Gets a stable hash of the parameters, identical across processes and restarts
+
+        Returns:
+            str: Hex digest
+        """
+        canonical = json.dumps(astuple(self), separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def build_iris(self, use_canonical_kinematics=True):
+        from iris_calculator.iris import Iris
+
+        return Iris(*astuple(self), use_canonical_kinematics=use_canonical_kinematics)
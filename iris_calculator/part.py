@@ -1,3 +1,4 @@
+import os
 from abc import abstractmethod
 
 from iris_calculator.dxf import DXF
@@ -12,12 +13,30 @@ class Part:
         self.shapes = []
 
     def save_dxf(self):
+        self.build_dxf().save(self._DXF_FILE_NAME)
+
+    def get_dxf_bytes(self):
+        """Writes a DXF of the part's shapes to memory
+
+        Returns:
+            bytes: Contents of the DXF file
+        """
+        return self.build_dxf().to_bytes()
+
+    def build_dxf(self):
         dxf = DXF()
+        self.add_to_dxf(dxf)
+        return dxf
+
+    def add_to_dxf(self, dxf, layer=None):
         for shape in self.shapes:
             if not shape.construction_line:
-                dxf.add_shape(shape)
+                dxf.add_shape(shape, layer)
 
-        dxf.save(self._DXF_FILE_NAME)
+    @property
+    def layer(self):
+        # Layers in assembly DXFs are named after the part's own DXF file
+        return os.path.splitext(self.file_name)[0]
 
     @abstractmethod
     def build_shapes(self, **kwargs):
@@ -0,0 +1,139 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import django
+from django.conf import settings
+
+
+class PoolSaturated(Exception):
+    """Raised when a computation is submitted to a compute pool with no free capacity"""
+
+    def __init__(self, retry_after):
+        """
+        Args:
+            retry_after (int): Seconds after which a client should retry
+        """
+        super().__init__(f"Compute pool saturated, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class ComputePool:
+    """Runs CPU-heavy computations in a bounded pool of worker processes, off the request thread and event loop
+
+    Worker processes are started on first use and kept for the lifetime of the server, so canonical kinematics
+    tables are built at most once per worker. If a worker dies, the broken pool is replaced on the next computation. Options are read from a dict in Django's settings:
+        MAX_WORKERS: Number of worker processes, None for one per CPU
+        MAX_QUEUED: Number of computations that may wait for a free worker before the pool is saturated
+        RETRY_AFTER: Seconds after which clients rejected by a saturated pool should retry
+        START_METHOD: Multiprocessing start method. Workers are spawned rather than forked from a threaded server.
+    """
+
+    _DEFAULT_OPTIONS = {
+        "MAX_WORKERS": None,
+        "MAX_QUEUED": 8,
+        "RETRY_AFTER": 5,
+        "START_METHOD": "spawn",
+    }
+
+    def __init__(self, setting="IRIS_COMPUTE_POOL"):
+        """
+        Args:
+            setting (str, optional): Name of the setting holding the pool's options. Defaults to "IRIS_COMPUTE_POOL".
+        """
+        self.setting = setting
+        self.in_flight = 0
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def options(self):
+        return {**self._DEFAULT_OPTIONS, **getattr(settings, self.setting, {})}
+
+    @property
+    def max_workers(self):
+        return self.options["MAX_WORKERS"] or os.cpu_count() or 1
+
+    @property
+    def capacity(self):
+        return self.max_workers + self.options["MAX_QUEUED"]
+
+    def get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    self.max_workers,
+                    mp_context=multiprocessing.get_context(
+                        self.options["START_METHOD"]
+                    ),
+                    initializer=_init_worker,
+                    initargs=(settings.SETTINGS_MODULE,),
+                )
+            return self._executor
+
+    async def run(self, fn, *args):
+        """Runs a computation in a worker process
+
+        Args:
+            fn (callable): Picklable, module level function
+            *args: Picklable arguments to fn
+
+        Raises:
+            PoolSaturated: If as many computations as the pool's capacity are already running or queued
+            BrokenProcessPool: If a worker process died, such as one killed for running out of memory. The pool is
+                replaced, so later computations run in new workers.
+
+        Returns:
+            object: Return value of fn
+        """
+        executor = self.get_executor()
+        with self._lock:
+            if self.in_flight >= self.capacity:
+                raise PoolSaturated(self.options["RETRY_AFTER"])
+            self.in_flight += 1
+
+        try:
+            future = executor.submit(fn, *args)
+        except BrokenProcessPool:
+            self._release()
+            self._discard(executor)
+            raise
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        try:
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            self._discard(executor)
+            raise
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def _discard(self, executor):
+        # Every computation pending in a broken pool fails, only the first to fail replaces it
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _release(self):
+        with self._lock:
+            self.in_flight -= 1
+
+
+def _init_worker(settings_module):
+    # Spawned workers start without Django configured, which serializers rely on
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    django.setup()
+
+
+compute_pool = ComputePool()
@@ -0,0 +1,143 @@
+import json
+import os
+import time
+import uuid
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+from django.conf import settings
+
+_DEFAULT_OPTIONS = {
+    "ENABLED": False,
+    "HEADER": "X-Iris-Profile",
+    "TOKEN": None,
+    "DIRECTORY": "profiles",
+}
+_STATS_SUFFIX = ".prof"
+_METADATA_SUFFIX = ".json"
+
+
+def get_options():
+    """Gets profiling options from the IRIS_PROFILING setting:
+    ENABLED: Whether requests may ask to be profiled at all
+    HEADER: Request header asking for a profile, and response header naming the profile captured
+    TOKEN: Value the request header must hold, None to accept any value
+    DIRECTORY: Directory profiles are stored in
+    """
+    return {**_DEFAULT_OPTIONS, **getattr(settings, "IRIS_PROFILING", {})}
+
+
+def get_requested_profile_id(request):
+    """Checks whether a request asks to be profiled and is allowed to be
+
+    Args:
+        request (HttpRequest): Request to /iris/calc or /iris/dxf
+
+    Returns:
+        str: Identifier of a new profile, None if the request is not to be profiled
+    """
+    options = get_options()
+    if not options["ENABLED"]:
+        return None
+    value = request.headers.get(options["HEADER"])
+    if value is None or (options["TOKEN"] is not None and value != options["TOKEN"]):
+        return None
+    return new_profile_id()
+
+
+def new_profile_id():
+    """
+    Returns:
+        str: Identifier of a new profile, ordered by the time it was taken
+    """
+    now = datetime.now(timezone.utc)
+    return f"{now:%Y%m%d-%H%M%S-%f}-{uuid.uuid4().hex[:8]}"
+
+
+def run_profiled(directory, profile_id, fn, parameters, *args):
+    """Runs a calculation under a deterministic profiler, storing the profile with the parameters it was run for
+
+    Args:
+        directory (str): Directory to store the profile in
+        profile_id (str): Identifier of the profile
+        fn (callable): fn(parameters, *args), a module level function
+        parameters (IrisParameters): Canonical parameters
+        *args: Further arguments to fn, stored with the parameters
+
+    Returns:
+        object: Return value of fn
+    """
+    import cProfile
+
+    profiler = cProfile.Profile()
+    created = datetime.now(timezone.utc)
+    start = time.perf_counter()
+    result = profiler.runcall(fn, parameters, *args)
+    seconds = time.perf_counter() - start
+
+    os.makedirs(directory, exist_ok=True)
+    profiler.dump_stats(os.path.join(directory, profile_id + _STATS_SUFFIX))
+    metadata = {
+        "id": profile_id,
+        "function": fn.__name__,
+        "parameters": asdict(parameters),
+        "arguments": list(args),
+        "created": created.isoformat(),
+        "seconds": seconds,
+    }
+    with open(os.path.join(directory, profile_id + _METADATA_SUFFIX), "w") as file:
+        json.dump(metadata, file, indent=4)
+    return result
+
+
+def list_profiles(directory):
+    """
+    Args:
+        directory (str): Directory profiles are stored in
+
+    Returns:
+        list: Metadata of each stored profile, oldest first by the time profiling started
+    """
+    if not os.path.isdir(directory):
+        return []
+    profiles = []
+    for name in os.listdir(directory):
+        if name.endswith(_METADATA_SUFFIX):
+            with open(os.path.join(directory, name)) as file:
+                profiles.append(json.load(file))
+    profiles.sort(key=lambda profile: datetime.fromisoformat(profile["created"]))
+    return profiles
+
+
+def get_hot_spots(directory, profile_id, limit=20, sort="tottime"):
+    """Summarises the functions a profile spent the most time in
+
+    Args:
+        directory (str): Directory profiles are stored in
+        profile_id (str): Identifier of the profile
+        limit (int, optional): Number of functions to summarise. Defaults to 20.
+        sort (str, optional): "tottime" to rank by time spent in each function itself, or "cumtime" to include the
+            functions it calls. Defaults to "tottime".
+
+    Raises:
+        FileNotFoundError: If there is no profile with the identifier
+
+    Returns:
+        list: Dicts of the function, its calls, and its own and cumulative seconds, hottest first
+    """
+    import pstats
+
+    stats = pstats.Stats(os.path.join(directory, profile_id + _STATS_SUFFIX))
+    hot_spots = [
+        {
+            "function": f"{os.path.basename(file_name)}:{line}({function})",
+            "calls": calls,
+            "tottime": tottime,
+            "cumtime": cumtime,
+        }
+        for (file_name, line, function), (_, calls, tottime, cumtime, _) in (
+            stats.stats.items()
+        )
+    ]
+    hot_spots.sort(key=lambda hot_spot: hot_spot[sort], reverse=True)
+    return hot_spots[:limit]
@@ -0,0 +1,122 @@
+import time
+
+import matplotlib.patches as patch
+import matplotlib.pyplot as plt
+import numpy as np
+
+
+class IrisRenderer:
+    _SLEEP_TIME = 0.0001
+    _COLOUR = "red"
+    _ENDLESS_DRAW = True
+    _FIGURE_SIZE = 10
+
+    def __init__(self, iris):
+        """Draws an iris with matplotlib, keeping figures out of the iris model
+
+        Args:
+            iris (Iris): Iris to draw
+        """
+        self.iris = iris
+        self.fig = None
+        self.axs = None
+
+    def open_figure(self):
+        if self.fig is None:
+            self.fig = plt.figure()
+            self.axs = self.fig.gca()
+            self.fig.set_size_inches(self._FIGURE_SIZE, self._FIGURE_SIZE)
+        return self.fig, self.axs
+
+    def close_figure(self):
+        if self.fig is not None:
+            plt.close(self.fig)
+        self.fig = None
+        self.axs = None
+
+    def draw_iris(self):
+        """Animates the iris opening and closing until the figure is closed"""
+        iris = self.iris
+        self.open_figure()
+        plt.show(block=False)
+        i = 0
+        multiplier = 1
+        # Every blade is drawn in every frame, so all rotated trajectories are built up front
+        blade_states = list(iris.blade_states)
+        act_ring_angle = blade_states[0][0].A.angle()
+
+        try:
+            while i < len(blade_states[0]):
+                rotation_angle = blade_states[0][i].C.angle()
+
+                self.axs.cla()
+                self.axs.set_title(
+                    f"Theta A: {blade_states[0][i].theta_a * 180 / np.pi} Bx: {iris.blades[0].calc_Bx(blade_states[0][i].theta_a )}"
+                )
+                for blade_index in range(len(iris.blades)):
+                    iris.blades[blade_index].build_shapes(
+                        blade_state=blade_states[blade_index][i]
+                    )
+                    iris.blades[blade_index].draw(
+                        self.axs, blade_states[blade_index][i]
+                    )
+
+                iris.base_plate.draw(self.axs, rotation_angle)
+                iris.actuator_ring.draw(self.axs, act_ring_angle)
+
+                self.axs.add_patch(
+                    patch.Circle(
+                        (0, 0),
+                        iris.aperture_outer_radius,
+                        color=self._COLOUR,
+                        fill=False,
+                    )
+                )
+
+                self.axs.add_patch(
+                    patch.Circle(
+                        (0, 0),
+                        iris.aperture_inner_radius,
+                        color=self._COLOUR,
+                        fill=False,
+                    )
+                )
+
+                self.axs.add_patch(
+                    patch.Circle((0, 0), 0.01, color=self._COLOUR, fill=True)
+                )
+
+                self.axs.axis(
+                    [
+                        -iris.aperture_outer_radius * 2.5,
+                        iris.aperture_outer_radius * 2.5,
+                        -iris.aperture_outer_radius * 2.5,
+                        iris.aperture_outer_radius * 2.5,
+                    ]
+                )
+                self.fig.canvas.draw()
+                self.fig.canvas.flush_events()
+                time.sleep(self._SLEEP_TIME)
+
+                i += 1 * multiplier
+
+                if self._ENDLESS_DRAW and i in [len(blade_states[0]) - 1, 0]:
+                    multiplier *= -1
+        finally:
+            self.close_figure()
+
+    def plot_bx(self):
+        """Plots the x position of point B against theta_a"""
+        theta_as = np.arange(200 / 180 * np.pi, 290 / 180 * np.pi, 0.01)
+        bxs = []
+        for theta_a in theta_as:
+            try:
+                bxs.append(self.iris.blades[0].calc_Bx(theta_a))
+            except:
+                bxs.append(0)
+        _, axs = self.open_figure()
+        try:
+            axs.plot(theta_as * 360 / 2 / np.pi, bxs)
+            plt.show()
+        finally:
+            self.close_figure()
@@ -24,3 +24,29 @@ class IrisSerializer(serializers.Serializer):
     slot_outer_radius = serializers.FloatField()
     a_coords = serializers.ListField()
     actuator_ring_angle = serializers.FloatField()
+
+
+def serialize_iris(iris):
+    """Serializes the results of an iris as returned by /iris/calc
+
+    Args:
+        iris (Iris): Iris to serialize
+
+    Returns:
+        dict: Serialized results
+    """
+    min_angle, max_angle = iris.get_actuator_rotation_range()
+    serializer = IrisSerializer(
+        {
+            "blade_radius": iris.blades[0].blade_radius,
+            "pinned_radius": iris.blades[0].pinned_radius,
+            "min_angle": min_angle,
+            "max_angle": max_angle,
+            "bc": iris.BC,
+            "slot_inner_radius": iris.actuator_ring.get_slot_inner_radius(),
+            "slot_outer_radius": iris.actuator_ring.get_slot_outer_radius(),
+            "a_coords": iris.get_A_coords(),
+            "actuator_ring_angle": iris.blade_states[0][0].A.angle(),
+        }
+    )
+    return dict(serializer.data)
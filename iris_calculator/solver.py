@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+_EPS = np.finfo(float).eps
+
+
+@dataclass
+class BatchResult:
+    x: np.ndarray
+    fun: np.ndarray
+    cost: np.ndarray
+    nfev: np.ndarray
+    njev: np.ndarray
+    status: np.ndarray
+
+    @property
+    def success(self):
+        return self.status > 0
+
+
+def batch_least_squares(
+    fun,
+    x0,
+    bounds,
+    args=(),
+    jac=None,
+    ftol=1e-10,
+    xtol=1e-10,
+    gtol=1e-10,
+    max_iter=200,
+):
+    """Solves many small, independent least squares problems at once with a bounded Levenberg-Marquardt method
+
+    Every problem keeps its own damping factor, so a slow problem never holds back the step taken by another. The
+    Jacobian is block-diagonal, so each iteration solves a stack of n x n systems in a single numpy call.
+
+    Args:
+        fun (callable): fun(x, *args) returning residuals of shape (k, m) for guesses x of shape (k, n)
+        x0 (array): Initial guesses of shape (N, n), or a single guess of shape (n,) used for every problem
+        bounds ((array, array)): Lower and upper bounds on each variable, broadcastable to (N, n)
+        args (tuple, optional): Per-problem arrays with a leading dimension of N, sliced alongside x. Defaults to ().
+        jac (callable, optional): jac(x, *args) returning Jacobians of shape (k, m, n). Defaults to forward differences.
+        ftol (float, optional): Tolerance on the relative reduction of the cost. Defaults to 1e-10.
+        xtol (float, optional): Tolerance on the relative change of x. Defaults to 1e-10.
+        gtol (float, optional): Tolerance on the gradient of the cost. Defaults to 1e-10.
+        max_iter (int, optional): Maximum number of iterations. Defaults to 200.
+
+    Returns:
+        BatchResult: Solutions and per-problem solver statistics, status follows scipy's least_squares convention
+    """
+    args = tuple(np.asarray(arg) for arg in args)
+    num_problems = len(args[0]) if args else len(np.atleast_2d(x0))
+    x = np.array(np.broadcast_to(x0, (num_problems, np.shape(x0)[-1])), dtype=float)
+    lower = np.broadcast_to(np.asarray(bounds[0], dtype=float), x.shape)
+    upper = np.broadcast_to(np.asarray(bounds[1], dtype=float), x.shape)
+    x = np.clip(x, lower, upper)
+
+    f = np.asarray(fun(x, *args), dtype=float)
+    cost = 0.5 * np.sum(f**2, axis=1)
+    damping = np.full(num_problems, 1e-3)
+    nfev = np.ones(num_problems, dtype=int)
+    njev = np.zeros(num_problems, dtype=int)
+    status = np.zeros(num_problems, dtype=int)
+    identity = np.eye(x.shape[1])
+
+    for _ in range(max_iter):
+        active = np.flatnonzero(status == 0)
+        if len(active) == 0:
+            break
+
+        x_a, f_a, lower_a, upper_a = x[active], f[active], lower[active], upper[active]
+        args_a = tuple(arg[active] for arg in args)
+        if jac is None:
+            J = _forward_difference_jac(fun, x_a, f_a, upper_a, args_a)
+            nfev[active] += x.shape[1]
+        else:
+            J = np.asarray(jac(x_a, *args_a), dtype=float)
+        njev[active] += 1
+
+        g = np.einsum("kmi,km->ki", J, f_a)
+
+        # Variables held against a bound by the gradient are removed from the step
+        fixed = ((x_a <= lower_a) & (g > 0)) | ((x_a >= upper_a) & (g < 0))
+        J = np.where(fixed[:, None, :], 0, J)
+        g = np.where(fixed, 0, g)
+
+        converged = np.max(np.abs(g), axis=1) < gtol
+        status[active[converged]] = 1
+
+        JtJ = np.einsum("kmi,kmj->kij", J, J)
+        largest_curvature = np.maximum(np.max(np.einsum("kii->ki", JtJ), axis=1), _EPS)
+        A = JtJ + identity * (damping[active] * largest_curvature)[:, None, None]
+        A = A + identity * fixed[:, None, :]
+        step = -np.linalg.solve(A, g[..., None])[..., 0]
+
+        x_new = np.clip(x_a + step, lower_a, upper_a)
+        f_new = np.asarray(fun(x_new, *args_a), dtype=float)
+        nfev[active] += 1
+        cost_new = 0.5 * np.sum(f_new**2, axis=1)
+
+        accepted = np.isfinite(cost_new) & (cost_new < cost[active]) & ~converged
+        rejected = ~accepted & ~converged
+        index = active[accepted]
+
+        f_tolerance = cost[index] - cost_new[accepted] <= ftol * cost[index]
+        x_tolerance = np.linalg.norm(
+            x_new[accepted] - x_a[accepted], axis=1
+        ) <= xtol * (xtol + np.linalg.norm(x_a[accepted], axis=1))
+
+        # Tiny steps taken while heavily damped say nothing about convergence
+        undamped = damping[index] < 1
+        f_tolerance &= undamped
+        x_tolerance &= undamped
+
+        x[index], f[index], cost[index] = (
+            x_new[accepted],
+            f_new[accepted],
+            cost_new[accepted],
+        )
+        damping[index] /= 3
+        damping[active[rejected]] *= 4
+
+        status[index[x_tolerance]] = 3
+        status[index[f_tolerance]] = 2
+        # No step reduces the cost any further, the problem sits at a (possibly bounded) minimum
+        status[active[rejected][damping[active[rejected]] > 1e12]] = 2
+
+    return BatchResult(x, f, cost, nfev, njev, status)
+
+
+def _forward_difference_jac(fun, x, f, upper, args):
+    J = np.empty((x.shape[0], f.shape[1], x.shape[1]))
+    h = _EPS**0.5 * np.maximum(1, np.abs(x))
+    # Step backwards from the upper bound so that residuals are never evaluated out of bounds
+    h = np.where(x + h > upper, -h, h)
+    for i in range(x.shape[1]):
+        x_step = x.copy()
+        x_step[:, i] += h[:, i]
+        J[:, :, i] = (np.asarray(fun(x_step, *args)) - f) / h[:, i, None]
+    return J
@@ -0,0 +1,261 @@
+import csv
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, fields
+
+import numpy as np
+
+from iris_calculator.parameters import IrisParameters
+
+PARAMETER_COLUMNS = [field.name for field in fields(IrisParameters)]
+RESULT_COLUMNS = [
+    "pinned_radius",
+    "blade_radius",
+    "bc",
+    "min_angle",
+    "max_angle",
+    "slot_inner_radius",
+    "slot_outer_radius",
+    "solver_nfev",
+    "solver_failures",
+    "inf_fallbacks",
+]
+COLUMNS = PARAMETER_COLUMNS + RESULT_COLUMNS + ["failed", "error"]
+
+
+def get_grid_samples(values):
+    """Gets every combination of parameter values
+
+    Args:
+        values (dict): Lists of values keyed by IrisParameters field name, with every field given
+
+    Raises:
+        ValueError: If a field is missing or has no values, or a value is not a valid parameter
+
+    Returns:
+        list: IrisParameters for each combination, without duplicates
+    """
+    _check_fields(values)
+    for name in PARAMETER_COLUMNS:
+        if not len(values[name]):
+            raise ValueError(f"{name} must have at least one value")
+    return list(
+        dict.fromkeys(
+            IrisParameters(*combination)
+            for combination in itertools.product(
+                *[values[name] for name in PARAMETER_COLUMNS]
+            )
+        )
+    )
+
+
+def get_latin_hypercube_samples(bounds, sample_count, seed=None):
+    """Samples parameters with a Latin hypercube, spreading samples evenly across the range of every parameter
+
+    Args:
+        bounds (dict): (lower, upper) bounds keyed by IrisParameters field name, with every field given. Blade counts
+            are rounded to the nearest integer, so each count within the bounds is sampled equally often.
+        sample_count (int): Number of samples
+        seed (int, optional): Seed for repeatable samples. Defaults to None.
+
+    Raises:
+        ValueError: If a field is missing, a bound is not a valid parameter, or a lower bound exceeds its upper bound
+
+    Returns:
+        list: IrisParameters for each sample
+    """
+    from scipy.stats import qmc
+
+    _check_fields(bounds)
+    lower, upper = np.array([bounds[name] for name in PARAMETER_COLUMNS], float).T
+    # Checked up front, so that a bad bound fails the sweep rather than some of its samples
+    IrisParameters(*lower.tolist())
+    IrisParameters(*upper.tolist())
+    for name, low, high in zip(PARAMETER_COLUMNS, lower, upper):
+        if low > high:
+            raise ValueError(f"{name} lower bound must not exceed its upper bound")
+    # Widened so that rounding gives the end blade counts as much weight as the others
+    lower[0] -= 0.5 - 1e-9
+    upper[0] += 0.5 - 1e-9
+    unit_samples = qmc.LatinHypercube(len(PARAMETER_COLUMNS), seed=seed).random(
+        sample_count
+    )
+    # Scaled directly rather than with qmc.scale, which rejects parameters held at a single value
+    samples = lower + unit_samples * (upper - lower)
+    samples[:, 0] = np.round(samples[:, 0])
+    return [IrisParameters(*sample) for sample in samples.tolist()]
+
+
+def evaluate_design(parameters, use_canonical_kinematics=True):
+    """Calculates an iris and the properties of interest when sizing it
+
+    Args:
+        parameters (IrisParameters): Canonical parameters
+        use_canonical_kinematics (bool, optional): Whether blade kinematics are rescaled from the canonical table
+            rather than solved, in which case the solver columns are zero. Defaults to True.
+
+    Returns:
+        dict: Row of the results table, with failed set and results of NaN if the iris could not be calculated for
+            any reason, so that one design never stops a sweep
+    """
+    row = {**asdict(parameters), "failed": False, "error": ""}
+    try:
+        iris = parameters.build_iris(use_canonical_kinematics)
+        min_angle, max_angle = iris.get_actuator_rotation_range()
+        row.update(
+            pinned_radius=iris.pinned_radius,
+            blade_radius=iris.blades[0].blade_radius,
+            bc=iris.BC,
+            min_angle=min_angle,
+            max_angle=max_angle,
+            slot_inner_radius=iris.actuator_ring.get_slot_inner_radius(),
+            slot_outer_radius=iris.actuator_ring.get_slot_outer_radius(),
+        )
+        telemetry = iris.get_solver_telemetry()
+        row.update(
+            solver_nfev=telemetry.nfev,
+            solver_failures=telemetry.failures,
+            inf_fallbacks=telemetry.inf_fallbacks,
+        )
+    except Exception as error:
+        row.update({column: float("nan") for column in RESULT_COLUMNS})
+        row.update(failed=True, error=f"{type(error).__name__}: {error}")
+    return row
+
+
+def _check_fields(mapping):
+    missing = [name for name in PARAMETER_COLUMNS if name not in mapping]
+    if missing:
+        raise ValueError(f"Missing parameters: {', '.join(missing)}")
+
+
+def evaluate_solved_design(parameters):
+    """Calculates an iris as evaluate_design does, solving its blade kinematics so that the solver columns show the
+    designs that are expensive or troublesome to solve
+    """
+    return evaluate_design(parameters, use_canonical_kinematics=False)
+
+
+class Sweep:
+    """Evaluates many designs across a pool of worker processes, writing a table of results
+
+    Each evaluated design is appended to a checkpoint file as it completes. A sweep that is interrupted and run again
+    with the same checkpoint only evaluates the designs that are missing from it.
+    """
+
+    _CHECKPOINT_SUFFIX = ".checkpoint.jsonl"
+
+    def __init__(
+        self,
+        samples,
+        output_path,
+        checkpoint_path=None,
+        max_workers=None,
+        evaluate=evaluate_design,
+    ):
+        """
+        Args:
+            samples (list): IrisParameters of each design
+            output_path (str): Path of the results table, written as CSV unless it ends in .npz
+            checkpoint_path (str, optional): Path of the checkpoint. Defaults to the output path with
+                _CHECKPOINT_SUFFIX appended.
+            max_workers (int, optional): Number of worker processes, 1 to evaluate in this process. Defaults to None,
+                one per CPU.
+            evaluate (callable, optional): Picklable, module level function returning a row for an IrisParameters.
+                Defaults to evaluate_design.
+        """
+        self.samples = list(dict.fromkeys(samples))
+        self.output_path = output_path
+        self.checkpoint_path = checkpoint_path or output_path + self._CHECKPOINT_SUFFIX
+        self.max_workers = max_workers
+        self.evaluate = evaluate
+
+    def load_checkpoint(self):
+        """
+        Returns:
+            dict: Rows of evaluated designs keyed by parameter hash
+        """
+        rows = {}
+        if not os.path.exists(self.checkpoint_path):
+            return rows
+        with open(self.checkpoint_path) as file:
+            for line in file:
+                # A line cut short by an interruption is evaluated again
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    continue
+                parameters = IrisParameters(*[row[name] for name in PARAMETER_COLUMNS])
+                rows[parameters.get_hash()] = row
+        return rows
+
+    def run(self, progress=None):
+        """Evaluates every design missing from the checkpoint, then writes the results table
+
+        Args:
+            progress (callable, optional): progress(completed, total) called as each design completes. Defaults to
+                None.
+
+        Returns:
+            list: Rows of the results table in the order of the samples
+        """
+        rows = self.load_checkpoint()
+        remaining = [p for p in self.samples if p.get_hash() not in rows]
+        completed = len(self.samples) - len(remaining)
+
+        with open(self.checkpoint_path, "a") as checkpoint:
+            for parameters, row in self._evaluate(remaining):
+                rows[parameters.get_hash()] = row
+                checkpoint.write(json.dumps(row) + "\n")
+                checkpoint.flush()
+                completed += 1
+                if progress is not None:
+                    progress(completed, len(self.samples))
+
+        table = [rows[parameters.get_hash()] for parameters in self.samples]
+        write_table(table, self.output_path)
+        return table
+
+    def _evaluate(self, samples):
+        # Yields (parameters, row) pairs as designs complete
+        if self.max_workers == 1:
+            for parameters in samples:
+                yield parameters, self.evaluate(parameters)
+            return
+
+        with ProcessPoolExecutor(self.max_workers) as executor:
+            futures = {
+                executor.submit(self.evaluate, parameters): parameters
+                for parameters in samples
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+
+def write_table(rows, path):
+    """Writes rows of results as a CSV file, or as a NumPy .npz archive of columns if the path ends in .npz
+
+    Args:
+        rows (list): Rows with a value for each of COLUMNS
+        path (str): Path of the table
+    """
+    if path.endswith(".npz"):
+        columns = {column: [row[column] for row in rows] for column in COLUMNS}
+        np.savez(
+            path,
+            **{
+                column: np.array(
+                    values,
+                    dtype=int if column == "blade_count" else None,
+                )
+                for column, values in columns.items()
+            },
+        )
+        return
+
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
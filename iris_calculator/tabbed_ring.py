@@ -1,5 +1,3 @@
-import math
-
 import numpy as np
 
 import iris_calculator.geometry as geometry
@@ -50,30 +48,22 @@ class TabbedRing(Part):
         return self.shapes
 
     def get_handle_coords(self, tab_angle, rotation_angle):
-        c_1 = Coordinate(
-            self.outer_radius * math.cos(rotation_angle - tab_angle / 2),
-            self.outer_radius * math.sin(rotation_angle - tab_angle / 2),
-        )
-        c_2 = Coordinate(
-            self.outer_radius * math.cos(rotation_angle + tab_angle / 2),
-            self.outer_radius * math.sin(rotation_angle + tab_angle / 2),
-        )
-        c_3 = Coordinate(
-            (self.outer_radius + self.tab_height)
-            * math.cos(rotation_angle - tab_angle / 2),
-            (self.outer_radius + self.tab_height)
-            * math.sin(rotation_angle - tab_angle / 2),
+        angles = np.array(
+            (rotation_angle - tab_angle / 2, rotation_angle + tab_angle / 2)
         )
-        c_4 = Coordinate(
-            (self.outer_radius + self.tab_height)
-            * math.cos(rotation_angle + tab_angle / 2),
-            (self.outer_radius + self.tab_height)
-            * math.sin(rotation_angle + tab_angle / 2),
+        radii = np.array((self.outer_radius, self.outer_radius + self.tab_height))
+        # Rows of c_1, c_2, c_3, c_4
+        corners = (
+            radii[:, None, None]
+            * np.stack((np.cos(angles), np.sin(angles)), axis=-1)[None]
+        ).reshape(4, 2)
+        c_5 = (corners[2] + corners[3]) / 2
+        c_6 = geometry.midpoint_normal_batch(
+            corners[2], corners[3], np.linalg.norm(corners[2] - corners[3]) / 2
         )
-        c_5 = c_4.linterp(c_3, 0.5)
-        c_6 = c_3.midpoint_normal(c_4, c_3.distance_to(c_4) / 2)
 
-        return {1: c_1, 2: c_2, 3: c_3, 4: c_4, 5: c_5, 6: c_6}
+        coords = [*corners, c_5, c_6]
+        return {i + 1: Coordinate.from_array(coord) for i, coord in enumerate(coords)}
 
     def draw(self, axs, rotation_angle=0):
         self.build_shapes(rotation_angle=rotation_angle)
@@ -0,0 +1,132 @@
+import contextlib
+import contextvars
+from collections import Counter
+from dataclasses import dataclass, field
+
+_collector = contextvars.ContextVar("iris_solver_telemetry", default=None)
+
+
+@dataclass
+class SolverStats:
+    """Totals over every call to one solver"""
+
+    calls: int = 0
+    problems: int = 0
+    nfev: int = 0
+    failures: int = 0
+    max_cost: float = 0.0
+    statuses: Counter = field(default_factory=Counter)
+
+    def merge(self, other):
+        self.calls += other.calls
+        self.problems += other.problems
+        self.nfev += other.nfev
+        self.failures += other.failures
+        self.max_cost = max(self.max_cost, other.max_cost)
+        self.statuses.update(other.statuses)
+
+    def as_dict(self):
+        return {
+            "calls": self.calls,
+            "problems": self.problems,
+            "nfev": self.nfev,
+            "failures": self.failures,
+            "max_cost": self.max_cost,
+            "statuses": {str(status): count for status, count in self.statuses.items()},
+        }
+
+
+class SolverTelemetry:
+    """Function evaluations, final costs and statuses of solves, kept per solver
+
+    Also counts evaluations of the closed-loop equations that fell back to inf because the angle at point B was
+    undefined.
+    """
+
+    def __init__(self):
+        self.solvers = {}
+        self.inf_fallbacks = 0
+
+    def record(self, solver, nfev, status, cost=None, success=True):
+        """Records a single solve
+
+        Args:
+            solver (str): Name of the solver, such as "least_squares"
+            nfev (int): Number of function evaluations
+            status (int): Status reported by the solver
+            cost (float, optional): Final cost. Defaults to None, for solvers without one.
+            success (bool, optional): Whether the solver converged. Defaults to True.
+        """
+        stats = self.solvers.setdefault(solver, SolverStats())
+        stats.calls += 1
+        stats.problems += 1
+        stats.nfev += int(nfev)
+        stats.failures += not success
+        if cost is not None:
+            stats.max_cost = max(stats.max_cost, float(cost))
+        stats.statuses[int(status)] += 1
+
+    def record_batch(self, solver, result):
+        """Records a batch of solves
+
+        Args:
+            solver (str): Name of the solver, such as "batch_least_squares"
+            result (BatchResult): Result of the batch
+        """
+        stats = self.solvers.setdefault(solver, SolverStats())
+        stats.calls += 1
+        stats.problems += len(result.nfev)
+        stats.nfev += int(result.nfev.sum())
+        stats.failures += int((~result.success).sum())
+        if len(result.cost):
+            stats.max_cost = max(stats.max_cost, float(result.cost.max()))
+        stats.statuses.update(result.status.tolist())
+
+    def merge(self, other):
+        for solver, stats in other.solvers.items():
+            self.solvers.setdefault(solver, SolverStats()).merge(stats)
+        self.inf_fallbacks += other.inf_fallbacks
+
+    @property
+    def nfev(self):
+        return sum(stats.nfev for stats in self.solvers.values())
+
+    @property
+    def failures(self):
+        return sum(stats.failures for stats in self.solvers.values())
+
+    def as_dict(self):
+        return {
+            "nfev": self.nfev,
+            "failures": self.failures,
+            "inf_fallbacks": self.inf_fallbacks,
+            "solvers": {
+                solver: stats.as_dict() for solver, stats in self.solvers.items()
+            },
+        }
+
+
+@contextlib.contextmanager
+def collect_solver_telemetry():
+    """Collects the solver telemetry of every iris and kinematics table built within the enclosed block
+
+    Yields:
+        SolverTelemetry: Telemetry totalled over the block
+    """
+    telemetry = SolverTelemetry()
+    token = _collector.set(telemetry)
+    try:
+        yield telemetry
+    finally:
+        _collector.reset(token)
+
+
+def record_solver_telemetry(telemetry):
+    """Adds telemetry to the collector of the current context, doing nothing if telemetry is not being collected
+
+    Args:
+        telemetry (SolverTelemetry): Telemetry to add
+    """
+    collector = _collector.get()
+    if collector is not None:
+        collector.merge(telemetry)
@@ -0,0 +1,89 @@
+import contextlib
+import contextvars
+import time
+
+_NULL_STAGE = contextlib.nullcontext()
+_timer = contextvars.ContextVar("iris_stage_timer", default=None)
+
+
+class StageTimer:
+    """Totals the time spent in named stages of a calculation
+
+    Stages entered more than once, such as a stage run for every blade, are summed.
+    """
+
+    def __init__(self):
+        self.stages = {}
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def merge(self, stages):
+        """
+        Args:
+            stages (dict): Seconds keyed by stage name, as collected by another timer
+        """
+        for name, seconds in stages.items():
+            self.add(name, seconds)
+
+    def get_server_timing(self):
+        """
+        Returns:
+            str: Value of a Server-Timing header, with durations in milliseconds
+        """
+        return ", ".join(
+            f"{name};dur={seconds * 1e3:.3f}" for name, seconds in self.stages.items()
+        )
+
+
+def stage(name):
+    """Times a stage with the timer of the current context, doing nothing if timing is not enabled
+
+    Args:
+        name (str): Name of the stage, a token as allowed in a Server-Timing header
+
+    Returns:
+        context manager: Times the enclosed block
+    """
+    timer = _timer.get()
+    if timer is None:
+        return _NULL_STAGE
+    return timer.stage(name)
+
+
+def get_timer():
+    """
+    Returns:
+        StageTimer: Timer of the current context, None if timing is not enabled
+    """
+    return _timer.get()
+
+
+@contextlib.contextmanager
+def collect_stages(enabled=True):
+    """Enables timing of stages within the enclosed block
+
+    Args:
+        enabled (bool, optional): Whether to time stages. Defaults to True.
+
+    Yields:
+        StageTimer: Timer collecting the stages, None if not enabled
+    """
+    if not enabled:
+        yield None
+        return
+
+    timer = StageTimer()
+    token = _timer.set(timer)
+    try:
+        yield timer
+    finally:
+        _timer.reset(token)
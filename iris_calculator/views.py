@@ -1,59 +1,502 @@
-from django.contrib.auth.models import Group, User
-from django.http.response import HttpResponse
-from rest_framework import permissions
-from rest_framework import views as REST_Views
-from rest_framework import viewsets
-from rest_framework.response import Response
+import asyncio
+import functools
+import json
+import logging
+import math
+import os
+from dataclasses import asdict
 
-from iris_calculator.iris import Iris
-from iris_calculator.serializers import GroupSerializer, IrisSerializer, UserSerializer
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http.response import HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response
+from django.views import View
 
-# Create your views here.
+from iris_calculator import metrics, profiling
+from iris_calculator.cache import dxf_archives, get_etag, iris_results
+from iris_calculator.models import IrisDesign
+from iris_calculator.parameters import IrisParameters
+from iris_calculator.pool import PoolSaturated, compute_pool
+from iris_calculator.telemetry import collect_solver_telemetry
+from iris_calculator.timing import collect_stages, get_timer, stage
+from iris_calculator.serializers import serialize_iris
 
+logger = logging.getLogger(__name__)
 
-class IrisView(REST_Views.APIView):
-    def get(self, request):
-        print("Recieved Request:")
-        print(request.data)
-        iris = Iris(
-            int(request.GET.get("bladeCount")),
-            float(request.GET.get("minDiameter")) / 2,
-            float(request.GET.get("maxDiameter")) / 2,
-            float(request.GET.get("bladeWidth")),
-            float(request.GET.get("pinRadius")),
-            float(request.GET.get("pinClearance")),
+
+class IrisView(View):
+    """Calculates an iris, served from the result cache or design store where possible
+
+    Views are asynchronous so that, under ASGI, calculations run in the compute pool without holding a worker, and
+    cached designs are answered while other designs are being calculated.
+    """
+
+    _CACHE_HEADER = "X-Cache"
+
+    @metrics.track_requests("IrisView")
+    async def get(self, request):
+        try:
+            parameters = IrisParameters.from_query(request.GET)
+        except (TypeError, ValueError) as error:
+            return get_invalid_parameters_response(error)
+
+        profile_id = profiling.get_requested_profile_id(request)
+        with collect_stages(settings.IRIS_SERVER_TIMING) as timer:
+            try:
+                if profile_id is None:
+                    results, hit = await get_iris_results(parameters)
+                else:
+                    # Profiled requests are always calculated, so that the profile is of the calculation
+                    results = await run_in_pool(
+                        calc_iris_results, parameters, profile_id=profile_id
+                    )
+                    hit = False
+            except PoolSaturated as error:
+                return finish_request(
+                    get_saturated_response(error), parameters, None, timer
+                )
+            except (TypeError, ValueError) as error:
+                # Designs that pass validation may still have no iris, such as apertures beyond the blade's reach
+                return finish_request(
+                    get_invalid_parameters_response(error), parameters, None, timer
+                )
+
+            with stage("render"):
+                response = JsonResponse(results)
+        response[self._CACHE_HEADER] = "HIT" if hit else "MISS"
+        return finish_request(response, parameters, hit, timer, profile_id)
+
+
+async def get_iris_results(parameters):
+    """Gets results for a design from the result cache, the design store, or the compute pool, in that order
+
+    Only precompute_designs writes to the design store, calculated results are kept in the bounded result cache.
+
+    Args:
+        parameters (IrisParameters): Canonical parameters
+
+    Raises:
+        PoolSaturated: If the results must be calculated and the compute pool is saturated
+
+    Returns:
+        (dict, bool): Serialized results, and whether they were found in the result cache
+    """
+    results = iris_results.get(parameters)
+    if results is not None:
+        return results, True
+
+    with stage("store_get"):
+        results = await sync_to_async(IrisDesign.objects.get_results)(parameters)
+    if results is None:
+        results = await run_in_pool(calc_iris_results, parameters)
+    iris_results.set(parameters, results)
+    return results, False
+
+
+def calc_iris_results(parameters):
+    """Builds an iris and serializes its results
+
+    Args:
+        parameters (IrisParameters): Canonical parameters
+
+    Returns:
+        dict: Serialized results
+    """
+    iris = parameters.build_iris()
+    with stage("serialize"):
+        return serialize_iris(iris)
+
+
+class BatchView(View):
+    """Calculates a batch of irises in parallel, answering with results or an error for each design
+
+    Requests are JSON objects with a "designs" list, each design holding the query parameters of an /iris/calc request.
+    Designs that share canonical parameters are calculated once. Options are read from the IRIS_BATCH setting:
+        MAX_DESIGNS: Largest number of designs accepted in a batch
+        MAX_CONCURRENCY: Largest number of designs of a batch calculated at once
+    """
+
+    _DEFAULT_OPTIONS = {"MAX_DESIGNS": 100, "MAX_CONCURRENCY": 4}
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Batches are posted by tooling rather than forms, so they are exempt from CSRF checks like other API views
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+    @property
+    def options(self):
+        return {**self._DEFAULT_OPTIONS, **getattr(settings, "IRIS_BATCH", {})}
+
+    async def post(self, request):
+        try:
+            designs = json.loads(request.body)["designs"]
+        except (ValueError, KeyError, TypeError):
+            return JsonResponse(
+                {"detail": 'Expected a JSON object with a "designs" list'}, status=400
+            )
+        if not isinstance(designs, list):
+            return JsonResponse({"detail": '"designs" must be a list'}, status=400)
+        if len(designs) > self.options["MAX_DESIGNS"]:
+            return JsonResponse(
+                {
+                    "detail": f"Batches are limited to {self.options['MAX_DESIGNS']} designs"
+                },
+                status=400,
+            )
+
+        parameters = [get_batch_parameters(design) for design in designs]
+        semaphore = asyncio.Semaphore(self.options["MAX_CONCURRENCY"])
+        unique_parameters = list(
+            dict.fromkeys(p for p in parameters if isinstance(p, IrisParameters))
+        )
+        unique_results = await asyncio.gather(
+            *[
+                get_batch_results(design_parameters, semaphore)
+                for design_parameters in unique_parameters
+            ]
         )
-        a_coords = iris.get_A_coords()
-        iris = IrisSerializer(
+        results = dict(zip(unique_parameters, unique_results))
+
+        return JsonResponse(
             {
-                "blade_radius": iris.blades[0].blade_radius,
-                "pinned_radius": iris.blades[0].pinned_radius,
-                "min_angle": iris.get_actuator_rotation_range()[0],
-                "max_angle": iris.get_actuator_rotation_range()[1],
-                "bc": iris.BC,
-                "slot_inner_radius": iris.actuator_ring.get_slot_inner_radius(),
-                "slot_outer_radius": iris.actuator_ring.get_slot_outer_radius(),
-                "a_coords": a_coords,
-                "actuator_ring_angle": iris.blade_states[0][0].A.angle(),
+                "results": [
+                    results[p] if isinstance(p, IrisParameters) else p
+                    for p in parameters
+                ]
             }
         )
-        results = iris.data
-        return Response(results)
 
 
-class DXFView(REST_Views.APIView):
+def get_batch_parameters(design):
+    """
+    Args:
+        design (dict): Query parameters of an /iris/calc request
+
+    Returns:
+        IrisParameters or dict: Canonical parameters, or an error item if the design is invalid
+    """
+    try:
+        return IrisParameters.from_query(design)
+    except (AttributeError, TypeError, ValueError) as error:
+        return {"error": describe_invalid_parameters(error)}
+
+
+def describe_invalid_parameters(error):
+    """
+    Args:
+        error (Exception): Error reading design parameters or building an iris from them
+
+    Returns:
+        str: Message for the client, only detailing the ValueErrors of validation
+    """
+    if isinstance(error, ValueError):
+        return f"Invalid design parameters: {error}"
+    return "Invalid design parameters, each must be given as a number"
+
+
+def get_invalid_parameters_response(error):
+    return JsonResponse({"error": describe_invalid_parameters(error)}, status=400)
+
+
+async def get_batch_results(parameters, semaphore):
+    """Gets results for a design of a batch, sharing the caches, design store and compute pool with other requests
+
+    Args:
+        parameters (IrisParameters): Canonical parameters
+        semaphore (asyncio.Semaphore): Bounds the number of designs of the batch calculated at once
+
+    Returns:
+        dict: Item holding serialized results and whether they were cached, or an error. A design that fails is
+            answered with an error item rather than failing the rest of the batch.
+    """
+    async with semaphore:
+        try:
+            results, hit = await get_iris_results(parameters)
+        except PoolSaturated as error:
+            return {"error": str(error), "retry_after": error.retry_after}
+        except ValueError as error:
+            return {"error": str(error)}
+        except Exception as error:
+            logger.exception(
+                "Failed to calculate batch design",
+                extra={"parameters": asdict(parameters)},
+            )
+            return {"error": f"Calculation failed: {type(error).__name__}"}
+    return {"result": results, "cached": hit}
+
+
+class DXFView(View):
+    """Serves DXFs of an iris
+
+    With a mode of "parts", the default, a zip archive holds a DXF of each part. With a mode of "assembly", a single
+    DXF holds the assembled iris, drawn at the actuatorAngle in radians given in the query, within the range of
+    min_angle to max_angle of /iris/calc results, or open if none is given.
+    """
+
+    _CACHE_HEADER = "X-Cache"
+    _MODES = ("parts", "assembly")
+
+    @metrics.track_requests("DXFView")
+    async def get(self, request):
+        try:
+            parameters = IrisParameters.from_query(request.GET)
+        except (TypeError, ValueError) as error:
+            return get_invalid_parameters_response(error)
+        mode = request.GET.get("mode", "parts")
+        if mode not in self._MODES:
+            return JsonResponse(
+                {"error": f"mode must be one of {', '.join(self._MODES)}"}, status=400
+            )
+        actuator_angle = None
+        if mode == "assembly" and "actuatorAngle" in request.GET:
+            try:
+                actuator_angle = get_actuator_angle(request.GET["actuatorAngle"])
+            except ValueError as error:
+                return JsonResponse({"error": str(error)}, status=400)
+
+        variant = None if mode == "parts" else get_assembly_variant(actuator_angle)
+        etag = get_etag(parameters, variant)
+        profile_id = profiling.get_requested_profile_id(request)
+        # Clients holding the current DXFs are answered with 304 Not Modified before anything is fetched or built,
+        # unless the request is to be profiled
+        if profile_id is None:
+            response = get_conditional_response(request, etag=etag)
+            if response is not None:
+                response["ETag"] = etag
+                return finish_request(response, parameters, None, None)
+
+        with collect_stages(settings.IRIS_SERVER_TIMING) as timer:
+            try:
+                if mode == "assembly":
+                    content, hit = await get_assembly_dxf(
+                        parameters, actuator_angle, profile_id
+                    )
+                elif profile_id is None:
+                    content, hit = await get_dxf_archive(parameters)
+                else:
+                    content = await run_in_pool(
+                        calc_dxf_archive, parameters, profile_id=profile_id
+                    )
+                    hit = False
+            except PoolSaturated as error:
+                return finish_request(
+                    get_saturated_response(error), parameters, None, timer
+                )
+            except (TypeError, ValueError) as error:
+                return finish_request(
+                    get_invalid_parameters_response(error), parameters, None, timer
+                )
+
+        if mode == "assembly":
+            response = HttpResponse(content, content_type="application/dxf")
+            response["Content-Disposition"] = "attachment; filename=assembly.dxf"
+        else:
+            response = HttpResponse(content, content_type="application/zip")
+            response["Content-Disposition"] = "attachment; filename=name.zip"
+        response["ETag"] = etag
+        response[self._CACHE_HEADER] = "HIT" if hit else "MISS"
+        return finish_request(response, parameters, hit, timer, profile_id)
+
+
+async def get_dxf_archive(parameters):
+    """Gets the DXF archive for a design from the archive cache, the design store, or the compute pool, in that order
+
+    Only precompute_designs writes to the design store, built archives are kept in the bounded archive cache.
+
+    Args:
+        parameters (IrisParameters): Canonical parameters
+
+    Raises:
+        PoolSaturated: If the archive must be built and the compute pool is saturated
+
+    Returns:
+        (bytes, bool): Zip archive of DXFs, and whether it was found in the archive cache
+    """
+    dxf_archive = dxf_archives.get(parameters)
+    if dxf_archive is not None:
+        return dxf_archive, True
+
+    with stage("store_get"):
+        dxf_archive = await sync_to_async(IrisDesign.objects.get_dxf_archive)(
+            parameters
+        )
+    if dxf_archive is None:
+        dxf_archive = await run_in_pool(calc_dxf_archive, parameters)
+    dxf_archives.set(parameters, dxf_archive)
+    return dxf_archive, False
+
+
+def get_actuator_angle(value):
+    """Reads the actuator angle of an assembly DXF request
+
+    Angles are rounded to the milliradian, so that requests for nearly the same angle share the cached assembly.
+
+    Args:
+        value (str): actuatorAngle query parameter in radians
+
+    Raises:
+        ValueError: If the angle is not a finite number
+
+    Returns:
+        float: Rounded angle in radians
+    """
+    angle = float(value)
+    if not math.isfinite(angle):
+        raise ValueError("actuatorAngle must be a finite number of radians")
+    return round(angle, 3) + 0.0
+
+
+async def get_assembly_dxf(parameters, actuator_angle, profile_id=None):
+    """Gets the assembly DXF for a design from the archive cache, or the compute pool
+
+    Assemblies are not kept in the design store, only the parts of precomputed designs are.
+
+    Args:
+        parameters (IrisParameters): Canonical parameters
+        actuator_angle (float): Rounded actuator angle in radians, None for the open iris
+        profile_id (str, optional): Identifier to store a profile of the build under, in which case the cache is
+            bypassed. Defaults to None.
+
+    Raises:
+        PoolSaturated: If the DXF must be built and the compute pool is saturated
+
+    Returns:
+        (bytes, bool): Contents of the DXF, and whether they were found in the archive cache
+    """
+    variant = get_assembly_variant(actuator_angle)
+    if profile_id is None:
+        content = dxf_archives.get(parameters, variant)
+        if content is not None:
+            return content, True
+
+    content = await run_in_pool(
+        calc_assembly_dxf, parameters, actuator_angle, profile_id=profile_id
+    )
+    dxf_archives.set(parameters, content, variant)
+    return content, False
+
+
+def get_assembly_variant(actuator_angle):
+    # Assemblies are cached and tagged apart from the parts of their design, and from each other by angle
+    return f"assembly:{actuator_angle}"
+
+
+def calc_assembly_dxf(parameters, actuator_angle):
+    """Builds an iris and a DXF of its assembly
+
+    Args:
+        parameters (IrisParameters): Canonical parameters
+        actuator_angle (float): Actuator angle in radians, None for the open iris
+
+    Returns:
+        bytes: Contents of the DXF
+    """
+    return parameters.build_iris().get_assembly_dxf(actuator_angle)
+
+
+def calc_dxf_archive(parameters):
+    """Builds an iris and archives DXFs of its parts
+
+    Args:
+        parameters (IrisParameters): Canonical parameters
+
+    Returns:
+        bytes: Zip archive of DXFs
+    """
+    return parameters.build_iris().get_dxfs_as_zip()
+
+
+def get_saturated_response(error):
+    response = JsonResponse(
+        {"detail": "Server is busy, please retry later"}, status=503
+    )
+    response["Retry-After"] = str(error.retry_after)
+    return response
+
+
+async def run_in_pool(fn, parameters, *args, profile_id=None):
+    """Runs a calculation in the compute pool, adding its solves to the solver metrics and collecting the stages it
+    times if timing is enabled
+
+    Args:
+        fn (callable): fn(parameters, *args), a module level function
+        parameters (IrisParameters): Canonical parameters
+        *args: Further picklable arguments to fn
+        profile_id (str, optional): Identifier to store a profile of the calculation under. Defaults to None, not
+            profiling the calculation.
+
+    Returns:
+        object: Return value of fn
+    """
+    if profile_id is not None:
+        directory = os.fspath(profiling.get_options()["DIRECTORY"])
+        fn = functools.partial(profiling.run_profiled, directory, profile_id, fn)
+
+    timer = get_timer()
+    with stage("compute"):
+        result, stages, telemetry = await compute_pool.run(
+            run_measured, fn, parameters, timer is not None, *args
+        )
+    if timer is not None:
+        timer.merge(stages)
+    metrics.record_solver_telemetry(telemetry)
+    return result
+
+
+def run_measured(fn, parameters, timed, *args):
+    """Runs a calculation in a worker process, collecting its solver telemetry and, if timed, its stages
+
+    Args:
+        fn (callable): fn(parameters, *args)
+        parameters (IrisParameters): Canonical parameters
+        timed (bool): Whether to time stages
+        *args: Further arguments to fn
+
+    Returns:
+        (object, dict, SolverTelemetry): Return value of fn, seconds spent in each stage keyed by stage name or None
+            if not timed, and solver telemetry of the calculation
+    """
+    with collect_stages(timed) as timer, collect_solver_telemetry() as telemetry:
+        result = fn(parameters, *args)
+    return result, None if timer is None else timer.stages, telemetry
+
+
+class MetricsView(View):
+    """Exposes the metrics of this process in the text exposition format, for scraping"""
+
     def get(self, request):
-        print("Recieved DXF Request")
-        iris = Iris(
-            int(request.GET.get("bladeCount")),
-            float(request.GET.get("minDiameter")) / 2,
-            float(request.GET.get("maxDiameter")) / 2,
-            float(request.GET.get("bladeWidth")),
-            float(request.GET.get("pinRadius")),
-            float(request.GET.get("pinClearance")),
+        return HttpResponse(
+            metrics.registry.render(), content_type=metrics.CONTENT_TYPE
         )
 
-        zip = iris.save_dxfs_as_zip()
-        response = HttpResponse(zip, content_type="application/zip")
-        response["Content-Disposition"] = "attachment; filename=name.zip"
-        return response
+
+def finish_request(response, parameters, hit, timer, profile_id=None):
+    """Adds Server-Timing and profile headers to a response and logs the request
+
+    Requests are logged at DEBUG, so that they are only recorded when the iris_calculator.views logger is set to DEBUG.
+
+    Args:
+        response (HttpResponse): Response to the request
+        parameters (IrisParameters): Canonical parameters of the request
+        hit (bool): Whether the response was found in a cache, None if it was not found at all
+        timer (StageTimer): Timer of the request, None if timing is not enabled
+        profile_id (str, optional): Identifier of the profile captured for the request. Defaults to None.
+
+    Returns:
+        HttpResponse: The response
+    """
+    extra = {"parameters": asdict(parameters), "status": response.status_code}
+    if hit is not None:
+        extra["cache"] = "HIT" if hit else "MISS"
+    if profile_id is not None and hit is not None:
+        response[profiling.get_options()["HEADER"]] = profile_id
+        extra["profile"] = profile_id
+    if timer is not None:
+        response["Server-Timing"] = timer.get_server_timing()
+        extra["stages_ms"] = {
+            name: round(seconds * 1e3, 3) for name, seconds in timer.stages.items()
+        }
+    logger.debug("Served iris request", extra=extra)
+    return response
@@ -38,6 +38,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "rest_framework",
+    "iris_calculator",
     "corsheaders",  # TODO: Remove in production
 ]
 
@@ -83,6 +84,78 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Results of /iris requests, keyed on canonical design parameters. Local memory caches evict the least recently
+    # used entries once full. Point this at a cache server to share results between workers.
+    "iris_results": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "iris-results",
+        "TIMEOUT": 60 * 60,
+        "OPTIONS": {"MAX_ENTRIES": 1000},
+    },
+    # Zip archives of DXFs, keyed on canonical design parameters. Archives are around 15 kB, so the entry limit
+    # bounds the cache to roughly 3 MB per process.
+    "dxf_archives": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "dxf-archives",
+        "TIMEOUT": 60 * 60,
+        "OPTIONS": {"MAX_ENTRIES": 200},
+    },
+}
+
+IRIS_RESULT_CACHE = "iris_results"
+IRIS_DXF_CACHE = "dxf_archives"
+
+# Worker processes that iris calculations run in, see iris_calculator.pool.ComputePool. Requests that would exceed
+# MAX_WORKERS running and MAX_QUEUED waiting calculations are answered with 503 and a Retry-After of RETRY_AFTER
+# seconds. A MAX_WORKERS of None starts one worker per CPU.
+IRIS_COMPUTE_POOL = {
+    "MAX_WORKERS": None,
+    "MAX_QUEUED": 8,
+    "RETRY_AFTER": 5,
+}
+
+# Adds a Server-Timing header of calculation stages to /iris/calc and /iris/dxf responses. Stage names and durations
+# describe the internals of the server, so they are only exposed to clients while debugging.
+IRIS_SERVER_TIMING = DEBUG
+
+# Requests to /iris/calc or /iris/dxf carrying the HEADER, holding TOKEN if it is set, are calculated under a profiler
+# while ENABLED. Profiles are stored in DIRECTORY and read with the request_profiles command, see
+# iris_calculator.profiling.
+IRIS_PROFILING = {
+    "ENABLED": False,
+    "HEADER": "X-Iris-Profile",
+    "TOKEN": None,
+    "DIRECTORY": BASE_DIR / "profiles",
+}
+
+# Limits on /iris/batch requests, see iris_calculator.views.BatchView
+IRIS_BATCH = {
+    "MAX_DESIGNS": 100,
+    "MAX_CONCURRENCY": 4,
+}
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "json": {"()": "iris_calculator.log.JSONFormatter"},
+    },
+    "handlers": {
+        "console": {"class": "logging.StreamHandler", "formatter": "json"},
+    },
+    "loggers": {
+        # Set iris_calculator.views to DEBUG to log each request with its cache outcome and stage durations
+        "iris_calculator": {"handlers": ["console"], "level": "INFO"},
+    },
+}
+
 # TODO: Remove in production
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
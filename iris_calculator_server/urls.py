@@ -14,6 +14,7 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+
 from django.contrib import admin
 from django.urls import include, path
 from rest_framework import routers
@@ -24,4 +25,6 @@ urlpatterns = [
     path("api-auth/", include("rest_framework.urls", namespace="rest_framework")),
     path("iris/calc", views.IrisView.as_view()),
     path("iris/dxf", views.DXFView.as_view()),
+    path("iris/batch", views.BatchView.as_view()),
+    path("metrics", views.MetricsView.as_view()),
 ]
@@ -0,0 +1,24 @@
+import os
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "iris_calculator_server.settings")
+django.setup()
+
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+_old_database_name = None
+
+
+def setUpModule():
+    # Tests run against a fresh in-memory database rather than db.sqlite3
+    global _old_database_name
+    setup_test_environment()
+    _old_database_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+
+
+def tearDownModule():
+    connection.creation.destroy_test_db(_old_database_name, verbosity=0)
+    teardown_test_environment()
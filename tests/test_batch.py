@@ -0,0 +1,95 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+from tests.django_setup import setUpModule, tearDownModule
+
+from django.core.cache import caches
+from django.test import RequestFactory
+
+from iris_calculator import views
+from iris_calculator.views import BatchView
+
+
+class TestBatchView(unittest.TestCase):
+    def setUp(self):
+        caches["iris_results"].clear()
+
+    def post(self, body):
+        request = RequestFactory().post(
+            "/iris/batch", body, content_type="application/json"
+        )
+        return asyncio.run(BatchView.as_view()(request))
+
+    def test_batch(self):
+        design = {
+            "bladeCount": 4,
+            "minDiameter": 0.8,
+            "maxDiameter": 2,
+            "bladeWidth": 0.3,
+            "pinRadius": 2,
+            "pinClearance": 0.1,
+        }
+        response = self.post(
+            {
+                "designs": [
+                    design,
+                    # Shares canonical parameters with the first design
+                    {**design, "minDiameter": 0.8000001},
+                    {**design, "bladeWidth": 5},
+                    {"bladeCount": 4},
+                ]
+            }
+        )
+
+        self.assertEqual(response.status_code, 200)
+        results = json.loads(response.content)["results"]
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results[0], results[1])
+        self.assertFalse(results[0]["cached"])
+        self.assertIn("blade_radius", results[0]["result"])
+        self.assertIn("error", results[2])
+        self.assertIn("error", results[3])
+
+    def test_failed_design_answered_with_error(self):
+        design = {
+            "bladeCount": 4,
+            "minDiameter": 0.8,
+            "maxDiameter": 2,
+            "bladeWidth": 0.3,
+            "pinRadius": 2,
+            "pinClearance": 0.1,
+        }
+        get_iris_results = views.get_iris_results
+
+        async def fail_wide_designs(parameters):
+            if parameters.blade_width > 1:
+                raise RuntimeError("Solver crashed")
+            return await get_iris_results(parameters)
+
+        with mock.patch.object(views, "get_iris_results", fail_wide_designs):
+            response = self.post(
+                {
+                    "designs": [
+                        design,
+                        {**design, "bladeCount": 0},
+                        {**design, "bladeCount": -3},
+                        {**design, "minDiameter": "nan"},
+                        {**design, "bladeWidth": 1.5},
+                    ]
+                }
+            )
+
+        self.assertEqual(response.status_code, 200)
+        results = json.loads(response.content)["results"]
+        self.assertIn("result", results[0])
+        for result in results[1:]:
+            self.assertIn("error", result)
+        self.assertIn("blade_count", results[1]["error"])
+        self.assertIn("aperture_inner_radius", results[3]["error"])
+
+    def test_invalid_batch(self):
+        self.assertEqual(self.post({"design": []}).status_code, 400)
+        self.assertEqual(self.post({"designs": {}}).status_code, 400)
+        self.assertEqual(self.post({"designs": [{}] * 101}).status_code, 400)
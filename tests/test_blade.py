@@ -3,7 +3,7 @@ import unittest
 
 import numpy as np
 
-from iris_calculator.blade import Blade
+from iris_calculator.blade import Blade, BladeTrajectories, BladeTrajectory
 
 
 class TestBlade(unittest.TestCase):
@@ -86,3 +86,127 @@ class TestBlade(unittest.TestCase):
         self.assertAlmostEqual(state.A.y, 55.64297094)
         self.assertAlmostEqual(state.B.y, 9.59036212)
         self.assertAlmostEqual(state.C.y, -41.60487944)
+
+    def test_calc_blade_states_batch(self):
+        blade = Blade(0.5, 45, 50.5, 60, 1)
+        independent_states = blade.calc_blade_states(
+            *blade.theta_a_range, solver=Blade.SOLVER_INDEPENDENT
+        )
+        batch_states = blade.calc_blade_states(
+            *blade.theta_a_range, solver=Blade.SOLVER_BATCH
+        )
+
+        self.assertEqual(len(independent_states), len(batch_states))
+        for independent, batch in zip(independent_states, batch_states):
+            self.assertAlmostEqual(independent.theta_a, batch.theta_a)
+            for expected, actual in [
+                (independent.A, batch.A),
+                (independent.B, batch.B),
+                (independent.C, batch.C),
+            ]:
+                self.assertAlmostEqual(expected.x, actual.x, delta=0.00001)
+                self.assertAlmostEqual(expected.y, actual.y, delta=0.00001)
+
+    def test_calc_blade_states_continuation(self):
+        blade = Blade(0, 55, 66, 75, 20)
+        independent_states = blade.calc_blade_states(
+            *blade.theta_a_range, solver=Blade.SOLVER_INDEPENDENT
+        )
+        continuation_states = blade.calc_blade_states(
+            *blade.theta_a_range, solver=Blade.SOLVER_CONTINUATION
+        )
+
+        for independent, continuation in zip(independent_states, continuation_states):
+            self.assertAlmostEqual(independent.A.y, continuation.A.y, delta=0.00001)
+            self.assertAlmostEqual(independent.B.x, continuation.B.x, delta=0.00001)
+            self.assertAlmostEqual(independent.C.x, continuation.C.x, delta=0.00001)
+
+        cold_start_nfev = sum(
+            blade.solve_closed_loop_equations(state.theta_a).nfev
+            for state in independent_states
+        )
+        self.assertLess(blade.sweep_stats.total_nfev, cold_start_nfev / 2)
+
+    def test_closed_loop_jacobian(self):
+        blade = Blade(0, 45, 50.5, 60, 1)
+        step = 1e-6
+        for guess, theta_a in [
+            ((67.5, 141.4 * np.pi / 180, 63.1 * np.pi / 180), 285 * np.pi / 180),
+            ((60.0, 2.4, 1.0), 4.7),
+            ((62.0, 2.0, 0.6), 4.4),
+        ]:
+            guess = np.array(guess)
+            jac = blade.closed_loop_jacobian(guess, theta_a)
+            jac_batch = blade.closed_loop_jacobian_batch(guess[None], [theta_a])[0]
+            d_theta_a = blade.closed_loop_theta_a_derivative_batch(
+                guess[None], [theta_a]
+            )[0]
+
+            for i in range(3):
+                offset = np.zeros(3)
+                offset[i] = step
+                finite_difference = (
+                    np.array(blade.closed_loop_equations(guess + offset, theta_a))
+                    - np.array(blade.closed_loop_equations(guess - offset, theta_a))
+                ) / (2 * step)
+                np.testing.assert_allclose(jac[:, i], finite_difference, atol=1e-6)
+                np.testing.assert_allclose(
+                    jac_batch[:, i], finite_difference, atol=1e-6
+                )
+
+            finite_difference = (
+                np.array(blade.closed_loop_equations(guess, theta_a + step))
+                - np.array(blade.closed_loop_equations(guess, theta_a - step))
+            ) / (2 * step)
+            np.testing.assert_allclose(d_theta_a, finite_difference, atol=1e-6)
+
+    def test_get_AC_derivative(self):
+        blade = Blade(0, 45, 50.5, 60, 1)
+        step = 1e-6
+        # Chords both shorter and longer than the blade diameter
+        for AB in [40, 67.50524683, 120]:
+            self.assertAlmostEqual(
+                blade.get_AC_derivative(AB),
+                (blade.get_AC(AB + step, 2.5) - blade.get_AC(AB - step, 2.5))
+                / (2 * step),
+                delta=1e-6,
+            )
+
+    def test_blade_trajectory(self):
+        blade = Blade(0, 45, 50.5, 60, 1)
+        trajectory = blade.calc_blade_states(*blade.theta_a_range)
+        self.assertEqual(trajectory.points.shape, (len(trajectory), 3, 2))
+
+        angle = 2 * np.pi / 7
+        rotated = trajectory.rotated(angle)
+        for i in [0, len(trajectory) // 2, -1]:
+            expected = trajectory[i].rotated_copy(angle)
+            actual = rotated[i]
+            self.assertAlmostEqual(expected.theta_a, actual.theta_a)
+            for expected_coord, actual_coord in [
+                (expected.A, actual.A),
+                (expected.B, actual.B),
+                (expected.C, actual.C),
+            ]:
+                self.assertAlmostEqual(expected_coord.x, actual_coord.x)
+                self.assertAlmostEqual(expected_coord.y, actual_coord.y)
+
+        rebuilt = BladeTrajectory.from_blade_states(list(rotated))
+        np.testing.assert_array_equal(rebuilt.points, rotated.points)
+        np.testing.assert_array_equal(rebuilt.theta_as, rotated.theta_as)
+
+    def test_blade_trajectories(self):
+        blade = Blade(0, 45, 50.5, 60, 1)
+        trajectory = blade.calc_blade_states(*blade.theta_a_range)
+        trajectories = BladeTrajectories(trajectory, 6, cache_size=2)
+
+        self.assertEqual(len(trajectories), 6)
+        self.assertIs(trajectories[0], trajectory)
+        np.testing.assert_allclose(
+            trajectories[2].points, trajectory.rotated(2 * np.pi / 3).points
+        )
+        self.assertIs(trajectories[2], trajectories[-4])
+        self.assertEqual(len(list(trajectories)), 6)
+        self.assertLessEqual(len(trajectories._cache), 2)
+        with self.assertRaises(IndexError):
+            trajectories[6]
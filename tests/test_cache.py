@@ -0,0 +1,202 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+from tests.django_setup import setUpModule, tearDownModule
+
+from django.core.cache import caches
+from django.test import RequestFactory, override_settings
+
+from iris_calculator import cache
+from iris_calculator.cache import ResultCache, dxf_archives, get_etag, iris_results
+from iris_calculator.models import IrisDesign
+from iris_calculator.parameters import IrisParameters
+from iris_calculator.views import DXFView, IrisView
+
+
+class TestIrisParameters(unittest.TestCase):
+    def test_canonical_parameters(self):
+        parameters = IrisParameters(4, 0.40000001, 1, 0.3, 2, 0.1)
+        self.assertEqual(parameters, IrisParameters(4.0, 0.4, 1.0, 0.3, 2, 0.1))
+        self.assertEqual(
+            parameters.get_hash(), IrisParameters(4, 0.4, 1, 0.3, 2, 0.1).get_hash()
+        )
+        self.assertNotEqual(
+            parameters.get_hash(), IrisParameters(4, 0.41, 1, 0.3, 2, 0.1).get_hash()
+        )
+
+    def test_from_query(self):
+        parameters = IrisParameters.from_query(
+            {
+                "bladeCount": "6",
+                "minDiameter": "20",
+                "maxDiameter": "100",
+                "bladeWidth": "10",
+                "pinRadius": "2",
+                "pinClearance": "0.1",
+            }
+        )
+        self.assertEqual(parameters, IrisParameters(6, 10, 50, 10, 2, 0.1))
+
+    def test_invalid_parameters(self):
+        for arguments in [
+            (0, 0.4, 1, 0.3, 2, 0.1),
+            (-4, 0.4, 1, 0.3, 2, 0.1),
+            (4.5, 0.4, 1, 0.3, 2, 0.1),
+            (4, float("nan"), 1, 0.3, 2, 0.1),
+            (4, 0.4, float("inf"), 0.3, 2, 0.1),
+            (4, 0.4, 1, 0, 2, 0.1),
+            (4, 0.4, 1, 0.3, 2, 0.0001),
+        ]:
+            with self.assertRaises(ValueError):
+                IrisParameters(*arguments)
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        caches["iris_results"].clear()
+        caches["dxf_archives"].clear()
+        IrisDesign.objects.all().delete()
+
+    def test_etag(self):
+        parameters = IrisParameters(4, 0.4, 1, 0.3, 2, 0.1)
+        etag = get_etag(parameters)
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertEqual(etag, get_etag(IrisParameters(4, 0.4, 1, 0.3, 2, 0.1)))
+        self.assertNotEqual(etag, get_etag(parameters, "assembly:0.1"))
+
+        # A change to the calculation changes tags without a new RESULTS_VERSION
+        with mock.patch.object(
+            cache, "get_calculation_fingerprint", return_value="changed"
+        ):
+            self.assertNotEqual(etag, get_etag(parameters))
+
+    def test_get_and_set(self):
+        result_cache = ResultCache("test")
+        parameters = IrisParameters(4, 0.4, 1, 0.3, 2, 0.1)
+
+        self.assertIsNone(result_cache.get(parameters))
+        result_cache.set(parameters, {"value": 1})
+        self.assertEqual(result_cache.get(parameters), {"value": 1})
+        self.assertIsNone(result_cache.get(parameters, "variant"))
+        self.assertEqual(
+            result_cache.get_stats(), {"hits": 1, "misses": 2, "hit_ratio": 1 / 3}
+        )
+
+    @override_settings(IRIS_SERVER_TIMING=True)
+    def test_iris_view(self):
+        iris_results.reset_stats()
+        factory = RequestFactory()
+        query = {
+            "bladeCount": 4,
+            "minDiameter": 0.8,
+            "maxDiameter": 2,
+            "bladeWidth": 0.3,
+            "pinRadius": 2,
+            "pinClearance": 0.1,
+        }
+        first = asyncio.run(IrisView.as_view()(factory.get("/iris/calc", query)))
+        # Differs from the first request by less than the rounding of parameters
+        query["minDiameter"] = 0.8000001
+        second = asyncio.run(IrisView.as_view()(factory.get("/iris/calc", query)))
+
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(json.loads(first.content), json.loads(second.content))
+        self.assertIn("calc_blade_states;dur=", first["Server-Timing"])
+        self.assertNotIn("compute", second["Server-Timing"])
+        self.assertEqual(iris_results.get_stats()["hits"], 1)
+        # Calculated results are only cached, the design store is left to precompute_designs
+        self.assertEqual(IrisDesign.objects.count(), 0)
+
+    def test_dxf_view(self):
+        dxf_archives.reset_stats()
+        factory = RequestFactory()
+        query = {
+            "bladeCount": 4,
+            "minDiameter": 0.8,
+            "maxDiameter": 2,
+            "bladeWidth": 0.3,
+            "pinRadius": 2,
+            "pinClearance": 0.1,
+        }
+        view = DXFView.as_view()
+        first = asyncio.run(view(factory.get("/iris/dxf", query)))
+        second = asyncio.run(view(factory.get("/iris/dxf", query)))
+        # Tags are known from the design, so clients holding it are answered without the archive
+        caches["dxf_archives"].clear()
+        not_modified = asyncio.run(
+            view(factory.get("/iris/dxf", query, HTTP_IF_NONE_MATCH=first["ETag"]))
+        )
+
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(first["ETag"], second["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified["ETag"], first["ETag"])
+        self.assertEqual(not_modified.content, b"")
+        self.assertEqual(dxf_archives.get_stats()["hits"], 1)
+        self.assertEqual(dxf_archives.get_stats()["misses"], 1)
+
+    def test_assembly_dxf_view(self):
+        dxf_archives.reset_stats()
+        factory = RequestFactory()
+        query = {
+            "bladeCount": 4,
+            "minDiameter": 0.8,
+            "maxDiameter": 2,
+            "bladeWidth": 0.3,
+            "pinRadius": 2,
+            "pinClearance": 0.1,
+            "mode": "assembly",
+            "actuatorAngle": 0.1,
+        }
+        view = DXFView.as_view()
+        first = asyncio.run(view(factory.get("/iris/dxf", query)))
+        second = asyncio.run(view(factory.get("/iris/dxf", query)))
+        other_angle = asyncio.run(
+            view(factory.get("/iris/dxf", {**query, "actuatorAngle": 0.2}))
+        )
+        parts = asyncio.run(view(factory.get("/iris/dxf", {**query, "mode": "parts"})))
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first["Content-Type"], "application/dxf")
+        self.assertIn(b"INSERT", first.content)
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(other_angle["X-Cache"], "MISS")
+        self.assertNotEqual(other_angle["ETag"], first["ETag"])
+        self.assertNotEqual(parts["ETag"], first["ETag"])
+        self.assertEqual(parts["Content-Type"], "application/zip")
+        self.assertEqual(parts["X-Cache"], "MISS")
+
+        for invalid in ({"mode": "exploded"}, {"actuatorAngle": "nan"}):
+            response = asyncio.run(view(factory.get("/iris/dxf", {**query, **invalid})))
+            self.assertEqual(response.status_code, 400)
+
+    def test_invalid_requests(self):
+        factory = RequestFactory()
+        query = {
+            "bladeCount": 4,
+            "minDiameter": 0.8,
+            "maxDiameter": 2,
+            "bladeWidth": 0.3,
+            "pinRadius": 2,
+            "pinClearance": 0.1,
+        }
+        missing = {name: value for name, value in query.items() if name != "pinRadius"}
+        for view_class, path in ((IrisView, "/iris/calc"), (DXFView, "/iris/dxf")):
+            view = view_class.as_view()
+            for invalid, message in (
+                (missing, "Invalid design parameters"),
+                ({**query, "minDiameter": -3}, "aperture_inner_radius"),
+                # Valid parameters whose aperture is beyond the reach of the blade
+                ({**query, "bladeWidth": 5}, "beyond the reach of the blade"),
+            ):
+                response = asyncio.run(view(factory.get(path, invalid)))
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response["Content-Type"], "application/json")
+                self.assertIn(message, json.loads(response.content)["error"])
@@ -66,3 +66,60 @@ class TestGeometry(unittest.TestCase):
         )
         self.assertAlmostEqual(coord.x, 17.67829657, delta=0.00001)
         self.assertAlmostEqual(coord.y, -44.43898377, delta=0.00001)
+
+    def test_get_circle_center_zero_length_chord(self):
+        # Coincident points give the center a radius along +y, or -y if convex to the left
+        coord = geometry.get_circle_center(Coordinate(1, 2), Coordinate(1, 2), 3)
+        self.assertAlmostEqual(coord.x, 1)
+        self.assertAlmostEqual(coord.y, 5)
+
+        centers = geometry.get_circle_center_batch(
+            [[1, 2], [0, 0]], [[1, 2], [2, 0]], 3, convex_right=False
+        )
+        self.assertTrue(np.all(np.isfinite(centers)))
+        np.testing.assert_allclose(centers[0], [1, -1])
+        np.testing.assert_allclose(centers[1], [1, -np.sqrt(8)])
+
+    def test_batch_kernels_match_scalar(self):
+        rng = np.random.default_rng(0)
+        a, b, c = rng.uniform(-50, 50, (3, 20, 2))
+        thetas = rng.uniform(0, 2 * np.pi, 20)
+
+        centers, radii = geometry.get_circle_batch(a, b, c)
+        circle_centers = geometry.get_circle_center_batch(a, b, 60)
+        chord_coords = geometry.get_chord_coord_batch(a, c, thetas, 60)
+        rotated = geometry.rotate_batch(a, thetas)
+        midpoint_normals = geometry.midpoint_normal_batch(a, b, thetas)
+
+        for i in range(len(a)):
+            a_i, b_i, c_i = [Coordinate(*point[i]) for point in (a, b, c)]
+            center, radius = geometry.get_circle(a_i, b_i, c_i)
+            expected = [
+                (center, centers[i]),
+                (geometry.get_circle_center(a_i, b_i, 60), circle_centers[i]),
+                (geometry.get_chord_coord(a_i, c_i, thetas[i], 60), chord_coords[i]),
+                (a_i.rotated_copy(thetas[i]), rotated[i]),
+                (a_i.midpoint_normal(b_i, thetas[i]), midpoint_normals[i]),
+            ]
+            self.assertAlmostEqual(radius, radii[i])
+            for coord, point in expected:
+                self.assertAlmostEqual(coord.x, point[0])
+                self.assertAlmostEqual(coord.y, point[1])
+
+    def test_coordinate_fast_paths(self):
+        self.assertFalse(hasattr(Coordinate(1, 2), "__dict__"))
+
+        angle = 1.2
+        rotated = Coordinate(1, 2).rotate_cos_sin(np.cos(angle), np.sin(angle))
+        expected = Coordinate(1, 2).rotate(angle)
+        self.assertAlmostEqual(rotated.x, expected.x)
+        self.assertAlmostEqual(rotated.y, expected.y)
+
+        # Coordinates are shared between shapes, so augmented assignment leaves the original untouched
+        coord = Coordinate(1, 2)
+        same = coord
+        coord += Coordinate(0.5, 1)
+        coord -= Coordinate(1, 0.5)
+        self.assertIsNot(coord, same)
+        self.assertEqual(coord, Coordinate(0.5, 2.5))
+        self.assertEqual(same, Coordinate(1, 2))
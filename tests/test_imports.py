@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+import unittest
+
+_HEAVY_PACKAGES = ("matplotlib", "scipy", "ezdxf")
+
+
+def _import_times(statement):
+    """Runs a statement in a fresh interpreter with -X importtime
+
+    Returns:
+        dict: Cumulative import time in microseconds for each imported module
+    """
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE="iris_calculator_server.settings")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env=env,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+class TestImports(unittest.TestCase):
+    # Generous budget in seconds, the heavy packages alone take over a second to import
+    _IMPORT_TIME_BUDGET = 0.8
+
+    def assertNoHeavyImports(self, times):
+        heavy = [module for module in times if module.split(".")[0] in _HEAVY_PACKAGES]
+        self.assertEqual(heavy, [])
+
+    def test_iris_import_is_light(self):
+        times = _import_times("import iris_calculator.iris")
+        self.assertNoHeavyImports(times)
+        self.assertLess(times["iris_calculator.iris"] / 1e6, self._IMPORT_TIME_BUDGET)
+
+    def test_urls_import_is_light(self):
+        times = _import_times(
+            "import django; django.setup(); import iris_calculator_server.urls"
+        )
+        self.assertNoHeavyImports(times)
+        self.assertNotIn("numpy", times)
@@ -1,9 +1,15 @@
+import io
+import os
+import tempfile
 import unittest
+import zipfile
 from dataclasses import dataclass
 
+import matplotlib.pyplot as plt
 import numpy as np
 
 from iris_calculator.iris import Iris
+from iris_calculator.renderer import IrisRenderer
 
 
 @dataclass
@@ -49,3 +55,61 @@ class TestIris(unittest.TestCase):
                 delta=(params.outerRadius + params.bladeWidth)
                 * self._PERMISSIBLE_ERROR,
             )
+
+    def test_construction_creates_no_figures(self):
+        figures = plt.get_fignums()
+        iris = Iris(4, 0.8, 1, 0.3, 2, 0.1)
+        self.assertEqual(plt.get_fignums(), figures)
+        self.assertFalse(hasattr(iris, "fig"))
+
+        renderer = IrisRenderer(iris)
+        renderer.open_figure()
+        self.assertEqual(len(plt.get_fignums()), len(figures) + 1)
+        renderer.close_figure()
+        self.assertEqual(plt.get_fignums(), figures)
+
+    def test_dxfs_as_zip_in_memory(self):
+        iris = Iris(4, 0.8, 1, 0.3, 2, 0.1)
+        with tempfile.TemporaryDirectory() as directory:
+            cwd = os.getcwd()
+            os.chdir(directory)
+            try:
+                archive = iris.get_dxfs_as_zip()
+                self.assertEqual(os.listdir(directory), [])
+            finally:
+                os.chdir(cwd)
+
+        with zipfile.ZipFile(io.BytesIO(archive)) as zip_file:
+            self.assertEqual(
+                sorted(zip_file.namelist()),
+                ["actuatorRing.dxf", "basePlate.dxf", "blade.dxf"],
+            )
+            for name in zip_file.namelist():
+                self.assertIn(b"ENTITIES", zip_file.read(name))
+
+    def test_assembly_dxf(self):
+        import ezdxf
+
+        iris = Iris(6, 5, 25, 5, 1.5, 0.5)
+        actuator_angle = np.mean(iris.get_actuator_rotation_range())
+        doc = ezdxf.read(io.StringIO(iris.get_assembly_dxf(actuator_angle).decode()))
+
+        self.assertEqual(len(doc.audit().errors), 0)
+        inserts = doc.modelspace().query("INSERT")
+        self.assertEqual(len(inserts), 6)
+        self.assertEqual({insert.dxf.name for insert in inserts}, {"blade"})
+        for i, insert in enumerate(inserts):
+            self.assertAlmostEqual(insert.dxf.rotation, 60 * i)
+        self.assertEqual(
+            {entity.dxf.layer for entity in doc.modelspace()},
+            {"blade", "basePlate", "actuatorRing"},
+        )
+        self.assertEqual(
+            {entity.dxf.layer for entity in doc.blocks.get("blade")}, {"blade"}
+        )
+
+    def test_aperture_beyond_blade_reach(self):
+        # Both ends of the domain clamp to the same theta_a, leaving the blade nothing to rotate through
+        for use_canonical_kinematics in (True, False):
+            with self.assertRaisesRegex(ValueError, "beyond the reach of the blade"):
+                Iris(5, 15, 32.5, 200, 3.5, 1, use_canonical_kinematics)
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from iris_calculator.blade import Blade
+from iris_calculator.iris import Iris
+from iris_calculator.kinematics import KinematicsTable, get_canonical_table
+
+
+class TestKinematicsTable(unittest.TestCase):
+    def test_table_matches_nested_solve(self):
+        for args in [(4, 0.8, 1, 0.3), (24, 5, 200, 10)]:
+            tabulated = Iris(*args, 2, 0.1)
+            nested = Iris(*args, 2, 0.1, use_canonical_kinematics=False)
+
+            for expected, actual in zip(
+                nested.blades[0].theta_a_range, tabulated.blades[0].theta_a_range
+            ):
+                self.assertAlmostEqual(expected, actual, delta=1e-6)
+            for expected, actual in zip(
+                nested.blades[0].Bx_range, tabulated.blades[0].Bx_range
+            ):
+                self.assertAlmostEqual(expected, actual, delta=1e-6 * args[2])
+
+            for expected, actual in zip(
+                nested.blade_states[0], tabulated.blade_states[0]
+            ):
+                self.assertAlmostEqual(expected.A.x, actual.A.x, delta=1e-6 * args[2])
+                self.assertAlmostEqual(expected.A.y, actual.A.y, delta=1e-6 * args[2])
+                self.assertAlmostEqual(expected.B.x, actual.B.x, delta=1e-5 * args[2])
+                self.assertAlmostEqual(expected.B.y, actual.B.y, delta=1e-5 * args[2])
+
+    def test_table_is_scale_invariant(self):
+        small = Blade(0, 1, 1.2, 1.3, 0.1)
+        large = Blade(0, 150, 180, 195, 15)
+        small_table = KinematicsTable.from_blade(small, 101)
+        large_table = KinematicsTable.from_blade(large, 101)
+
+        np.testing.assert_allclose(
+            small_table.solutions, large_table.solutions, atol=1e-7
+        )
+        np.testing.assert_allclose(small_table.Bx, large_table.Bx, atol=1e-7)
+
+    def test_save_and_load(self):
+        table = get_canonical_table(0.96, 1.07)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.npz")
+            table.save(path)
+            loaded = KinematicsTable.load(path)
+
+        self.assertTrue(loaded.matches(0.96, 1.07))
+        np.testing.assert_array_equal(table.solutions, loaded.solutions)
+        np.testing.assert_array_equal(table.Bx, loaded.Bx)
+
+    def test_mismatched_table_rejected(self):
+        with self.assertRaises(ValueError):
+            Blade(0, 1, 1.2, 1.3, 0.1, kinematics=get_canonical_table(0.96, 1.07))
+
+    def test_calc_theta_a_inverts_calc_Bx(self):
+        blades = [
+            Blade(0, 45, 50.5, 60, 1),
+            Blade(0, 10, 9.6, 10.7, 1, kinematics=get_canonical_table(0.96, 1.07)),
+        ]
+        for blade in blades:
+            theta_a_range = blade.theta_a_range
+            for theta_a in np.linspace(*theta_a_range, 7)[1:-1]:
+                Bx = abs(blade.calc_Bx(theta_a))
+                self.assertAlmostEqual(blade.calc_theta_a(Bx), theta_a, delta=1e-6)
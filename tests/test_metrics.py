@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import unittest
+
+from tests.django_setup import setUpModule as setUpDjango
+from tests.django_setup import tearDownModule as tearDownDjango
+
+from django.core.cache import caches
+from django.test import RequestFactory
+
+from iris_calculator import metrics
+from iris_calculator.kinematics import get_canonical_table
+from iris_calculator.models import IrisDesign
+from iris_calculator.parameters import IrisParameters
+from iris_calculator.pool import compute_pool
+from iris_calculator.views import (
+    IrisView,
+    MetricsView,
+    calc_iris_results,
+    run_measured,
+)
+
+
+def setUpModule():
+    setUpDjango()
+
+
+def tearDownModule():
+    compute_pool.shutdown()
+    tearDownDjango()
+
+
+class TestMetrics(unittest.TestCase):
+    def test_counter_is_thread_safe(self):
+        counter = metrics.Counter("test_total", "Test", ("kind",))
+
+        def increment():
+            for _ in range(1000):
+                counter.inc(kind="a")
+
+        threads = [threading.Thread(target=increment) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertIn('test_total{kind="a"} 8000', counter.render())
+
+        with self.assertRaises(ValueError):
+            counter.inc(other="a")
+
+    def test_histogram(self):
+        histogram = metrics.Histogram("test_seconds", "Test", buckets=(0.1, 1))
+        for value in [0.05, 0.1, 0.5, 2]:
+            histogram.observe(value)
+        lines = histogram.render().splitlines()
+        self.assertIn('test_seconds_bucket{le="0.1"} 2', lines)
+        self.assertIn('test_seconds_bucket{le="1"} 3', lines)
+        self.assertIn('test_seconds_bucket{le="+Inf"} 4', lines)
+        self.assertIn("test_seconds_sum 2.65", lines)
+        self.assertIn("test_seconds_count 4", lines)
+
+    def test_solver_telemetry_returned_from_workers(self):
+        # The canonical table is built within the calculation, so its solves are collected
+        get_canonical_table.cache_clear()
+        _, stages, telemetry = run_measured(
+            calc_iris_results, IrisParameters(4, 0.4, 1, 0.3, 2, 0.1), False
+        )
+        self.assertIsNone(stages)
+        self.assertGreater(telemetry.solvers["batch_least_squares"].nfev, 0)
+
+        before = metrics.solver_evaluations.get_samples()
+        metrics.record_solver_telemetry(telemetry)
+        self.assertNotEqual(metrics.solver_evaluations.get_samples(), before)
+
+    def test_view(self):
+        caches["iris_results"].clear()
+        IrisDesign.objects.all().delete()
+        query = {
+            "bladeCount": 5,
+            "minDiameter": 10,
+            "maxDiameter": 50,
+            "bladeWidth": 5,
+            "pinRadius": 1.5,
+            "pinClearance": 0.5,
+        }
+        factory = RequestFactory()
+        for _ in range(2):
+            asyncio.run(IrisView.as_view()(factory.get("/iris/calc", query)))
+
+        response = MetricsView.as_view()(factory.get("/metrics"))
+        self.assertEqual(response["Content-Type"], metrics.CONTENT_TYPE)
+        body = response.content.decode()
+        self.assertIn('iris_request_duration_seconds_bucket{view="IrisView",le=', body)
+        self.assertIn('iris_requests_total{view="IrisView",status="200"}', body)
+        self.assertIn('iris_requests_in_flight{view="IrisView"} 0', body)
+        self.assertIn('iris_cache_hit_ratio{cache="iris"}', body)
+        self.assertIn('iris_process_memory_bytes{kind="resident"}', body)
@@ -0,0 +1,72 @@
+import unittest
+
+from tests.django_setup import setUpModule, tearDownModule
+
+from django.core.management import call_command
+
+from iris_calculator.models import IrisDesign
+from iris_calculator.parameters import RESULTS_VERSION, IrisParameters
+
+
+class TestIrisDesign(unittest.TestCase):
+    def setUp(self):
+        IrisDesign.objects.all().delete()
+
+    def test_get_or_compute(self):
+        parameters = IrisParameters(4, 0.4, 1, 0.3, 2, 0.1)
+        computed = []
+
+        def compute(parameters):
+            computed.append(parameters)
+            return {"value": 1}
+
+        for _ in range(2):
+            self.assertEqual(
+                IrisDesign.objects.get_or_compute_results(parameters, compute),
+                {"value": 1},
+            )
+            self.assertEqual(
+                IrisDesign.objects.get_or_compute_dxf_archive(
+                    parameters, lambda parameters: b"archive"
+                ),
+                b"archive",
+            )
+        self.assertEqual(len(computed), 1)
+
+        design = IrisDesign.objects.get(parameter_hash=parameters.get_hash())
+        self.assertEqual(design.blade_count, 4)
+        self.assertEqual(design.results, {"value": 1})
+        self.assertEqual(bytes(design.dxf_archive), b"archive")
+
+    def test_earlier_versions_ignored(self):
+        parameters = IrisParameters(4, 0.4, 1, 0.3, 2, 0.1)
+        IrisDesign.objects.set_results(parameters, {"value": 1})
+        IrisDesign.objects.set_dxf_archive(parameters, b"archive")
+        IrisDesign.objects.update(results_version=RESULTS_VERSION - 1)
+
+        self.assertIsNone(IrisDesign.objects.get_results(parameters))
+        self.assertIsNone(IrisDesign.objects.get_dxf_archive(parameters))
+
+        # Storing results replaces the stale design, archive included
+        IrisDesign.objects.set_results(parameters, {"value": 2})
+        self.assertEqual(IrisDesign.objects.get_results(parameters), {"value": 2})
+        self.assertIsNone(IrisDesign.objects.get_dxf_archive(parameters))
+        self.assertEqual(IrisDesign.objects.count(), 1)
+
+    def test_precompute_designs(self):
+        call_command(
+            "precompute_designs",
+            "--blade-counts",
+            "4",
+            "6",
+            "--max-diameters",
+            "50",
+            "--min-diameter-ratios",
+            "0.2",
+            "--dxf",
+            verbosity=0,
+        )
+        self.assertEqual(IrisDesign.objects.count(), 2)
+        for design in IrisDesign.objects.all():
+            self.assertIn("blade_radius", design.results)
+            self.assertTrue(bytes(design.dxf_archive).startswith(b"PK"))
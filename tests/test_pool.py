@@ -0,0 +1,98 @@
+import asyncio
+import os
+import time
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+
+from tests.django_setup import setUpModule as setUpDjango
+from tests.django_setup import tearDownModule as tearDownDjango
+
+from django.core.cache import caches
+from django.test import RequestFactory, override_settings
+
+from iris_calculator.pool import ComputePool, PoolSaturated, compute_pool
+from iris_calculator.views import IrisView
+
+
+def setUpModule():
+    setUpDjango()
+
+
+def tearDownModule():
+    compute_pool.shutdown()
+    tearDownDjango()
+
+
+class TestComputePool(unittest.TestCase):
+    def setUp(self):
+        pool_settings = override_settings(
+            IRIS_COMPUTE_POOL={"MAX_WORKERS": 1, "MAX_QUEUED": 1, "RETRY_AFTER": 3}
+        )
+        pool_settings.enable()
+        self.addCleanup(pool_settings.disable)
+
+    def test_run(self):
+        pool = ComputePool()
+        try:
+            self.assertEqual(asyncio.run(pool.run(max, 1, 2)), 2)
+            self.assertEqual(pool.in_flight, 0)
+        finally:
+            pool.shutdown()
+
+    def test_dead_worker_replaced(self):
+        pool = ComputePool()
+        try:
+            with self.assertRaises(BrokenProcessPool):
+                asyncio.run(pool.run(os._exit, 1))
+            # The next computation starts a new pool rather than failing on the broken one
+            self.assertEqual(asyncio.run(pool.run(max, 1, 2)), 2)
+            self.assertEqual(pool.in_flight, 0)
+        finally:
+            pool.shutdown()
+
+    def test_saturated(self):
+        pool = ComputePool()
+
+        async def run():
+            running = [
+                asyncio.ensure_future(pool.run(time.sleep, 0.5)) for _ in range(2)
+            ]
+            # Let both computations be submitted before a third is attempted
+            await asyncio.sleep(0)
+            with self.assertRaises(PoolSaturated) as context:
+                await pool.run(time.sleep, 0)
+            await asyncio.gather(*running)
+            return context.exception
+
+        try:
+            self.assertEqual(asyncio.run(run()).retry_after, 3)
+            self.assertEqual(pool.in_flight, 0)
+        finally:
+            pool.shutdown()
+
+    def test_saturated_view(self):
+        caches["iris_results"].clear()
+        query = {
+            "bladeCount": 5,
+            "minDiameter": 10,
+            "maxDiameter": 50,
+            "bladeWidth": 5,
+            "pinRadius": 1.5,
+            "pinClearance": 0.5,
+        }
+
+        async def run():
+            running = [
+                asyncio.ensure_future(compute_pool.run(time.sleep, 0.5))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            response = await IrisView.as_view()(
+                RequestFactory().get("/iris/calc", query)
+            )
+            await asyncio.gather(*running)
+            return response
+
+        response = asyncio.run(run())
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "3")
@@ -0,0 +1,100 @@
+import asyncio
+import io
+import tempfile
+import unittest
+
+from tests.django_setup import setUpModule as setUpDjango
+from tests.django_setup import tearDownModule as tearDownDjango
+
+from django.core.management import call_command
+from django.test import RequestFactory, override_settings
+
+from iris_calculator import profiling
+from iris_calculator.parameters import IrisParameters
+from iris_calculator.pool import compute_pool
+from iris_calculator.views import DXFView, IrisView
+
+
+def setUpModule():
+    setUpDjango()
+
+
+def tearDownModule():
+    compute_pool.shutdown()
+    tearDownDjango()
+
+
+class TestProfiling(unittest.TestCase):
+    _QUERY = {
+        "bladeCount": 5,
+        "minDiameter": 10,
+        "maxDiameter": 50,
+        "bladeWidth": 5,
+        "pinRadius": 1.5,
+        "pinClearance": 0.5,
+    }
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        profiling_settings = override_settings(
+            IRIS_PROFILING={
+                "ENABLED": True,
+                "TOKEN": "secret",
+                "DIRECTORY": self.directory,
+            }
+        )
+        profiling_settings.enable()
+        self.addCleanup(profiling_settings.disable)
+        self.factory = RequestFactory()
+
+    def get(self, view, path, **headers):
+        return asyncio.run(
+            view.as_view()(self.factory.get(path, self._QUERY, headers=headers))
+        )
+
+    def test_profiled_requests(self):
+        response = self.get(IrisView, "/iris/calc", **{"X-Iris-Profile": "secret"})
+        self.assertEqual(response.status_code, 200)
+        profile_id = response["X-Iris-Profile"]
+        response = self.get(DXFView, "/iris/dxf", **{"X-Iris-Profile": "secret"})
+        self.assertEqual(response.status_code, 200)
+
+        profiles = profiling.list_profiles(self.directory)
+        self.assertEqual(
+            [profile["function"] for profile in profiles],
+            ["calc_iris_results", "calc_dxf_archive"],
+        )
+        self.assertEqual(profiles[0]["id"], profile_id)
+        self.assertEqual(profiles[0]["parameters"]["aperture_outer_radius"], 25)
+
+        hot_spots = profiling.get_hot_spots(self.directory, profile_id, limit=5)
+        self.assertEqual(len(hot_spots), 5)
+        self.assertGreaterEqual(hot_spots[0]["tottime"], hot_spots[-1]["tottime"])
+
+        stdout = io.StringIO()
+        call_command("request_profiles", profile_id, "--limit", "3", stdout=stdout)
+        self.assertEqual(len(stdout.getvalue().splitlines()), 4)
+        stdout = io.StringIO()
+        call_command("request_profiles", stdout=stdout)
+        self.assertIn(profile_id, stdout.getvalue())
+
+    def test_profiles_listed_oldest_first(self):
+        parameters = IrisParameters(4, 0.4, 1, 0.3, 2, 0.1)
+        # Identifiers that sort in the opposite order to the profiles being taken
+        for profile_id in ["b", "a"]:
+            profiling.run_profiled(self.directory, profile_id, str, parameters)
+        self.assertEqual(
+            [profile["id"] for profile in profiling.list_profiles(self.directory)],
+            ["b", "a"],
+        )
+
+    def test_unprofiled_requests(self):
+        for headers in [{}, {"X-Iris-Profile": "wrong"}]:
+            response = self.get(IrisView, "/iris/calc", **headers)
+            self.assertFalse(response.has_header("X-Iris-Profile"))
+        with override_settings(IRIS_PROFILING={"DIRECTORY": self.directory}):
+            response = self.get(IrisView, "/iris/calc", **{"X-Iris-Profile": "1"})
+            self.assertFalse(response.has_header("X-Iris-Profile"))
+        self.assertEqual(profiling.list_profiles(self.directory), [])
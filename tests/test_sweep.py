@@ -0,0 +1,133 @@
+import csv
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from iris_calculator.parameters import IrisParameters
+from iris_calculator.sweep import (
+    PARAMETER_COLUMNS,
+    Sweep,
+    evaluate_design,
+    get_grid_samples,
+    get_latin_hypercube_samples,
+)
+
+
+class TestSweep(unittest.TestCase):
+    def test_grid_samples(self):
+        samples = get_grid_samples(
+            {
+                "blade_count": [4, 6],
+                "aperture_inner_radius": [0.4],
+                "aperture_outer_radius": [1, 1.0000001],
+                "blade_width": [0.3, 0.4, 0.5],
+                "peg_radius": [2],
+                "peg_clearance": [0.1],
+            }
+        )
+        # Outer radii that round to the same design are swept once
+        self.assertEqual(len(samples), 6)
+        self.assertIn(IrisParameters(6, 0.4, 1, 0.5, 2, 0.1), samples)
+
+    def test_latin_hypercube_samples(self):
+        bounds = {
+            "blade_count": (3, 24),
+            "aperture_inner_radius": (0.4, 0.6),
+            "aperture_outer_radius": (1, 2),
+            "blade_width": (0.3, 0.3),
+            "peg_radius": (2, 3),
+            "peg_clearance": (0.1, 0.2),
+        }
+        samples = get_latin_hypercube_samples(bounds, 50, seed=0)
+        self.assertEqual(len(samples), 50)
+        self.assertEqual(samples, get_latin_hypercube_samples(bounds, 50, seed=0))
+        for sample in samples:
+            for name in PARAMETER_COLUMNS:
+                lower, upper = bounds[name]
+                self.assertGreaterEqual(getattr(sample, name), lower)
+                self.assertLessEqual(getattr(sample, name), upper)
+
+        # Each tenth of a parameter's range holds a tenth of the samples
+        peg_radii = np.array([sample.peg_radius for sample in samples])
+        counts = np.histogram(peg_radii, bins=10, range=(2, 3))[0]
+        np.testing.assert_array_equal(counts, 5)
+
+    def test_invalid_samples(self):
+        bounds = {
+            "blade_count": (3, 24),
+            "aperture_inner_radius": (0.4, 0.6),
+            "aperture_outer_radius": (1, 2),
+            "blade_width": (0.3, 0.3),
+            "peg_radius": (2, 3),
+            "peg_clearance": (0.1, 0.2),
+        }
+        for invalid in (
+            {"blade_count": (0, 24)},
+            {"peg_radius": (3, 2)},
+            {"peg_clearance": (0.1, float("inf"))},
+        ):
+            with self.assertRaises(ValueError):
+                get_latin_hypercube_samples({**bounds, **invalid}, 10, seed=0)
+
+        values = {name: [lower] for name, (lower, _) in bounds.items()}
+        for invalid in ({"blade_width": []}, {"peg_radius": [-1]}):
+            with self.assertRaises(ValueError):
+                get_grid_samples({**values, **invalid})
+        del values["peg_clearance"]
+        with self.assertRaises(ValueError):
+            get_grid_samples(values)
+
+    def test_evaluate_design(self):
+        row = evaluate_design(IrisParameters(4, 0.4, 1, 0.3, 2, 0.1))
+        self.assertFalse(row["failed"])
+        self.assertAlmostEqual(row["pinned_radius"], 1.6)
+
+        row = evaluate_design(IrisParameters(4, 0.4, 1, 5, 2, 0.1))
+        self.assertTrue(row["failed"])
+        self.assertTrue(np.isnan(row["pinned_radius"]))
+
+        # Any error calculating a design is recorded against it, not raised
+        with mock.patch.object(
+            IrisParameters, "build_iris", side_effect=IndexError("blade state")
+        ):
+            row = evaluate_design(IrisParameters(4, 0.4, 1, 0.3, 2, 0.1))
+        self.assertTrue(row["failed"])
+        self.assertEqual(row["error"], "IndexError: blade state")
+
+    def test_resume(self):
+        samples = [
+            IrisParameters(4, 0.4, 1, 0.3, 2, 0.1),
+            IrisParameters(6, 0.4, 1, 0.3, 2, 0.1),
+            IrisParameters(4, 0.4, 1, 5, 2, 0.1),
+        ]
+        evaluated = []
+
+        def evaluate(parameters):
+            evaluated.append(parameters)
+            return evaluate_design(parameters)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sweep.csv")
+            Sweep(samples[:2], path, max_workers=1, evaluate=evaluate).run()
+            rows = Sweep(samples, path, max_workers=1, evaluate=evaluate).run()
+            with open(path, newline="") as file:
+                written = list(csv.DictReader(file))
+
+            npz_path = os.path.join(directory, "sweep.npz")
+            Sweep(
+                samples,
+                npz_path,
+                checkpoint_path=path + Sweep._CHECKPOINT_SUFFIX,
+                max_workers=1,
+                evaluate=evaluate,
+            ).run()
+            with np.load(npz_path) as table:
+                np.testing.assert_array_equal(table["blade_count"], [4, 6, 4])
+                np.testing.assert_array_equal(table["failed"], [False, False, True])
+
+        self.assertEqual(evaluated, samples)
+        self.assertEqual([row["blade_count"] for row in rows], [4, 6, 4])
+        self.assertEqual([row["failed"] for row in written], ["False", "False", "True"])
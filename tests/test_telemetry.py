@@ -0,0 +1,53 @@
+import unittest
+
+import numpy as np
+
+from iris_calculator.blade import Blade
+from iris_calculator.iris import Iris
+from iris_calculator.parameters import IrisParameters
+from iris_calculator.sweep import evaluate_solved_design
+from iris_calculator.telemetry import SolverTelemetry
+
+
+class TestSolverTelemetry(unittest.TestCase):
+    def test_solves_recorded(self):
+        blade = Blade(0, 45, 50.5, 60, 1)
+        blade.solver_telemetry = SolverTelemetry()
+        result = blade.solve_closed_loop_equations(blade.theta_a_range[0])
+        batch = blade.solve_closed_loop_equations_batch(np.linspace(4.3, 5.1, 5))
+
+        stats = blade.solver_telemetry.solvers["least_squares"]
+        self.assertEqual(stats.calls, 1)
+        self.assertEqual(stats.nfev, result.nfev)
+        self.assertEqual(stats.statuses[result.status], 1)
+        stats = blade.solver_telemetry.solvers["batch_least_squares"]
+        self.assertEqual(stats.problems, 5)
+        self.assertEqual(stats.nfev, np.sum(batch.nfev))
+
+    def test_inf_fallbacks_counted(self):
+        blade = Blade(0, 45, 50.5, 60, 1)
+        blade.solver_telemetry = SolverTelemetry()
+        # AB far longer than the rest of the loop leaves the angle at point B undefined
+        guess = (1e3, np.pi / 2, 0)
+        self.assertEqual(blade.closed_loop_equations(guess, 4.5)[2], np.inf)
+        blade.closed_loop_equations_batch(
+            np.array([guess, guess]), np.array([4.5, 4.6])
+        )
+        self.assertEqual(blade.solver_telemetry.inf_fallbacks, 3)
+
+    def test_aggregated_per_iris(self):
+        solved = Iris(6, 5, 25, 5, 1.5, 0.5, use_canonical_kinematics=False)
+        telemetry = solved.get_solver_telemetry()
+        self.assertEqual(
+            telemetry.nfev,
+            sum(blade.solver_telemetry.nfev for blade in solved.blades),
+        )
+        self.assertIn("batch_least_squares", telemetry.as_dict()["solvers"])
+
+        # Canonical kinematics are rescaled rather than solved
+        self.assertEqual(Iris(6, 5, 25, 5, 1.5, 0.5).get_solver_telemetry().nfev, 0)
+
+    def test_sweep_records_telemetry(self):
+        row = evaluate_solved_design(IrisParameters(4, 0.4, 1, 0.3, 2, 0.1))
+        self.assertFalse(row["failed"])
+        self.assertGreater(row["solver_nfev"], 0)
@@ -0,0 +1,51 @@
+import json
+import logging
+import unittest
+
+from iris_calculator.iris import Iris
+from iris_calculator.log import JSONFormatter
+from iris_calculator.timing import collect_stages, get_timer, stage
+
+
+class TestTiming(unittest.TestCase):
+    def test_disabled(self):
+        self.assertIsNone(get_timer())
+        with stage("unused"):
+            pass
+        with collect_stages(enabled=False) as timer:
+            self.assertIsNone(timer)
+            self.assertIsNone(get_timer())
+
+    def test_collect_stages(self):
+        # Built beforehand, as the first build of the canonical table times blade stages outside of "blades"
+        Iris(4, 0.8, 1, 0.3, 2, 0.1)
+        with collect_stages() as timer:
+            Iris(4, 0.8, 1, 0.3, 2, 0.1)
+            with stage("blades"):
+                pass
+        self.assertIsNone(get_timer())
+
+        header = timer.get_server_timing()
+        for name in [
+            "calc_Bx_range",
+            "blades",
+            "set_theta_a_domain",
+            "calc_blade_states",
+            "base_plate",
+            "actuator_ring",
+        ]:
+            self.assertIn(f"{name};dur=", header)
+        # Stages entered by other stages are counted within them
+        self.assertLess(timer.stages["calc_Bx_range"], timer.stages["blades"])
+
+
+class TestJSONFormatter(unittest.TestCase):
+    def test_format(self):
+        record = logging.makeLogRecord(
+            {"name": "iris", "levelname": "INFO", "msg": "Served %s", "args": ("iris",)}
+        )
+        record.cache = "HIT"
+        fields = json.loads(JSONFormatter().format(record))
+        self.assertEqual(fields["message"], "Served iris")
+        self.assertEqual(fields["cache"], "HIT")
+        self.assertNotIn("args", fields)